@@ -0,0 +1,68 @@
+# Benchmark: adaptive inference cadence vs full inference on every frame.
+# Reports the share of inferred vs predicted frames, per-frame cost, and how
+# often the per-frame gesture on the adaptive run agrees with full inference
+# (overall and on predicted frames only).
+#
+#   python -m benchmarks.adaptive_cadence recording.mp4 --max-skip 3
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.inference_scale import load_frames
+from hand_detection.detector import HandDetector
+from hand_detection.gesture_classifier import GestureClassifier
+
+def run(frames, detector, fps):
+    classifier = GestureClassifier()
+    latencies, landmarks, gestures, predicted = [], [], [], []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        _, hands = detector.find_hands(frame, draw=False, timestamp=index / fps)
+        latencies.append(time.perf_counter() - start)
+        predicted.append(detector.last_predicted)
+        if hands:
+            landmarks.append(hands.landmarks[0])
+            gestures.append(classifier.recognize(hands.pixel_list(0)))
+        else:
+            landmarks.append(None)
+            gestures.append(None)
+    return np.array(latencies) * 1000, landmarks, gestures, np.array(predicted)
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive inference cadence benchmark")
+    parser.add_argument("video", help="Recorded clip with hands in view")
+    parser.add_argument("--max-frames", type=int, default=300)
+    parser.add_argument("--max-skip", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.max_frames)
+    fps = cv2.VideoCapture(args.video).get(cv2.CAP_PROP_FPS) or 30.0
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}, {fps:.1f} FPS")
+
+    full = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5)
+    adaptive = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5,
+                            adaptive_cadence=True, max_skip=args.max_skip, target_fps=fps)
+    full_lat, full_lm, full_gestures, _ = run(frames, full, fps)
+    ad_lat, ad_lm, ad_gestures, predicted = run(frames, adaptive, fps)
+
+    agree = np.array([a == b for a, b in zip(ad_gestures, full_gestures)])
+    errors = [np.linalg.norm((lm[:, :2] - ref[:, :2]) * (width, height), axis=1).mean()
+              for lm, ref, p in zip(ad_lm, full_lm, predicted)
+              if p and lm is not None and ref is not None]
+
+    print(f"Inferred: {adaptive.inferred_frames} ({(~predicted).mean() * 100:.1f}%), "
+          f"predicted: {adaptive.predicted_frames} ({predicted.mean() * 100:.1f}%)")
+    print(f"Per-frame cost: full {full_lat.mean():.2f}ms, adaptive {ad_lat.mean():.2f}ms "
+          f"({full_lat.mean() / ad_lat.mean():.2f}x)")
+    print(f"Gesture agreement with full inference: {agree.mean() * 100:.1f}% overall, "
+          f"{agree[predicted].mean() * 100 if predicted.any() else float('nan'):.1f}% on predicted frames")
+    if errors:
+        print(f"Landmark error on predicted frames: {np.mean(errors):.2f}px mean, "
+              f"{np.percentile(errors, 95):.2f}px p95")
+
+if __name__ == "__main__":
+    main()
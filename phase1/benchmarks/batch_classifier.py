@@ -0,0 +1,60 @@
+# Microbenchmark: scalar GestureClassifier.recognize (one hand at a time) vs
+# the vectorized recognize_batch bitmask/lookup-table path at 1, 100 and 1M
+# hands. Checks that both paths return the same gestures. Needs only NumPy.
+#
+#   python -m benchmarks.batch_classifier --sizes 1 100 1000000
+
+import argparse
+import time
+
+import numpy as np
+
+from hand_detection.gesture_classifier import GestureClassifier
+
+def make_hands(count, rng, width=1280, height=720):
+    """(count, 21, 2) int32 pixel landmarks: random hands with each finger randomly up or down"""
+    hands = np.empty((count, 21, 2), dtype=np.int32)
+    hands[..., 0] = rng.integers(0, width, (count, 21))
+    hands[..., 1] = rng.integers(0, height, (count, 21))
+    return hands
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch gesture classifier microbenchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1_000_000])
+    parser.add_argument("--scalar-limit", type=int, default=100_000,
+                        help="Time the scalar path on at most this many hands and extrapolate")
+    args = parser.parse_args()
+
+    classifier = GestureClassifier()
+    rng = np.random.default_rng(0)
+
+    print(f"{'hands':>9} {'scalar ms':>11} {'batch ms':>10} {'speedup':>8} {'us/hand batch':>14}  match")
+    for size in args.sizes:
+        hands = make_hands(size, rng)
+        repeat = 5 if size < 10_000 else 1
+
+        scalar_count = min(size, args.scalar_limit)
+        # Scalar callers get lists of (x, y) tuples, like extract_landmarks returns
+        lm_lists = [[tuple(point) for point in hand] for hand in hands[:scalar_count].tolist()]
+        scalar_time, scalar = best_time(lambda: [classifier.recognize(lm) for lm in lm_lists], repeat)
+        scalar_time *= size / scalar_count
+
+        batch_time, batch = best_time(lambda: classifier.recognize_batch(hands), repeat)
+
+        match = all(batch[:scalar_count] == np.array(scalar, dtype=object))
+        estimate = "*" if scalar_count < size else " "
+        print(f"{size:>9} {scalar_time * 1000:>10.3f}{estimate} {batch_time * 1000:>10.3f} "
+              f"{scalar_time / batch_time:>7.1f}x {batch_time / size * 1e6:>14.3f}  {match}")
+
+    print("* scalar time extrapolated from --scalar-limit hands")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Benchmark: legacy solutions graph vs Tasks HandLandmarker (VIDEO and
+# LIVE_STREAM) on the same clip. Reports how long find_hands blocks the
+# caller, loop throughput, how many inference results came back, and for
+# LIVE_STREAM how old the returned result is.
+#
+#   python -m benchmarks.detector_backends recording.mp4 --model models/hand_landmarker.task
+#   python -m benchmarks.detector_backends recording.mp4 --pace 30   # feed at camera rate
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.inference_scale import load_frames
+from hand_detection.backends import DEFAULT_MODEL_PATH
+from hand_detection.detector import HandDetector
+
+MODES = (("solutions", "video"), ("tasks", "video"), ("tasks", "live_stream"))
+
+def run(frames, detector, pace):
+    latencies, lags, detected = [], [], 0
+    frame_interval = 1.0 / pace if pace else 0.0
+    start = time.perf_counter()
+    for i, frame in enumerate(frames):
+        if pace:
+            # Wait for the frame's capture time, like a camera would deliver it
+            delay = start + i * frame_interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        now = time.perf_counter()
+        _, hands = detector.find_hands(frame, draw=False, timestamp=now)
+        latencies.append(time.perf_counter() - now)
+        detected += bool(hands)
+        if detector.is_async and detector.hands.latest_timestamp_ms >= 0:
+            lags.append(int(now * 1000) - detector.hands.latest_timestamp_ms)
+
+    if detector.is_async:
+        # Let in-flight results land before counting them
+        time.sleep(0.2)
+    elapsed = time.perf_counter() - start
+    return {
+        "latencies": np.array(latencies) * 1000,
+        "fps": len(frames) / elapsed,
+        "results": detector.hands.results_received,
+        "result_fps": detector.hands.results_received / elapsed,
+        "detected": detected / len(frames) * 100,
+        "lag_ms": float(np.mean(lags)) if lags else None,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Detector backend benchmark")
+    parser.add_argument("video", help="Recorded clip with hands in view")
+    parser.add_argument("--max-frames", type=int, default=300)
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH, help="HandLandmarker .task file")
+    parser.add_argument("--pace", type=float, default=0, help="Feed frames at this FPS (0 = as fast as possible)")
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.max_frames)
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}, "
+          f"{'paced at ' + str(args.pace) + ' FPS' if args.pace else 'unpaced'}")
+
+    print(f"{'backend':<20} {'mean ms':>8} {'p95 ms':>8} {'loop fps':>9} {'results':>8} "
+          f"{'res fps':>8} {'detect %':>9} {'lag ms':>7}")
+    for backend, running_mode in MODES:
+        name = backend if backend == "solutions" else f"tasks/{running_mode}"
+        try:
+            detector = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5, mirror_pixels=False,
+                                    backend=backend, model_path=args.model, running_mode=running_mode)
+        except (FileNotFoundError, ImportError, AttributeError) as e:
+            print(f"{name:<20} skipped: {e}")
+            continue
+        try:
+            stats = run(frames, detector, args.pace)
+        finally:
+            detector.close()
+
+        lat = stats["latencies"]
+        lag = "-" if stats["lag_ms"] is None else f"{stats['lag_ms']:.1f}"
+        print(f"{name:<20} {lat.mean():>8.2f} {np.percentile(lat, 95):>8.2f} {stats['fps']:>9.1f} "
+              f"{stats['results']:>8} {stats['result_fps']:>8.1f} {stats['detected']:>9.1f} {lag:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Benchmark: what showing a frame costs the camera loop. Before, the loop
+# drew the status, text and controls overlay at capture resolution, resized
+# and called imshow itself; now it submits the frame to the DisplayThread,
+# which resizes first and draws at window resolution. Measures the loop-side
+# cost of both, and the display thread's own per-frame cost. imshow is
+# stubbed out (no GUI here), so the numbers are the drawing/resizing only.
+# Needs only OpenCV/NumPy.
+#
+#   python -m benchmarks.display_thread --frames 300 --window 900x700
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from display.adaptive_window import AdaptiveDisplayWindow
+from display.display_thread import DisplayThread
+from main_laptop_cam import FrameAnnotations, draw_gesture_status, frame_layout
+
+STATUS = (np.array([1, 2]), np.array(["open_palm", "fist"], dtype=object), np.array([0.6, 1.0]),
+          np.array([False, True]))
+INFO = ("FPS: 29.8 | Disp: 60 | Zoom: 1.0x", "Cap: 30.0 | Drop: 0% | Age: 2ms")
+
+def stub_gui(window_size):
+    """No display here: window calls do nothing, the window reports window_size"""
+    for name in ("namedWindow", "resizeWindow", "setMouseCallback", "imshow", "destroyWindow"):
+        setattr(cv2, name, lambda *args, **kwargs: None)
+    cv2.getWindowImageRect = lambda *args: (0, 0) + window_size
+    cv2.waitKey = lambda delay: time.sleep(delay / 1000) or -1
+
+def draw_overlays(frame, annotations, window):
+    """The per-frame overlays of main_laptop_cam (status, spoken text, FPS lines), landmarks aside"""
+    layout = frame_layout(frame.shape[1], frame.shape[0], annotations.status_rows)
+    draw_gesture_status(frame, *annotations.status)
+    cv2.putText(frame, f": {annotations.detected_text}", (layout.margin_x, layout.detected_y),
+                cv2.FONT_HERSHEY_SIMPLEX, layout.detected_scale, (255, 255, 0), layout.detected_thickness)
+    for text, y in zip(annotations.info, layout.info_y):
+        cv2.putText(frame, text, (layout.info_x, y), cv2.FONT_HERSHEY_SIMPLEX, layout.info_scale,
+                    annotations.info_color, 1)
+
+def old_loop_ms(window, frames, annotations):
+    """Draw at capture resolution, add the controls, resize and show - all on the camera loop"""
+    total = 0.0
+    for frame in frames:
+        frame = frame.copy()
+        start = time.perf_counter()
+        draw_overlays(frame, annotations, window)
+        window.add_window_controls_overlay(frame)
+        display_width, display_height = window.get_display_size(frame.shape)
+        display_frame = cv2.resize(frame, (display_width, display_height),
+                                   interpolation=cv2.INTER_AREA if display_width < frame.shape[1] else cv2.INTER_LINEAR)
+        cv2.imshow(window.window_name, display_frame)
+        total += time.perf_counter() - start
+    return total / len(frames) * 1000
+
+def threaded_loop_ms(display, frames, annotations, capture_fps):
+    """Only submit() on the camera loop, paced like a camera so the display thread keeps up"""
+    total = 0.0
+    for frame in frames:
+        start = time.perf_counter()
+        display.submit(frame, annotations)
+        total += time.perf_counter() - start
+        time.sleep(1.0 / capture_fps)
+    return total / len(frames) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Camera-loop cost of showing a frame, inline vs display thread")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--window", default="900x700", help="window size WxH the frame is shown at")
+    parser.add_argument("--capture-fps", type=float, default=30.0)
+    args = parser.parse_args()
+    window_size = tuple(int(v) for v in args.window.split("x"))
+    stub_gui(window_size)
+
+    rng = np.random.default_rng(0)
+    annotations = FrameAnnotations(None, STATUS, "Hello! Stop please!", INFO, (0, 255, 0), 2)
+    print(f"window {window_size[0]}x{window_size[1]}")
+    print(f"{'capture':<11} {'inline ms':>10} {'submit ms':>10} {'display ms':>11} {'shown':>8}")
+    for width, height in ((640, 360), (1280, 720), (1920, 1080)):
+        frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+        frames = frames * (args.frames // len(frames))
+        inline_ms = old_loop_ms(AdaptiveDisplayWindow("inline"), frames, annotations)
+
+        display = DisplayThread("threaded", render=draw_overlays, refresh_rate=60.0).start()
+        submit_ms = threaded_loop_ms(display, frames, annotations, args.capture_fps)
+        display.stop()
+        print(f"{width}x{height:<6} {inline_ms:>10.2f} {submit_ms:>10.2f} {display.render_time * 1000:>11.2f} "
+              f"{display.frames_shown:>4}/{display.frames_submitted}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark: streaming DTW cost per frame for 10, 50 and 100 motion
+# gesture templates, on a long synthetic landmark stream of waves, swipes
+# and circles at random tempos separated by rests. Per-frame cost should
+# not depend on stream length, so the first and last stretches are compared.
+# Also reports how many performed gestures were recognized. Needs only NumPy.
+#
+#   python -m benchmarks.dynamic_gestures --frames 6000 --templates 10 50 100
+
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+
+from hand_detection.dynamic_gestures import GESTURE_PATHS, DynamicGestureRecognizer, default_templates
+from hand_detection.landmark_history import LandmarkHistory
+
+def synthetic_stream(frames, fps, rng, hand_size=0.1, aspect_ratio=16 / 9):
+    """((frames, 1, 21, 3) landmarks, timestamps, performed labels)"""
+    hand = rng.normal(0, 0.02, (21, 3)).astype(np.float32)
+    hand[0] = 0.0
+    hand[9] = (0.0, -hand_size, 0.0)
+
+    positions, labels = [], []
+    while len(positions) < frames:
+        positions.extend([positions[-1] if positions else np.zeros(2)] * int(rng.integers(10, 30)))
+        label, path, duration, flip = GESTURE_PATHS[rng.integers(len(GESTURE_PATHS))]
+        tempo = rng.uniform(0.6, 1.6)
+        t = np.linspace(0, 1, round(duration / tempo * fps) + 1)
+        positions.extend(positions[-1] + (path(t) - path(t[:1])) * flip)
+        labels.append(label)
+
+    positions = np.array(positions[:frames])
+    positions -= positions.mean(axis=0)
+    landmarks = np.repeat(hand[None, None], frames, axis=0)
+    landmarks[:, 0, :, 0] += 0.5 + (positions[:, None, 0] * hand_size / aspect_ratio)
+    landmarks[:, 0, :, 1] += 0.5 + positions[:, None, 1] * hand_size
+    landmarks[..., :2] += rng.normal(0, 0.002, landmarks[..., :2].shape).astype(np.float32)
+    return landmarks, np.arange(frames) / fps, labels
+
+def run(recognizer, landmarks, timestamps):
+    history = LandmarkHistory(60, max_hands=1)
+    times = np.empty(len(landmarks))
+    events = []
+    for i, (frame, timestamp) in enumerate(zip(landmarks, timestamps)):
+        history.append(frame, timestamp)
+        start = time.perf_counter()
+        event = recognizer.update(history)
+        times[i] = time.perf_counter() - start
+        if event:
+            events.append(event)
+    return times * 1e6, events
+
+def main():
+    parser = argparse.ArgumentParser(description="Dynamic gesture DTW benchmark")
+    parser.add_argument("--frames", type=int, default=6000)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--templates", type=int, nargs="+", default=[10, 50, 100])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    landmarks, timestamps, performed = synthetic_stream(args.frames, args.fps, rng)
+    print(f"{args.frames} frames ({args.frames / args.fps:.0f}s at {args.fps} FPS), {len(performed)} gestures performed")
+
+    recognizer = DynamicGestureRecognizer()
+    _, events = run(recognizer, landmarks, timestamps)
+    matched = sum((Counter(events) & Counter(performed)).values())
+    print(f"Default templates ({len(recognizer.labels)}): {len(events)} events, "
+          f"{matched} matching a performed gesture of the same kind\n")
+
+    stretch = max(args.frames // 10, 1)
+    print(f"{'templates':>9} {'mean us':>8} {'p99 us':>8} {'first us':>9} {'last us':>8}")
+    for count in args.templates:
+        tempos = np.linspace(0.5, 2.0, -(-count // len(GESTURE_PATHS)))
+        recognizer = DynamicGestureRecognizer(default_templates(args.fps, tempos)[:count])
+        times, _ = run(recognizer, landmarks, timestamps)
+        print(f"{count:>9} {times.mean():>8.1f} {np.percentile(times, 99):>8.1f} "
+              f"{times[:stretch].mean():>9.1f} {times[-stretch:].mean():>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# Replay benchmark: commit latency and false triggers of GestureDebouncer vs
+# the old double hold timer (classifier hold 1 s + speech hold 1 s), on
+# per-frame gesture labels replayed at their recorded timestamps.
+#
+# Without arguments a synthetic session is replayed: gestures held 1-3 s
+# with single-frame flicker, noisy transitions and no-hand gaps. Recorded
+# clips (process_video.py results) are replayed with LABEL=path, meaning
+# the clip shows LABEL whenever a hand is in view. Fails (exit code 1) if
+# the default debouncer's median commit latency is not under --target or
+# it triggers falsely. Needs only NumPy.
+#
+#   python -m benchmarks.gesture_debouncer
+#   python -m benchmarks.gesture_debouncer FIST=fist_results.npz OPEN_HAND=open_results.npz
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from config.gesture_map import GESTURE_FINGER_PATTERNS
+from hand_detection.gesture_classifier import GestureClassifier, hands_present
+from hand_detection.gesture_debouncer import GestureCommitted, GestureDebouncer
+from offline.results_io import load_results
+from offline.training import parse_dataset_arg
+
+def synthetic_session(seconds, fps, rng, flicker=0.05):
+    """(labels, confidences, truth, timestamps); truth is None outside held gestures"""
+    gestures = list(GESTURE_FINGER_PATTERNS)
+    labels, confidences, truth = [], [], []
+    while len(labels) < seconds * fps:
+        # No hand, then a short noisy transition into the pose
+        gap = int(rng.integers(0, fps))
+        labels += [None] * gap
+        confidences += [0.0] * gap
+        truth += [None] * gap
+        transition = int(rng.integers(2, fps // 4))
+        labels += rng.choice(gestures + [None, "UNKNOWN"], transition).tolist()
+        confidences += rng.uniform(0, 0.5, transition).tolist()
+        truth += [None] * transition
+
+        gesture = gestures[rng.integers(len(gestures))]
+        held = int(rng.uniform(1, 3) * fps)
+        noisy = rng.random(held) < flicker
+        labels += np.where(noisy, rng.choice(gestures + ["UNKNOWN"], held), gesture).tolist()
+        confidences += np.where(noisy, rng.uniform(0, 0.5, held), np.minimum(rng.uniform(0.8, 1.2, held), 1)).tolist()
+        truth += [gesture] * held
+    return labels, np.array(confidences), truth, np.arange(len(labels)) / fps
+
+def recorded_session(dataset_args, frame_shape):
+    """Labels and confidences recomputed from recorded first-hand landmarks, clips back to back"""
+    classifier = GestureClassifier()
+    labels, confidences, truth, timestamps = [], [], [], []
+    offset = 0.0
+    for arg in dataset_args:
+        label, path = parse_dataset_arg(arg)
+        if label is None:
+            raise SystemExit(f"{path}: give the clip's gesture as LABEL=path")
+        results = load_results(path)
+        hands = results["landmarks"][:, 0]
+        visible = ~np.isnan(hands).any(axis=(1, 2))
+        names = np.full(len(hands), None, dtype=object)
+        scores = np.zeros(len(hands))
+        if visible.any():
+            pixels = (hands[visible, :, :2] * np.array(frame_shape[1::-1], dtype=np.float64)).astype(np.int32)
+            found, found_scores = classifier.recognize_batch(pixels, return_confidence=True)
+            present = hands_present(pixels)
+            names[np.flatnonzero(visible)[present]] = found[present]
+            scores[np.flatnonzero(visible)[present]] = found_scores[present]
+        labels += names.tolist()
+        confidences += scores.tolist()
+        truth += np.where(visible, label, None).tolist()
+        timestamps += (results["timestamp"] - results["timestamp"][0] + offset).tolist()
+        offset = timestamps[-1] + 1.0
+        print(f"{path}: {len(hands)} frames, {visible.sum()} with a hand, labeled {label}")
+    return labels, np.array(confidences), truth, np.array(timestamps)
+
+def legacy_commits(labels, timestamps, hold=1.0):
+    """The old loop: GestureClassifier.classify hold, then main()'s speech hold"""
+    commits = []
+    last_gesture, gesture_start = None, 0.0
+    last_spoken, speech_start = None, 0.0
+    for i, (label, t) in enumerate(zip(labels, timestamps)):
+        if label is None:
+            last_spoken, speech_start = None, 0.0
+            continue
+        if label != last_gesture:
+            last_gesture, gesture_start = label, t
+            continue
+        if t - gesture_start < hold or label == "UNKNOWN":
+            continue
+        if label != last_spoken:
+            last_spoken, speech_start = label, t
+        if t - speech_start >= hold:
+            commits.append((i, label))
+            speech_start = t
+    return commits
+
+def debouncer_commits(labels, confidences, timestamps, **options):
+    debouncer = GestureDebouncer(**options)
+    commits = []
+    times = np.empty(len(labels))
+    for i, (label, confidence, t) in enumerate(zip(labels, confidences, timestamps)):
+        start = time.perf_counter()
+        events = debouncer.update([label], t, [confidence])
+        times[i] = time.perf_counter() - start
+        commits += [(i, event.gesture) for event in events if isinstance(event, GestureCommitted)]
+    return commits, times * 1e6
+
+def score(commits, truth, timestamps):
+    """(median latency s, p90 latency s, missed segments, false triggers, segments)"""
+    segments = []
+    for i, label in enumerate(truth):
+        if label is not None and (i == 0 or truth[i - 1] != label):
+            segments.append((label, i))
+    committed_at = {}
+    false_triggers = 0
+    for index, label in commits:
+        if truth[index] != label:
+            false_triggers += 1
+            continue
+        # Latency counts from the start of the segment the commit belongs to
+        segment = max(s for s in range(len(segments)) if segments[s][1] <= index)
+        committed_at.setdefault(segment, index)
+    latencies = [timestamps[index] - timestamps[segments[s][1]] for s, index in committed_at.items()]
+    if not latencies:
+        return float("nan"), float("nan"), len(segments), false_triggers, len(segments)
+    return (float(np.median(latencies)), float(np.percentile(latencies, 90)),
+            len(segments) - len(latencies), false_triggers, len(segments))
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture debouncer replay benchmark")
+    parser.add_argument("datasets", nargs="*", help="LABEL=results.npz|jsonl recorded clips (default: synthetic)")
+    parser.add_argument("--seconds", type=float, default=600, help="Synthetic session length")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--flicker", type=float, default=0.05, help="Synthetic per-frame label error rate")
+    parser.add_argument("--width", type=int, default=1280, help="Frame size the results were recorded at")
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--target", type=float, default=0.5, help="Median commit latency (s) the debouncer must beat")
+    args = parser.parse_args()
+
+    if args.datasets:
+        labels, confidences, truth, timestamps = recorded_session(args.datasets, (args.height, args.width))
+    else:
+        rng = np.random.default_rng(0)
+        labels, confidences, truth, timestamps = synthetic_session(args.seconds, args.fps, rng, args.flicker)
+        print(f"Synthetic session: {timestamps[-1]:.0f}s at {args.fps} FPS, {args.flicker:.0%} flicker")
+
+    runs = [("legacy 1s+1s hold", legacy_commits(labels, timestamps), None)]
+    for name, options in (("debouncer", {}),
+                          ("debouncer no early", {"early_commit_confidence": None}),
+                          ("debouncer window 12", {"window": 12})):
+        commits, times = debouncer_commits(labels, confidences, timestamps, **options)
+        runs.append((name, commits, times))
+
+    print(f"\n{'method':<20} {'commits':>8} {'median s':>9} {'p90 s':>7} {'missed':>7} {'false':>6} {'us/frame':>9}")
+    scores = {}
+    for name, commits, times in runs:
+        median, p90, missed, false_triggers, segments = scores[name] = score(commits, truth, timestamps)
+        cost = f"{times.mean():>9.1f}" if times is not None else f"{'-':>9}"
+        print(f"{name:<20} {len(commits):>8} {median:>9.2f} {p90:>7.2f} {missed:>7} {false_triggers:>6} {cost}")
+    print(f"({segments} gestures performed; latency from gesture start to the first correct commit)")
+
+    # The default debouncer must commit faster than the target and never on the wrong gesture
+    median, _, _, false_triggers, _ = scores["debouncer"]
+    ok = median < args.target and false_triggers == 0
+    print(f"PASS: median commit latency {median:.2f}s < {args.target:.2f}s, no false triggers" if ok else
+          f"FAIL: median commit latency {median:.2f}s (target < {args.target:.2f}s), {false_triggers} false triggers")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Benchmark: HandDetector latency and accuracy at reduced inference scales.
+# Accuracy is measured against the full-resolution (1.0) run on the same
+# frames: landmark error in full-frame pixels, detection agreement and
+# per-frame gesture agreement.
+#
+#   python -m benchmarks.inference_scale recording.mp4 --scales 1.0 0.5 0.33
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from hand_detection.detector import HandDetector
+from hand_detection.gesture_classifier import GestureClassifier
+
+def load_frames(video_path, max_frames):
+    cap = cv2.VideoCapture(video_path)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+def run_scale(frames, scale):
+    """Per-frame latency, first-hand landmarks (or None) and gesture for one scale"""
+    detector = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5, inference_scale=scale)
+    classifier = GestureClassifier()
+    latencies, landmarks, gestures = [], [], []
+
+    for frame in frames:
+        start = time.perf_counter()
+        _, hands = detector.find_hands(frame, draw=False)
+        latencies.append(time.perf_counter() - start)
+
+        if hands:
+            landmarks.append(hands.landmarks[0])
+            gestures.append(classifier.recognize(hands.pixel_list(0)))
+        else:
+            landmarks.append(None)
+            gestures.append(None)
+
+    return np.array(latencies) * 1000, landmarks, gestures
+
+def main():
+    parser = argparse.ArgumentParser(description="Inference scale latency/accuracy benchmark")
+    parser.add_argument("video", help="Recorded clip with hands in view")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 0.5, 0.33])
+    parser.add_argument("--max-frames", type=int, default=300)
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.max_frames)
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}")
+
+    scales = sorted(set(args.scales) | {1.0}, reverse=True)
+    results = {scale: run_scale(frames, scale) for scale in scales}
+    _, ref_landmarks, ref_gestures = results[1.0]
+
+    print(f"{'scale':>6} {'mean ms':>8} {'p95 ms':>8} {'detect %':>9} {'det agree %':>12} "
+          f"{'err px':>7} {'gesture agree %':>16}")
+    for scale in scales:
+        latencies, landmarks, gestures = results[scale]
+        detected = sum(lm is not None for lm in landmarks)
+        det_agree = sum((a is None) == (b is None) for a, b in zip(landmarks, ref_landmarks))
+
+        errors = []
+        gesture_matches = 0
+        both = 0
+        for lm, ref, gesture, ref_gesture in zip(landmarks, ref_landmarks, gestures, ref_gestures):
+            if lm is None or ref is None:
+                continue
+            both += 1
+            diff = (lm[:, :2] - ref[:, :2]) * (width, height)
+            errors.append(np.linalg.norm(diff, axis=1).mean())
+            gesture_matches += gesture == ref_gesture
+
+        err = np.mean(errors) if errors else float("nan")
+        gesture_agree = gesture_matches / both * 100 if both else float("nan")
+        print(f"{scale:>6.2f} {latencies.mean():>8.2f} {np.percentile(latencies, 95):>8.2f} "
+              f"{detected / len(frames) * 100:>9.1f} {det_agree / len(frames) * 100:>12.1f} "
+              f"{err:>7.2f} {gesture_agree:>16.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Benchmark: find_hands(draw=True) drawing overhead. mp.solutions
+# drawing_utils with the default hand styles (a protobuf landmark list, then
+# a cv2.line per connection and two cv2.circle per landmark, per hand) vs
+# LandmarkRenderer at full and skeleton quality. drawing_utils is used when
+# mediapipe is installed; otherwise the same loop is replayed with OpenCV
+# only. Also reports how many pixels differ from drawing_utils' output.
+#
+# The gain depends on the hand count. With one hand at 720p, "full" is only
+# about 1.4x faster than the OpenCV replay (119 -> 83 us), and has measured
+# as little as 1.0x (141 -> 138 us). The skeleton lines are the same
+# rasterization work either way; only the 42 cv2.circle calls are saved.
+# "skeleton", the default quality, is 2.3-3.4x faster with one hand. With
+# 2-4 hands, "full" is 1.8-2.6x faster.
+#
+#   python -m benchmarks.landmark_drawing --frames 300
+
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+
+from hand_detection.landmark_drawing import CHAINS, DOT_RADIUS, WHITE, LandmarkRenderer, dot_colors
+
+def default_styles():
+    """Per-landmark and per-connection (color, thickness) dicts, rebuilt per call like drawing_styles does"""
+    landmark_style = {index: (tuple(int(c) for c in color), -1) for index, color in enumerate(dot_colors())}
+    connection_style = {}
+    for chain, color, thickness, _ in CHAINS:
+        for connection in zip(chain[:-1], chain[1:]):
+            connection_style[connection] = (color, thickness)
+    return landmark_style, connection_style
+
+def normalized_to_pixel(x, y, width, height):
+    """drawing_utils._normalized_to_pixel_coordinates"""
+    def is_valid(value):
+        return (value > 0 or math.isclose(0, value)) and (value < 1 or math.isclose(1, value))
+    if not (is_valid(x) and is_valid(y)):
+        return None
+    return min(math.floor(x * width), width - 1), min(math.floor(y * height), height - 1)
+
+def replayed_draw_landmarks(frame, landmarks):
+    """
+    OpenCV-only replay of drawing_utils.draw_landmarks with the default hand
+    styles, hand by hand. It skips building the protobuf landmark list, so it
+    understates what the mediapipe path costs.
+    """
+    height, width = frame.shape[:2]
+    border = max(DOT_RADIUS + 1, int(DOT_RADIUS * 1.2))
+    for lm_array in landmarks:
+        landmark_style, connection_style = default_styles()
+        points = {}
+        for index, (x, y, _) in enumerate(lm_array.tolist()):
+            point = normalized_to_pixel(x, y, width, height)
+            if point:
+                points[index] = point
+        for (start, end), (color, thickness) in connection_style.items():
+            if start in points and end in points:
+                cv2.line(frame, points[start], points[end], color, thickness)
+        for index, point in points.items():
+            color, thickness = landmark_style[index]
+            cv2.circle(frame, point, border, WHITE, thickness)
+            cv2.circle(frame, point, DOT_RADIUS, color, thickness)
+
+def mediapipe_draw_landmarks():
+    """drawing_utils.draw_landmarks as HandDetector used it, or None without mediapipe"""
+    try:
+        import mediapipe as mp
+        from hand_detection.hand_result import to_landmark_list
+        mp_draw, styles, connections = (mp.solutions.drawing_utils, mp.solutions.drawing_styles,
+                                        mp.solutions.hands.HAND_CONNECTIONS)
+    except (ImportError, AttributeError):
+        return None
+
+    def draw(frame, landmarks):
+        for lm_array in landmarks:
+            mp_draw.draw_landmarks(frame, to_landmark_list(lm_array), connections,
+                                   styles.get_default_hand_landmarks_style(),
+                                   styles.get_default_hand_connections_style())
+    return draw
+
+# An open hand, wrist at the origin, in hand lengths (x right, y down)
+HAND_TEMPLATE = np.array([
+    (0, 0), (-0.25, -0.1), (-0.4, -0.25), (-0.5, -0.4), (-0.6, -0.5),
+    (-0.15, -0.5), (-0.18, -0.7), (-0.2, -0.82), (-0.22, -0.95),
+    (0, -0.52), (0, -0.75), (0, -0.88), (0, -1.0),
+    (0.13, -0.48), (0.15, -0.68), (0.17, -0.8), (0.18, -0.9),
+    (0.25, -0.4), (0.3, -0.55), (0.33, -0.65), (0.36, -0.75),
+])
+
+def random_hands(rng, count):
+    """Template hands, rotated, sized 20-35% of the frame height and placed anywhere, a few crossing the edge"""
+    angles = rng.uniform(-0.6, 0.6, count)
+    rotation = np.stack([np.stack([np.cos(angles), -np.sin(angles)], -1),
+                         np.stack([np.sin(angles), np.cos(angles)], -1)], -2)
+    sizes = rng.uniform(0.2, 0.35, (count, 1, 1))
+    xy = np.einsum("nij,kj->nki", rotation, HAND_TEMPLATE) * sizes * (9 / 16, 1)
+    xy += rng.uniform((0.15, 0.35), (0.85, 1.0), (count, 1, 2)) + rng.normal(0, 0.003, xy.shape)
+    z = rng.normal(0, 0.05, (count, 21, 1))
+    return np.concatenate([xy, z], axis=-1).astype(np.float32)
+
+def per_call_us(draw, frame, hand_sets):
+    total = 0.0
+    for landmarks in hand_sets:
+        canvas = frame.copy()
+        start = time.perf_counter()
+        draw(canvas, landmarks)
+        total += time.perf_counter() - start
+    return total / len(hand_sets) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark drawing cost, drawing_utils vs LandmarkRenderer")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    reference = mediapipe_draw_landmarks()
+    print(f"reference: {'mediapipe drawing_utils' if reference else 'OpenCV replay of drawing_utils (no mediapipe)'}")
+    reference = reference or replayed_draw_landmarks
+    full, skeleton = LandmarkRenderer("full"), LandmarkRenderer("skeleton")
+
+    rng = np.random.default_rng(0)
+    print(f"{'resolution':<12} {'hands':>5} {'ref us':>8} {'full us':>8} {'skel us':>8} {'full x':>7} {'skel x':>7} {'px diff':>8}")
+    for width, height in ((640, 360), (1280, 720), (1920, 1080)):
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for hands in (1, 2, 4):
+            hand_sets = [random_hands(rng, hands) for _ in range(args.frames)]
+            ref_us = per_call_us(reference, frame, hand_sets)
+            full_us = per_call_us(full.draw, frame, hand_sets)
+            skel_us = per_call_us(skeleton.draw, frame, hand_sets)
+            # One hand matches exactly; with more, dots stay on top where hands overlap
+            diff = 0
+            for landmarks in hand_sets[:20]:
+                expected, actual = frame.copy(), frame.copy()
+                reference(expected, landmarks)
+                full.draw(actual, landmarks)
+                diff += np.any(expected != actual, axis=-1).sum()
+            print(f"{width}x{height:<7} {hands:>5} {ref_us:>8.0f} {full_us:>8.0f} {skel_us:>8.0f} "
+                  f"{ref_us / full_us:>6.1f}x {ref_us / skel_us:>6.1f}x {diff / 20:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Benchmark/accuracy report: rule-based finger-state classifier vs the
+# learned k-NN model on the same labeled landmark data (see train_classifier.py).
+# Reports per-gesture accuracy and per-hand latency for one hand at a time
+# and for a batch. Needs only NumPy.
+#
+#   python -m benchmarks.learned_classifier FIST=fist_test.npz OPEN_HAND=open_test.npz --model models/gesture_knn.npy
+
+import argparse
+import time
+
+import numpy as np
+
+from hand_detection.gesture_classifier import GestureClassifier
+from hand_detection.hand_result import HandResult
+from hand_detection.learned_classifier import DEFAULT_MODEL_PATH
+from offline.training import load_labeled_hands
+
+def per_hand_us(fn, count):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / count * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Learned vs rule-based gesture classifier")
+    parser.add_argument("datasets", nargs="+", help="LABEL=results.npz|jsonl, or results file with recorded labels")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--width", type=int, default=1280, help="Frame size the results were recorded at")
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--latency-hands", type=int, default=2000, help="Hands timed one at a time")
+    args = parser.parse_args()
+
+    landmarks, labels = load_labeled_hands(args.datasets)
+    if not len(landmarks):
+        print("No labeled hands found")
+        return
+    frame_shape = (args.height, args.width, 3)
+
+    rules = GestureClassifier()
+    learned = GestureClassifier(model_path=args.model)
+    rule_labels = rules.recognize_batch(landmarks, frame_shape)
+    learned_labels = learned.recognize_batch(landmarks, frame_shape)
+
+    print(f"{'gesture':<12} {'hands':>6} {'rules %':>8} {'learned %':>10}")
+    for name in sorted(set(labels.tolist())):
+        mask = labels == name
+        print(f"{name:<12} {mask.sum():>6} {np.mean(rule_labels[mask] == name) * 100:>8.1f} "
+              f"{np.mean(learned_labels[mask] == name) * 100:>10.1f}")
+    print(f"{'overall':<12} {len(labels):>6} {np.mean(rule_labels == labels) * 100:>8.1f} "
+          f"{np.mean(learned_labels == labels) * 100:>10.1f}")
+
+    # Latency: single hands as the live loop calls recognize, then one batch
+    count = min(args.latency_hands, len(landmarks))
+    result = HandResult.from_handedness(landmarks[:count], [("Right", 1.0)] * count, frame_shape)
+    lm_lists = [result.pixel_list(i) for i in range(count)]
+    print(f"\nPer-hand latency over {count} hands (us):")
+    print(f"{'classifier':<12} {'single':>8} {'batch':>8}")
+    for name, classifier in (("rules", rules), ("learned", learned)):
+        single = per_hand_us(lambda: [classifier.recognize(lm) for lm in lm_lists], count)
+        batch = per_hand_us(lambda: classifier.recognize_batch(landmarks, frame_shape), len(landmarks))
+        print(f"{name:<12} {single:>8.1f} {batch:>8.2f}")
+    print(f"Model: {len(learned.model.prototypes)} prototypes, k={learned.model.k}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark: per-frame cost of the static overlays - the window controls
+# strip and the "Show your hand" prompt - drawn the old way (full-frame copy
+# + addWeighted, text scales recomputed and putText every frame) vs cached
+# sprites blended in place over their ROI only. Also reports the largest
+# per-channel difference between the two: the prompt and the darkened strip
+# match exactly, antialiased text edges on the strip can be 1 level off
+# (putText blends each stroke in 1/256 steps). Needs only OpenCV/NumPy.
+#
+#   python -m benchmarks.overlay --frames 500
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from display.adaptive_window import window_controls_sprite
+from display.overlay import SpriteCache, TextSprite
+from main_laptop_cam import frame_layout
+
+PROMPT = "Show your hand to the camera"
+
+def old_overlay(frame, current_scale=1.0):
+    """main_laptop_cam's prompt and AdaptiveDisplayWindow.add_window_controls_overlay before the sprite cache"""
+    frame_height, frame_width = frame.shape[:2]
+    text_scale = max(0.8, min(2.0, frame_width / 800))
+    cv2.putText(frame, PROMPT, (int(30 * frame_width / 1280), int(50 * frame_height / 720)),
+                cv2.FONT_HERSHEY_SIMPLEX, text_scale, (0, 0, 255), max(2, int(frame_width / 400)))
+
+    overlay = frame.copy()
+    overlay_height = 100
+    overlay_y = frame.shape[0] - overlay_height
+    cv2.rectangle(overlay, (0, overlay_y), (frame.shape[1], frame.shape[0]), (0, 0, 0), -1)
+    frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
+    controls = ["WINDOW CONTROLS:", "Drag corners to resize window", f"Current zoom: {current_scale:.1f}x", "'Q': Quit"]
+    for i, text in enumerate(controls):
+        color = (0, 255, 255) if i == 0 else (200, 200, 200)
+        font_size = 0.5 if i > 0 else 0.6
+        cv2.putText(frame, text, (20, overlay_y + 20 + i * 15), cv2.FONT_HERSHEY_SIMPLEX, font_size, color, 1)
+    return frame
+
+def new_overlay(frame, sprites, current_scale=1.0):
+    frame_height, frame_width = frame.shape[:2]
+    layout = frame_layout(frame_width, frame_height)
+    prompt = sprites.get("prompt", layout, lambda: TextSprite.line(PROMPT, layout.prompt_scale, (0, 0, 255),
+                                                                    layout.prompt_thickness))
+    prompt.draw_text(frame, layout.margin_x, layout.status_y)
+    controls = sprites.get("controls", (frame_width, current_scale),
+                           lambda: window_controls_sprite(frame_width, current_scale))
+    return controls.draw(frame, 0, frame_height - 100)
+
+def per_frame_us(draw, frames):
+    """Mean microseconds per call, cycling through frames (each call gets a fresh copy made outside the timer)"""
+    total = 0.0
+    for frame in frames:
+        frame = frame.copy()
+        start = time.perf_counter()
+        draw(frame)
+        total += time.perf_counter() - start
+    return total / len(frames) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Static overlay cost, full-frame blend vs cached sprites")
+    parser.add_argument("--frames", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'resolution':<12} {'old us':>8} {'cached us':>10} {'speedup':>8} {'max diff':>9}")
+    for width, height in ((640, 360), (1280, 720), (1920, 1080)):
+        frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+        frames = frames * (args.frames // len(frames))
+        sprites = SpriteCache()
+        new_overlay(frames[0].copy(), sprites)  # first frame builds the sprites
+        old_us = per_frame_us(old_overlay, frames)
+        new_us = per_frame_us(lambda frame: new_overlay(frame, sprites), frames)
+        diff = np.abs(old_overlay(frames[0].copy()).astype(np.int16) - new_overlay(frames[0].copy(), sprites)).max()
+        print(f"{width}x{height:<7} {old_us:>8.0f} {new_us:>10.0f} {old_us / new_us:>7.1f}x {diff:>9}")
+    print(f"(sprites built: {sprites.builds} for the last resolution; rebuilt only on resolution/zoom change)")
+
+if __name__ == "__main__":
+    main()
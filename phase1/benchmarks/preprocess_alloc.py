@@ -0,0 +1,106 @@
+# Allocation check and benchmark for the find_hands preprocessing path.
+# Runs the steady-state mirror + downscale + RGB conversion loop under
+# tracemalloc and fails (exit code 1) if any frame-sized buffer is allocated
+# after warm-up. The old cv2.flip/cv2.cvtColor path is timed for comparison.
+# Then the input size changes mid-stream (odd sizes included): buffers must
+# be reallocated on the first frame of a new size only, never after, and
+# the output must match the naive path. Needs only OpenCV and NumPy.
+#
+#   python -m benchmarks.preprocess_alloc --width 1280 --height 720
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from hand_detection.preprocess import FramePreprocessor
+
+def naive_step(frame, scale, size=None):
+    mirrored = cv2.flip(frame, 1)
+    if scale < 1.0:
+        # With size, resize to exactly (width, height) like FramePreprocessor does;
+        # fx/fy alone interpolate with the unrounded scale
+        mirrored = cv2.resize(mirrored, size, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(mirrored, cv2.COLOR_BGR2RGB)
+
+def buffered_step(preprocessor, frame, scale):
+    mirrored = preprocessor.mirror(frame)
+    rgb = preprocessor.to_rgb(mirrored, scale)
+    # ROI crop path uses its own buffer
+    preprocessor.to_rgb(mirrored[100:420, 200:520], name="roi_rgb")
+    return rgb
+
+def measure(step, iterations):
+    """(ms per call, peak traced bytes) for the steady-state loop"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        step()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return elapsed / iterations * 1000, peak
+
+def shape_changes(preprocessor, sizes, scale, frames=5):
+    """(size, reallocations on the first frame, reallocations after it, output matches naive) per size"""
+    results = []
+    for width, height in sizes:
+        frame = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+        before = preprocessor.buffer_allocations
+        rgb = buffered_step(preprocessor, frame, scale)
+        first = preprocessor.buffer_allocations - before
+        for _ in range(frames - 1):
+            rgb = buffered_step(preprocessor, frame, scale)
+        later = preprocessor.buffer_allocations - before - first
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        expected = naive_step(frame, scale, size)
+        results.append(((width, height), first, later, np.array_equal(rgb, expected)))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Preprocessing allocation check")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    frame = np.random.randint(0, 256, (args.height, args.width, 3), dtype=np.uint8)
+    frame_bytes = frame.nbytes
+
+    preprocessor = FramePreprocessor()
+    for _ in range(3):  # warm-up sizes the buffers
+        buffered_step(preprocessor, frame, args.scale)
+    allocations_before = preprocessor.buffer_allocations
+
+    buffered_ms, buffered_peak = measure(lambda: buffered_step(preprocessor, frame, args.scale), args.iterations)
+    naive_ms, naive_peak = measure(lambda: naive_step(frame, args.scale), args.iterations)
+
+    print(f"Frame {args.width}x{args.height} ({frame_bytes / 1e6:.1f} MB), scale {args.scale}")
+    print(f"cv2.flip + cvtColor: {naive_ms:.3f} ms/frame, peak {naive_peak / 1e6:.2f} MB traced")
+    print(f"FramePreprocessor:   {buffered_ms:.3f} ms/frame, peak {buffered_peak / 1e3:.1f} KB traced, "
+          f"{preprocessor.buffer_allocations - allocations_before} buffer reallocations")
+
+    steady = (preprocessor.buffer_allocations == allocations_before
+              and buffered_peak < frame_bytes * args.scale * args.scale / 4)
+    print("PASS: no frame-sized allocations in steady state" if steady else "FAIL: steady-state loop allocates")
+
+    # Resolution changes mid-stream, to odd sizes and back
+    sizes = [(args.width // 2 + 1, args.height // 2 + 1), (args.width - 1, args.height + 1), (args.width, args.height)]
+    changes_ok = True
+    for (width, height), first, later, matches in shape_changes(preprocessor, sizes, args.scale):
+        ok = first > 0 and later == 0 and matches
+        changes_ok &= ok
+        print(f"  {width}x{height}: {first} reallocations on the first frame, {later} after, "
+              f"output {'matches' if matches else 'DIFFERS'}{'' if ok else '  <- FAIL'}")
+    print("PASS: size changes reallocate once and stay correct" if changes_ok else
+          "FAIL: size change not handled (missed, repeated or wrong reallocation)")
+    sys.exit(0 if steady and changes_ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Benchmark: full-frame detection vs ROI tracking mode on the same clip.
+# Reports per-frame latency, the fraction of frames served from the crop,
+# and landmark error / gesture agreement against the full-frame run.
+#
+#   python -m benchmarks.roi_tracking recording.mp4 --refresh 30
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.inference_scale import load_frames
+from hand_detection.detector import HandDetector
+from hand_detection.gesture_classifier import GestureClassifier
+
+def run(frames, detector):
+    classifier = GestureClassifier()
+    latencies, landmarks, gestures = [], [], []
+    for frame in frames:
+        start = time.perf_counter()
+        _, hands = detector.find_hands(frame, draw=False)
+        latencies.append(time.perf_counter() - start)
+        if hands:
+            landmarks.append(hands.landmarks[0])
+            gestures.append(classifier.recognize(hands.pixel_list(0)))
+        else:
+            landmarks.append(None)
+            gestures.append(None)
+    return np.array(latencies) * 1000, landmarks, gestures
+
+def main():
+    parser = argparse.ArgumentParser(description="ROI tracking benchmark")
+    parser.add_argument("video", help="Recorded clip with hands in view")
+    parser.add_argument("--max-frames", type=int, default=300)
+    parser.add_argument("--refresh", type=int, default=30, help="Full-frame detection every N frames")
+    parser.add_argument("--padding", type=float, default=0.5)
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.max_frames)
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}")
+
+    full = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5)
+    roi = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.5, roi_tracking=True,
+                       roi_padding=args.padding, roi_refresh_interval=args.refresh)
+    full_lat, full_lm, full_gestures = run(frames, full)
+    roi_lat, roi_lm, roi_gestures = run(frames, roi)
+
+    errors, matches, both = [], 0, 0
+    for lm, ref, gesture, ref_gesture in zip(roi_lm, full_lm, roi_gestures, full_gestures):
+        if lm is None or ref is None:
+            continue
+        both += 1
+        errors.append(np.linalg.norm((lm[:, :2] - ref[:, :2]) * (width, height), axis=1).mean())
+        matches += gesture == ref_gesture
+
+    print(f"{'mode':<6} {'mean ms':>8} {'p95 ms':>8} {'detect %':>9}")
+    for name, lat, lms in (("full", full_lat, full_lm), ("roi", roi_lat, roi_lm)):
+        detected = sum(lm is not None for lm in lms) / len(frames) * 100
+        print(f"{name:<6} {lat.mean():>8.2f} {np.percentile(lat, 95):>8.2f} {detected:>9.1f}")
+
+    roi_share = roi.roi_frames / max(roi.roi_frames + roi.full_frames, 1) * 100
+    print(f"ROI frames: {roi.roi_frames} ({roi_share:.1f}%), full-frame passes: {roi.full_frames}")
+    if both:
+        print(f"Landmark error vs full frame: {np.mean(errors):.2f}px, "
+              f"gesture agreement: {matches / both * 100:.1f}%")
+    print(f"Speedup: {full_lat.mean() / roi_lat.mean():.2f}x")
+
+if __name__ == "__main__":
+    main()
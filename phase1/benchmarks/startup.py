@@ -0,0 +1,117 @@
+# Benchmark: import times of the heavy modules and time to first processed
+# frame for the old serial startup (with its fixed 2 s sleep), the same
+# steps without the sleep, and ParallelStartup as used by main_laptop_cam.py.
+# Every measurement runs in a fresh interpreter, so module caches do not
+# carry over between runs; time to first frame is measured by the parent
+# from process launch, interpreter startup and imports included. Headless:
+# no window is opened.
+#
+#   python -m benchmarks.startup --source 0 --runs 3
+#   python -m benchmarks.startup --source recording.mp4
+
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+IMPORTS = ("numpy", "cv2", "mediapipe", "pyttsx3", "main_laptop_cam")
+MODES = ("old", "serial", "parallel")
+
+def import_time(module):
+    """Seconds to import module in a fresh interpreter, or None if it fails"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    return float(result.stdout.strip().splitlines()[-1]) if result.returncode == 0 else None
+
+def first_frame_time(mode, source, timeout=60.0):
+    """(seconds from launch to the child's first processed frame, child phase lines)"""
+    launched = time.perf_counter()
+    child = subprocess.Popen([sys.executable, "-m", "benchmarks.startup", "--child", mode, "--source", source],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    first_frame, phases = float("nan"), []
+    for line in child.stdout:
+        if line.startswith("first_frame"):
+            first_frame = time.perf_counter() - launched
+        elif line.startswith("Startup:"):
+            phases.append(line.strip())
+    child.wait(timeout)
+    return first_frame, phases
+
+def child(mode, source):
+    """Start the components the way mode says, process one frame, exit"""
+    from capture.frame_grabber import FrameGrabber
+    from hand_detection.detector import HandDetector
+    from hand_detection.gesture_classifier import GestureClassifier
+    from pipeline.startup import ParallelStartup
+    from tts.tts_worker import TTSWorkerEngine
+
+    startup = ParallelStartup()
+
+    def open_camera():
+        grabber = FrameGrabber(source, width=1280, height=720, fps=30)
+        grabber.start()
+        return grabber
+
+    def create_detector():
+        detector = HandDetector(max_hands=2, detection_conf=0.8, tracking_conf=0.6)
+        if mode == "parallel":
+            detector.warm_up(1280, 720)
+        return detector
+
+    if mode == "parallel":
+        startup.start("camera", open_camera)
+        startup.start("detector", create_detector)
+        startup.start("speech", TTSWorkerEngine)
+        classifier = GestureClassifier()
+        grabber, detector, tts = startup.wait("camera"), startup.wait("detector"), startup.wait("speech")
+    else:
+        grabber = open_camera()
+        startup.mark("camera")
+        detector = create_detector()
+        startup.mark("detector")
+        classifier = GestureClassifier()
+        tts = TTSWorkerEngine()
+        startup.mark("speech")
+        if mode == "old":
+            time.sleep(2)
+            startup.mark("sleep")
+
+    ret, frame, capture_time = grabber.read()
+    _, hands = detector.find_hands(frame, draw=True, timestamp=capture_time)
+    if hands:
+        classifier.recognize_batch(hands.pixels)
+    startup.mark("first frame")
+    print("first_frame", flush=True)
+    startup.report()
+    tts.stop()
+    grabber.release()
+    detector.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--source", default="0", help="Camera index or video file")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.source)
+        return
+
+    print(f"{'import':<18} {'median ms':>10}")
+    for module in IMPORTS:
+        times = [import_time(module) for _ in range(args.runs)]
+        times = [t for t in times if t is not None]
+        print(f"{module:<18} {np.median(times) * 1000 if times else float('nan'):>10.0f}")
+
+    print(f"\n{'startup':<18} {'first frame s':>14}")
+    for mode in MODES:
+        runs = [first_frame_time(mode, args.source) for _ in range(args.runs)]
+        print(f"{mode:<18} {np.nanmedian([t for t, _ in runs]):>14.2f}")
+        for line in runs[-1][1]:
+            print(f"  {line}")
+
+if __name__ == "__main__":
+    main()
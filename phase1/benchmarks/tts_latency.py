@@ -0,0 +1,105 @@
+# Benchmark harness for the speech path without sound hardware: replays a
+# gesture-commit event stream into TTSWorkerEngine at several commit rates
+# and reports speak()-call to audio-start latency percentiles, how many
+# commits were dropped or coalesced, and the CPU time the speech threads of
+# the app process (watchdog, audio player, queue feeders) used.
+#
+# The stream is the debouncer's commits on the synthetic session of
+# benchmarks.gesture_debouncer, time-scaled to each rate. The default "null"
+# backend simulates synthesis time and utterance length, "file" writes the
+# audio to disk, "pyttsx3" speaks for real. Each rate replays in real time.
+#
+#   python -m benchmarks.tts_latency --rates 0.5 1 2 4 --seconds 20
+#   python -m benchmarks.tts_latency --backend null --synth-ms 300 --cache
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.gesture_debouncer import debouncer_commits, synthetic_session
+from config.gesture_map import GESTURE_TO_TEXT
+from tts.speech_cache import SpeechCache
+from tts.tts_worker import TTSWorkerEngine
+
+def commit_stream(seed=0):
+    """(times, phrases) of the debouncer's commits on a 10 minute synthetic session"""
+    labels, confidences, _, timestamps = synthetic_session(600, 30, np.random.default_rng(seed))
+    commits, _ = debouncer_commits(labels, confidences, timestamps)
+    return timestamps[[index for index, _ in commits]], [GESTURE_TO_TEXT[gesture] for _, gesture in commits]
+
+def replay(engine, times, phrases, timeout):
+    """Speak phrases at their times; returns (speak() call seconds, non-replay CPU seconds, wall seconds)"""
+    calls = []
+    cpu, own_cpu = time.process_time(), time.thread_time()
+    start = time.monotonic()
+    for t, text in zip(times, phrases):
+        delay = start + t - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        called = time.perf_counter()
+        engine.speak(text)
+        calls.append(time.perf_counter() - called)
+    # Let the last utterance finish
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and (engine.scheduler.current is not None or engine.scheduler.get_stats()["pending"]):
+        time.sleep(0.01)
+    # Everything but this thread: the speech threads (the worker process itself is not counted)
+    speech_cpu = (time.process_time() - cpu) - (time.thread_time() - own_cpu)
+    return np.array(calls), speech_cpu, time.monotonic() - start
+
+def wait_ready(engine, timeout):
+    start = time.monotonic()
+    while engine.init_time is None and engine.available and time.monotonic() - start < timeout:
+        time.sleep(0.01)
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless TTS latency harness")
+    parser.add_argument("--backend", default="null", choices=("null", "file", "pyttsx3"))
+    parser.add_argument("--synth-ms", type=float, default=50.0, help="Simulated synthesis time (null/file backends)")
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.5, 1.0, 2.0, 4.0], help="Commits per second")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Replay length per rate")
+    parser.add_argument("--cache", action="store_true", help="Also replay through a prewarmed speech cache")
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = {} if args.backend == "pyttsx3" else {"synth_time": args.synth_ms / 1000}
+    times, phrases = commit_stream(args.seed)
+    natural_rate = len(times) / times[-1]
+    print(f"Commit stream: {len(times)} commits, {natural_rate:.2f}/s as recorded; backend {args.backend}")
+
+    setups = [("worker", None)]
+    if args.cache:
+        cache_dir = tempfile.mkdtemp(prefix="speech_cache_")
+        cache = SpeechCache(cache_dir, backend=args.backend, backend_options=options)
+        cache.prewarm(GESTURE_TO_TEXT.values())
+        cache.wait()
+        cache.close()
+        setups.append(("cache", cache_dir))
+
+    print(f"\n{'setup':<7} {'rate/s':>6} {'commits':>8} {'spoken':>7} {'dropped':>8} {'preempt':>8} {'cut':>5} "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'speak us':>9} {'cpu ms/s':>9}")
+    for name, cache_dir in setups:
+        for rate in args.rates:
+            scaled = (times - times[0]) * natural_rate / rate
+            count = int(np.searchsorted(scaled, args.seconds))
+            cache = SpeechCache(cache_dir, backend=args.backend, backend_options=options) if cache_dir else None
+            engine = TTSWorkerEngine(backend=args.backend, backend_options=options, speech_cache=cache,
+                                     history=None)
+            wait_ready(engine, args.timeout)
+            calls, speech_cpu, wall = replay(engine, scaled[:count], phrases[:count], args.timeout)
+            stats = engine.get_stats()
+            first_audio = np.array(engine.first_audio) * 1000
+            engine.stop()
+
+            dropped = (stats["dropped"] + stats["coalesced"]) / max(count, 1)
+            p50, p95, p99 = np.percentile(first_audio, [50, 95, 99]) if len(first_audio) else (np.nan,) * 3
+            print(f"{name:<7} {rate:>6.1f} {count:>8} {stats['spoken']:>7} {dropped:>8.0%} {stats['preempted']:>8} {stats['interrupted']:>5} "
+                  f"{p50:>7.1f} {p95:>7.1f} {p99:>7.1f} {calls.mean() * 1e6:>9.1f} {speech_cpu / wall * 1000:>9.2f}")
+    print("(spoken: played to the end; preempt: interruptions requested; cut: utterances actually cut off)")
+    print("(dropped: commits deduplicated or coalesced away; cpu: app-process speech threads, worker excluded)")
+
+if __name__ == "__main__":
+    main()
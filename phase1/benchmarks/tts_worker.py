@@ -0,0 +1,94 @@
+# Benchmark: time to first audio for a fresh pyttsx3 engine per utterance
+# (what BulletproofTTSEngine does), the persistent TTS worker process, and
+# WAV playback from the speech cache. Speaks every GESTURE_TO_TEXT phrase a
+# few times through the real audio stack, so it needs pyttsx3 with a
+# working driver and sound output. The cache lives in a temporary directory
+# unless --cache-dir is given, so the first run also times a cold prewarm.
+#
+#   python -m benchmarks.tts_worker --rounds 3
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from config.gesture_map import GESTURE_TO_TEXT
+from tts.speech_cache import SpeechCache
+from tts.speech_backends import create_engine
+from tts.speech_scheduler import SpeechScheduler
+from tts.tts_worker import TTSWorkerEngine
+
+def fresh_engine_first_audio(text):
+    """Seconds from the request to audio start when the engine is created for this utterance"""
+    requested = time.monotonic()
+    started = []
+    engine = create_engine()
+    engine.connect('started-utterance', lambda name: started.append(time.monotonic()))
+    engine.say(text)
+    engine.runAndWait()
+    engine.stop()
+    return started[0] - requested if started else float("nan")
+
+def speak_all(engine, phrases, timeout):
+    """Speak phrases one at a time, waiting for each to finish; returns the engine's stats"""
+    start = time.monotonic()
+    while engine.init_time is None and time.monotonic() - start < timeout:
+        time.sleep(0.01)
+    counts = engine.scheduler.counts
+    for text in phrases:
+        done = counts["spoken"] + counts["interrupted"] + counts["failed"] + counts["dropped"]
+        engine.speak(text)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and counts["spoken"] + counts["interrupted"] + counts["failed"] + counts["dropped"] == done:
+            time.sleep(0.005)
+    return engine.get_stats()
+
+def report(name, seconds):
+    ms = np.asarray(seconds) * 1000
+    print(f"{name:<22} {len(ms):>6} {np.nanmean(ms):>9.1f} {np.nanpercentile(ms, 50):>8.1f} "
+          f"{np.nanpercentile(ms, 95):>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS time-to-first-audio benchmark")
+    parser.add_argument("--rounds", type=int, default=3, help="Times each phrase is spoken per method")
+    parser.add_argument("--timeout", type=float, default=15.0, help="Seconds to wait for each utterance")
+    parser.add_argument("--cache-dir", help="Speech cache directory (default: a new temporary one)")
+    args = parser.parse_args()
+
+    phrases = list(GESTURE_TO_TEXT.values()) * args.rounds
+    try:
+        create_engine().stop()
+    except Exception as e:
+        print(f"pyttsx3 is not usable here ({e})")
+        return
+
+    fresh = [fresh_engine_first_audio(text) for text in phrases]
+
+    worker = TTSWorkerEngine(scheduler=SpeechScheduler(dedup_window=0.0))
+    stats = speak_all(worker, phrases, args.timeout)
+    worker_first_audio = list(worker.first_audio)
+    worker.stop()
+
+    cache = SpeechCache(args.cache_dir or tempfile.mkdtemp(prefix="speech_cache_"))
+    start = time.monotonic()
+    cache.prewarm(GESTURE_TO_TEXT.values())
+    cache.wait()
+    prewarm_time = time.monotonic() - start
+    cached = TTSWorkerEngine(speech_cache=cache, scheduler=SpeechScheduler(dedup_window=0.0))
+    speak_all(cached, phrases, args.timeout)
+    cached_first_audio = list(cached.first_audio)
+    player_backend = cached.player.backend
+    cached.stop()
+
+    print(f"\n{'method':<22} {'utter':>6} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    report("fresh engine each", fresh)
+    report("persistent worker", worker_first_audio)
+    report("speech cache", cached_first_audio)
+    print(f"Worker: engine init {stats['init_ms']:.0f} ms (paid once), {stats['restarts']} restarts, "
+          f"{stats['failed']} failed")
+    print(f"Cache: prewarm {prewarm_time * 1000:.0f} ms for {cache.rendered} phrases in {cache.cache_dir}, "
+          f"player backend {player_backend}")
+
+if __name__ == "__main__":
+    main()
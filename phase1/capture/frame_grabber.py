@@ -0,0 +1,205 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+def parse_source(source):
+    """Turn a CLI-style source ("0", "clip.mp4", "http://...") into a VideoCapture argument"""
+    if isinstance(source, str) and source.isdigit():
+        return int(source)
+    return source
+
+
+class FrameGrabber:
+    """
+    Reads frames on a dedicated thread into a small preallocated ring buffer.
+
+    The processing loop only ever receives the newest frame together with its
+    capture timestamp. Frames that are overwritten before anyone read them are
+    counted as dropped, so a slow consumer never builds up latency.
+    """
+
+    def __init__(self, source=0, width=None, height=None, fps=None,
+                 buffer_size=3, pace=None):
+        self.source = parse_source(source)
+        self.is_camera = isinstance(self.source, int)
+        self.is_file = not self.is_camera and "://" not in self.source
+        self.buffer_size = max(3, buffer_size)  # reading + latest + writing
+
+        self.cap = cv2.VideoCapture(self.source)
+        if self.is_camera:
+            if width:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            if height:
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps:
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+            # Keep the driver queue short, newest frames live in our ring
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+
+        # Video files are paced at their native rate by default so they behave
+        # like a live camera (network streams already are); pace=False reads
+        # them as fast as possible
+        self.pace = self.is_file if pace is None else pace
+        # Optional decode rate limit (idle mode); frames are still grabbed at
+        # full rate so the newest one is fresh, but only decoded this often
+        self.max_fps = None
+
+        # Ring buffer state, preallocated at the reported capture size
+        if self.width > 0 and self.height > 0:
+            self._slots = [np.empty((self.height, self.width, 3), np.uint8)
+                           for _ in range(self.buffer_size)]
+        else:
+            self._slots = [None] * self.buffer_size
+        self._timestamps = [0.0] * self.buffer_size
+        self._seqs = [0] * self.buffer_size
+        self._latest = -1
+        self._reading = -1
+        self._last_read_seq = 0
+        self._seq = 0
+
+        self._cond = threading.Condition()
+        self._running = False
+        self._eof = False
+        self._thread = None
+
+        # Metrics
+        self._start_time = 0.0
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.frames_delivered = 0
+        self._age_total = 0.0
+        self._last_age = 0.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    @property
+    def is_finished(self):
+        """True once the source has ended (end of file or device lost)"""
+        return self._eof
+
+    def start(self):
+        """Start the capture thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._start_time = time.time()
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def set_max_fps(self, fps):
+        """Limit how often frames are decoded and delivered (None = every frame)"""
+        self.max_fps = fps
+
+    def _next_write_slot(self, current):
+        """Pick a slot that is neither the latest frame nor being read"""
+        slot = current
+        for _ in range(self.buffer_size):
+            slot = (slot + 1) % self.buffer_size
+            if slot != self._latest and slot != self._reading:
+                return slot
+        return slot
+
+    def _capture_loop(self):
+        frame_interval = 1.0 / self.fps if self.pace and self.fps > 0 else 0.0
+        next_due = time.time()
+        next_decode = 0.0
+        write_slot = 0
+
+        while self._running:
+            if frame_interval:
+                delay = next_due - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                next_due = max(next_due + frame_interval, time.time() - frame_interval)
+
+            if not self.cap.grab():
+                break
+            timestamp = time.time()
+            if self.max_fps:
+                if timestamp < next_decode:
+                    continue
+                next_decode = timestamp + 1.0 / self.max_fps
+
+            # Decode straight into the preallocated slot (reused when sizes match)
+            ret, frame = self.cap.retrieve(self._slots[write_slot])
+            if not ret:
+                break
+
+            with self._cond:
+                self._slots[write_slot] = frame
+                self._seq += 1
+                self._seqs[write_slot] = self._seq
+                self._timestamps[write_slot] = timestamp
+                self.frames_captured += 1
+
+                # Previous newest frame was never handed out - it is dropped now
+                if self._latest >= 0 and self._seqs[self._latest] > self._last_read_seq:
+                    self.frames_dropped += 1
+
+                self._latest = write_slot
+                write_slot = self._next_write_slot(write_slot)
+                self._cond.notify_all()
+
+        with self._cond:
+            self._eof = True
+            self._cond.notify_all()
+
+    def read(self, timeout=1.0):
+        """
+        Return (ret, frame, capture_time) for the newest unread frame.
+
+        The frame is a view into the ring buffer and stays valid until the
+        next call to read(); copy it if it has to outlive that.
+        """
+        with self._cond:
+            deadline = time.time() + timeout
+            while self._latest < 0 or self._seqs[self._latest] <= self._last_read_seq:
+                if self._eof or not self._running:
+                    return False, None, 0.0
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False, None, 0.0
+                self._cond.wait(remaining)
+
+            slot = self._latest
+            self._reading = slot
+            self._last_read_seq = self._seqs[slot]
+            capture_time = self._timestamps[slot]
+            frame = self._slots[slot]
+
+        self.frames_delivered += 1
+        self._last_age = time.time() - capture_time
+        self._age_total += self._last_age
+        return True, frame, capture_time
+
+    def get_stats(self):
+        """Capture FPS, drop rate and frame age since start()"""
+        elapsed = max(time.time() - self._start_time, 1e-6)
+        captured = self.frames_captured
+        delivered = max(self.frames_delivered, 1)
+        return {
+            "capture_fps": captured / elapsed,
+            "frames_captured": captured,
+            "frames_dropped": self.frames_dropped,
+            "drop_rate": self.frames_dropped / captured if captured else 0.0,
+            "frame_age_ms": self._last_age * 1000,
+            "avg_frame_age_ms": self._age_total / delivered * 1000,
+        }
+
+    def release(self):
+        """Stop the capture thread and release the device"""
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        self.cap.release()
@@ -1,3 +1,20 @@
+# Static gestures as finger states (thumb, index, middle, ring, pinky), 1 = extended.
+# The classifier builds its lookup table from this, so adding a gesture only
+# needs a new entry here plus its text below. Unlisted patterns are UNKNOWN.
+GESTURE_FINGER_PATTERNS = {
+    "FIST": (0, 0, 0, 0, 0),
+    "OPEN_HAND": (1, 1, 1, 1, 1),
+    "THUMBS_UP": (1, 0, 0, 0, 0),
+    "POINT": (0, 1, 0, 0, 0),
+    "VICTORY": (0, 1, 1, 0, 0),
+    "THREE": (0, 1, 1, 1, 0),
+    "AWESOME": (0, 0, 1, 1, 1),
+    "FOUR": (0, 1, 1, 1, 1),
+    "LOVE_YOU": (1, 1, 0, 0, 1),
+    "PINKY_UP": (0, 0, 0, 0, 1),
+    "SHAKA": (1, 0, 0, 0, 1),
+}
+
 # Enhanced gesture mapping with more detailed responses
 
 GESTURE_TO_TEXT = {
@@ -12,6 +29,11 @@ GESTURE_TO_TEXT = {
     "LOVE_YOU": "I Love you!",
     "PINKY_UP": "Pinky promise!",
     "SHAKA": "Shaka, hang loose!",
+    # Motion gestures (hand_detection/dynamic_gestures.py)
+    "WAVE": "Goodbye!",
+    "SWIPE_LEFT": "Previous",
+    "SWIPE_RIGHT": "Next",
+    "CIRCLE": "Once more, please!",
     "UNKNOWN": "Unknown gesture detected"
 }
 
@@ -28,5 +50,9 @@ GESTURE_DISPLAY_NAMES = {
     "LOVE_YOU": "I Love you",
     "PINKY_UP": "Pinky Up",
     "SHAKA": "Shaka Sign",
+    "WAVE": "Wave",
+    "SWIPE_LEFT": "Swipe Left",
+    "SWIPE_RIGHT": "Swipe Right",
+    "CIRCLE": "Circle",
     "UNKNOWN": "Unknown Gesture"
 }
\ No newline at end of file
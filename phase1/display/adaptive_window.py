@@ -0,0 +1,107 @@
+import time
+
+import cv2
+
+from display.overlay import SpriteCache, TextSprite
+
+
+def window_controls_sprite(frame_width, current_scale, overlay_height=100):
+    """Control help on a darkened strip the width of the frame"""
+    controls = [
+        "WINDOW CONTROLS:",
+        "Drag corners to resize window",
+        f"Current zoom: {current_scale:.1f}x",
+        "'Q': Quit"
+    ]
+    lines = []
+    for i, text in enumerate(controls):
+        color = (0, 255, 255) if i == 0 else (200, 200, 200)
+        font_size = 0.5 if i > 0 else 0.6
+        lines.append((text, (20, 20 + i * 15), font_size, color, 1))
+    return TextSprite(lines, frame_width, overlay_height, shade=0.3)
+
+
+class AdaptiveDisplayWindow:
+    """Manages adaptive display window with dynamic resizing"""
+    
+    def __init__(self, window_name="Hand Sign Translator"):
+        self.window_name = window_name
+        self.current_scale = 1.0
+        self.target_width = 900  # Initial target width
+        self.target_height = 700  # Initial target height
+        self.is_fullscreen = False
+        # Static overlays are pre-rendered, rebuilt only when frame width or zoom change
+        self.sprites = SpriteCache()
+        self.overlay_height = 100
+        # Window size is cached: HighGUI has no resize event, so it is re-read
+        # at most every geometry_interval seconds and right after a fullscreen toggle
+        self.geometry_interval = 0.5
+        self.window_size = (self.target_width, self.target_height)
+        self._geometry_time = None
+        
+        # Create resizable window
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(self.window_name, self.target_width, self.target_height)
+        
+        # Set mouse callback for window interaction
+        cv2.setMouseCallback(self.window_name, self.mouse_callback)
+        
+    def mouse_callback(self, event, x, y, flags, param):
+        """Handle mouse events for window interaction"""
+        if event == cv2.EVENT_RBUTTONDOWN:
+            # Right click to toggle fullscreen
+            self.toggle_fullscreen()
+    
+    def toggle_fullscreen(self):
+        """Toggle between windowed and fullscreen mode"""
+        self.is_fullscreen = not self.is_fullscreen
+        if self.is_fullscreen:
+            cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+        else:
+            cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
+            cv2.resizeWindow(self.window_name, self.target_width, self.target_height)
+        self._geometry_time = None
+    
+    def refresh_geometry(self):
+        """Re-read the window size (one getWindowImageRect call)"""
+        _, _, window_width, window_height = cv2.getWindowImageRect(self.window_name)
+        # If window size is invalid, use default targets
+        if window_width <= 0 or window_height <= 0:
+            window_width, window_height = self.target_width, self.target_height
+        self.window_size = (window_width, window_height)
+        self._geometry_time = time.monotonic()
+    
+    def get_display_size(self, frame_shape):
+        """Calculate display size based on current window size"""
+        if self._geometry_time is None or time.monotonic() - self._geometry_time > self.geometry_interval:
+            self.refresh_geometry()
+        window_width, window_height = self.window_size
+        
+        # Apply current scale
+        display_width = int(window_width * self.current_scale)
+        display_height = int(window_height * self.current_scale)
+        
+        # Maintain aspect ratio of original frame
+        frame_height, frame_width = frame_shape[:2]
+        original_aspect = frame_width / frame_height
+        display_aspect = display_width / display_height
+        
+        if display_aspect > original_aspect:
+            # Window is wider than frame - adjust width
+            display_width = int(display_height * original_aspect)
+        else:
+            # Window is taller than frame - adjust height
+            display_height = int(display_width / original_aspect)
+        
+        # Ensure minimum size
+        display_width = max(display_width, 320)
+        display_height = max(display_height, 240)
+        
+        return display_width, display_height
+    
+    def add_window_controls_overlay(self, frame):
+        """Add overlay with window control instructions (in place, only the strip is touched)"""
+        frame_width = frame.shape[1]
+        sprite = self.sprites.get("controls", (frame_width, self.current_scale),
+                                  lambda: window_controls_sprite(frame_width, self.current_scale, self.overlay_height))
+        return sprite.draw(frame, 0, max(frame.shape[0] - self.overlay_height, 0))
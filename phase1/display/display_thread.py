@@ -0,0 +1,149 @@
+# Display stage on its own thread.
+#
+# The camera loop hands over its newest frame plus what to draw on it and
+# goes straight on to the next frame; the display thread shows the latest
+# submission at the monitor's refresh rate. The frame is resized to the
+# window first and everything is drawn at display resolution, so drawing
+# cost follows the window size instead of the capture size. All HighGUI
+# calls (window, imshow, waitKey, mouse callback) happen on this thread.
+#
+# macOS HighGUI (Cocoa) only works on the main thread: there the same steps
+# run inline in submit(), on the caller's thread, and nothing overlaps.
+
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from display.adaptive_window import AdaptiveDisplayWindow
+
+
+class DisplayThread:
+    """
+    submit(frame, annotations) copies the frame and returns at once; a newer
+    submission replaces one that was not shown yet. render(display_frame,
+    annotations, window) draws the annotations onto the resized frame.
+    Keys pressed in the window are collected for keys(); 'f' toggles
+    fullscreen right here. threaded=False (the default on macOS) shows each
+    submission inline instead, from the thread that calls start() and
+    submit(), which must then be the main thread.
+    """
+
+    def __init__(self, window_name, render=None, refresh_rate=60.0, threaded=None):
+        self.window_name = window_name
+        self.render = render
+        self.refresh_rate = refresh_rate  # Hz; the monitor's rate, OpenCV cannot query it
+        self.threaded = sys.platform != "darwin" if threaded is None else threaded
+        self.window = None
+        self.is_running = False
+        self.frames_submitted = 0
+        self.frames_shown = 0
+        self.render_time = 0.0            # smoothed seconds per shown frame: resize + draw + imshow
+        self._shown_times = deque(maxlen=30)
+        self._keys = queue.Queue()
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        # Two capture-size buffers: submit() fills one while the other is being resized
+        self._buffers = [None, None]
+        self._showing = 0
+        self._latest = None  # (buffer index, annotations) not shown yet
+        self._display_frame = None
+        self._thread = None
+
+    def start(self, timeout=5.0):
+        """Start the thread and wait until its window exists (inline: create the window now)"""
+        self.is_running = True
+        if not self.threaded:
+            self.window = AdaptiveDisplayWindow(self.window_name)
+            return self
+        self._thread = threading.Thread(target=self._run, name="display", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self
+
+    def submit(self, frame, annotations=None):
+        """Hand over the newest frame (copied: callers reuse their buffers) and its annotations"""
+        with self._lock:
+            index = 1 - self._showing
+            if self._buffers[index] is None or self._buffers[index].shape != frame.shape:
+                self._buffers[index] = np.empty_like(frame)
+            np.copyto(self._buffers[index], frame)
+            self._latest = (index, annotations)
+            self.frames_submitted += 1
+        if not self.threaded:
+            self._poll(time.perf_counter())
+
+    def keys(self):
+        """Keys pressed since the last call, oldest first"""
+        pressed = []
+        while True:
+            try:
+                pressed.append(self._keys.get_nowait())
+            except queue.Empty:
+                return pressed
+
+    @property
+    def fps(self):
+        """Frames actually shown per second, over the last 30"""
+        if len(self._shown_times) < 2:
+            return 0.0
+        return (len(self._shown_times) - 1) / max(self._shown_times[-1] - self._shown_times[0], 1e-6)
+
+    def _show(self, index, annotations, display_frame):
+        start = time.perf_counter()
+        source = self._buffers[index]
+        display_width, display_height = self.window.get_display_size(source.shape)
+        if display_frame is None or display_frame.shape[:2] != (display_height, display_width):
+            display_frame = np.empty((display_height, display_width, 3), np.uint8)
+        # Resize first, draw after: overlays cost what the window size costs
+        cv2.resize(source, (display_width, display_height), dst=display_frame,
+                   interpolation=cv2.INTER_AREA if display_width < source.shape[1] else cv2.INTER_LINEAR)
+        if self.render is not None:
+            self.render(display_frame, annotations, self.window)
+        self.window.add_window_controls_overlay(display_frame)
+        cv2.imshow(self.window_name, display_frame)
+
+        now = time.perf_counter()
+        self.render_time += 0.1 * (now - start - self.render_time)
+        self._shown_times.append(now)
+        self.frames_shown += 1
+        return display_frame
+
+    def _poll(self, next_tick):
+        """Show the newest submission if there is one, then handle window events until next_tick"""
+        with self._lock:
+            latest, self._latest = self._latest, None
+            if latest is not None:
+                self._showing = latest[0]
+        if latest is not None:
+            self._display_frame = self._show(*latest, self._display_frame)
+
+        key = cv2.waitKey(max(1, int((next_tick - time.perf_counter()) * 1000))) & 0xFF
+        if key == 255:
+            return
+        if key == ord('f'):
+            # Toggle fullscreen with keyboard
+            self.window.toggle_fullscreen()
+            print(f"Fullscreen: {self.window.is_fullscreen}")
+        self._keys.put(key)
+
+    def _run(self):
+        self.window = AdaptiveDisplayWindow(self.window_name)
+        self._ready.set()
+        period = 1.0 / self.refresh_rate
+        next_tick = time.perf_counter()
+        while self.is_running:
+            next_tick = max(next_tick + period, time.perf_counter())
+            self._poll(next_tick)
+        cv2.destroyWindow(self.window_name)
+
+    def stop(self):
+        self.is_running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        elif self.window is not None:
+            cv2.destroyWindow(self.window_name)
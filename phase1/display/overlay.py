@@ -0,0 +1,104 @@
+# Cached overlay rendering.
+#
+# Static text (control help, prompts) is rendered once into a sprite: the
+# antialiased text premultiplied by its coverage, the coverage as alpha for
+# just the pixels the text touches, and optionally a darkened backing box.
+# Drawing a sprite changes only those pixels (and the box), in place - no
+# full-frame copy or blend. A SpriteCache rebuilds a sprite only when its
+# key (frame size, zoom, text) changes.
+
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def shade_lut(shade):
+    """
+    Lookup table darkening a channel to the fraction shade, rounded exactly as
+    cv2.addWeighted(black, 1 - shade, frame, shade, 0) rounds it
+    """
+    levels = np.arange(256, dtype=np.uint8)[None]
+    return cv2.addWeighted(np.zeros_like(levels), 1 - shade, levels, shade, 0).reshape(-1)
+
+
+class TextSprite:
+    """
+    lines are (text, (x, y), font_scale, color, thickness) in sprite
+    coordinates. shade darkens the pixels under the whole sprite to that
+    fraction first (0.3 keeps 30%), None leaves them as they are.
+    """
+
+    def __init__(self, lines, width, height, shade=None):
+        self.width = width
+        self.height = height
+        # On black, putText leaves color * coverage; on white-on-black, the coverage itself
+        image = np.zeros((height, width, 3), np.uint8)
+        coverage = np.zeros((height, width), np.uint8)
+        for text, origin, font_scale, color, thickness in lines:
+            cv2.putText(image, text, origin, FONT, font_scale, color, thickness)
+            cv2.putText(coverage, text, origin, FONT, font_scale, 255, thickness)
+        # Only pixels the text covers are touched: fully covered ones are plain copies,
+        # the antialiased edge is blended as frame * (255 - alpha) / 255 + image
+        rows, cols = np.nonzero(coverage)
+        alpha = coverage[rows, cols]
+        solid, edge = alpha == 255, alpha < 255
+        self.solid = (rows[solid], cols[solid], image[rows[solid], cols[solid]])
+        self.edge = (rows[edge], cols[edge], image[rows[edge], cols[edge]].astype(np.uint16),
+                     alpha[edge, None].astype(np.uint16))
+        self._shade_lut = None if shade is None else shade_lut(shade)
+        self.origin = (0, 0)  # text origin inside the sprite, for single-line sprites
+
+    @classmethod
+    def line(cls, text, font_scale, color, thickness=1):
+        """Sprite of one text line, sized to fit; draw_text() places it like cv2.putText"""
+        (width, height), baseline = cv2.getTextSize(text, FONT, font_scale, thickness)
+        origin = (thickness, height + thickness)
+        sprite = cls([(text, origin, font_scale, color, thickness)],
+                     width + 2 * thickness, height + baseline + 2 * thickness)
+        sprite.origin = origin
+        return sprite
+
+    def draw(self, frame, x, y):
+        """Blend into frame in place with the top left corner at (x, y), clipped to the frame"""
+        frame_height, frame_width = frame.shape[:2]
+        if self._shade_lut is not None:
+            top, left = max(y, 0), max(x, 0)
+            roi = frame[top:max(min(y + self.height, frame_height), top), left:max(min(x + self.width, frame_width), left)]
+            if roi.size:
+                cv2.LUT(roi, self._shade_lut, dst=roi)
+
+        clipped = x < 0 or y < 0 or x + self.width > frame_width or y + self.height > frame_height
+        # Flat pixel indices are much cheaper than (row, col) pairs, but need a contiguous frame
+        pixels = frame.reshape(-1, 3) if frame.flags.c_contiguous else frame
+        for rows, cols, color, *alpha in (self.solid, self.edge):
+            rows, cols = rows + y, cols + x
+            if clipped:
+                inside = (rows >= 0) & (rows < frame_height) & (cols >= 0) & (cols < frame_width)
+                rows, cols, color = rows[inside], cols[inside], color[inside]
+                alpha = [a[inside] for a in alpha]
+            target = rows * frame_width + cols if pixels is not frame else (rows, cols)
+            if alpha:
+                under = pixels[target].astype(np.uint16)
+                color = np.minimum(under - (under * alpha[0] + 127) // 255 + color, 255)
+            pixels[target] = color
+        return frame
+
+    def draw_text(self, frame, x, y):
+        """Draw with the text origin (bottom left of the text, as in cv2.putText) at (x, y)"""
+        return self.draw(frame, x - self.origin[0], y - self.origin[1])
+
+
+class SpriteCache:
+    """One sprite per name, rebuilt by build() only when its key changes"""
+
+    def __init__(self):
+        self._sprites = {}
+        self.builds = 0
+
+    def get(self, name, key, build):
+        cached = self._sprites.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._sprites[name] = (key, build())
+            self.builds += 1
+        return cached[1]
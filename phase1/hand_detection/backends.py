@@ -0,0 +1,144 @@
+# Inference backends behind HandDetector.
+# Every backend takes a read-only RGB image plus a timestamp in milliseconds
+# and returns (landmarks, handedness): an (N, 21, 3) float32 array of
+# normalized coordinates and a list of (label, score) in the same order,
+# so everything downstream works with either backend. mediapipe is imported
+# when a backend is built, so importing this module stays cheap.
+
+import os
+import threading
+
+import numpy as np
+
+from hand_detection.hand_result import EMPTY_LANDMARKS
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "models", "hand_landmarker.task")
+
+
+class SolutionsBackend:
+    """Legacy mp.solutions.hands graph, synchronous"""
+
+    is_async = False
+
+    def __init__(self, max_hands=2, detection_conf=0.8, tracking_conf=0.5):
+        import mediapipe as mp
+
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_hands,
+            min_detection_confidence=detection_conf,
+            min_tracking_confidence=tracking_conf
+        )
+        self.latest_timestamp_ms = -1
+        self.results_received = 0
+
+    def process(self, rgb, timestamp_ms):
+        results = self.hands.process(rgb)
+        self.latest_timestamp_ms = timestamp_ms
+        self.results_received += 1
+
+        handedness = []
+        if results.multi_handedness:
+            for classification in results.multi_handedness:
+                best = classification.classification[0]
+                handedness.append((best.label, best.score))
+
+        if not results.multi_hand_landmarks:
+            return EMPTY_LANDMARKS.copy(), handedness
+        # One pass over the protobufs per frame; everything after works on the array
+        landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                              for hand in results.multi_hand_landmarks], dtype=np.float32)
+        return landmarks, handedness
+
+    def close(self):
+        self.hands.close()
+
+
+class HandLandmarkerBackend:
+    """
+    MediaPipe Tasks HandLandmarker loaded from a local .task model file.
+
+    running_mode="video" runs synchronously on each frame. running_mode=
+    "live_stream" submits frames with detect_async and returns immediately
+    with the most recent finished result, so the caller never blocks on
+    inference; MediaPipe drops frames it cannot keep up with.
+    """
+
+    def __init__(self, max_hands=2, detection_conf=0.8, tracking_conf=0.5,
+                 model_path=DEFAULT_MODEL_PATH, running_mode="video"):
+        import mediapipe as mp
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python import vision
+
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"HandLandmarker model not found at {model_path} - download hand_landmarker.task (see README)")
+
+        self.mp = mp
+        self.is_async = running_mode == "live_stream"
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM if self.is_async else vision.RunningMode.VIDEO,
+            num_hands=max_hands,
+            min_hand_detection_confidence=detection_conf,
+            min_hand_presence_confidence=detection_conf,
+            min_tracking_confidence=tracking_conf,
+            result_callback=self._on_result if self.is_async else None,
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+        self._lock = threading.Lock()
+        self._latest_result = None
+        self.latest_timestamp_ms = -1
+        self._last_submitted_ms = -1
+        self.frames_submitted = 0
+        self.results_received = 0
+
+    @staticmethod
+    def _convert(result):
+        """Tasks result -> (N, 21, 3) landmark array and (label, score) list"""
+        if result is None or not result.hand_landmarks:
+            return EMPTY_LANDMARKS.copy(), []
+        landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand] for hand in result.hand_landmarks],
+                             dtype=np.float32)
+        handedness = [(categories[0].category_name, categories[0].score)
+                      for categories in result.handedness]
+        return landmarks, handedness
+
+    def _on_result(self, result, output_image, timestamp_ms):
+        with self._lock:
+            self._latest_result = result
+            self.latest_timestamp_ms = timestamp_ms
+            self.results_received += 1
+
+    def process(self, rgb, timestamp_ms):
+        # Tasks require strictly increasing timestamps
+        timestamp_ms = max(int(timestamp_ms), self._last_submitted_ms + 1)
+        self._last_submitted_ms = timestamp_ms
+        image = self.mp.Image(image_format=self.mp.ImageFormat.SRGB, data=rgb)
+        self.frames_submitted += 1
+
+        if self.is_async:
+            self.landmarker.detect_async(image, timestamp_ms)
+            with self._lock:
+                result = self._latest_result
+            # Converted per call: callers edit landmarks in place
+            return self._convert(result)
+
+        self.results_received += 1
+        self.latest_timestamp_ms = timestamp_ms
+        return self._convert(self.landmarker.detect_for_video(image, timestamp_ms))
+
+    def close(self):
+        self.landmarker.close()
+
+
+def create_backend(name="solutions", max_hands=2, detection_conf=0.8, tracking_conf=0.5,
+                   model_path=DEFAULT_MODEL_PATH, running_mode="video"):
+    """Backend by name: "solutions" (legacy graph) or "tasks" (HandLandmarker)"""
+    if name == "solutions":
+        return SolutionsBackend(max_hands, detection_conf, tracking_conf)
+    if name == "tasks":
+        return HandLandmarkerBackend(max_hands, detection_conf, tracking_conf, model_path, running_mode)
+    raise ValueError(f"Unknown detector backend: {name}")
@@ -1,44 +1,239 @@
-import cv2
-import mediapipe as mp
+import math
+import time
+
 import numpy as np
 
+from hand_detection.backends import DEFAULT_MODEL_PATH, create_backend
+from hand_detection.hand_result import HandResult
+from hand_detection.landmark_drawing import LandmarkRenderer
+from hand_detection.landmark_history import LandmarkHistory
+from hand_detection.landmark_predictor import LandmarkPredictor
+from hand_detection.preprocess import FramePreprocessor
+
 class HandDetector:
-    def __init__(self, max_hands=2, detection_conf=0.8, tracking_conf=0.5):
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_hands,
-            min_detection_confidence=detection_conf,
-            min_tracking_confidence=tracking_conf
-        )
-        self.mp_draw = mp.solutions.drawing_utils
-        self.drawing_styles = mp.solutions.drawing_styles
-
-    def find_hands(self, frame, draw=True):
+    def __init__(self, max_hands=2, detection_conf=0.8, tracking_conf=0.5, inference_scale=1.0,
+                 roi_tracking=False, roi_padding=0.5, roi_refresh_interval=30,
+                 adaptive_cadence=False, max_skip=3, target_fps=30, slow_speed=0.05, fast_speed=0.6,
+                 mirror_pixels=True, backend="solutions", model_path=DEFAULT_MODEL_PATH,
+                 running_mode="video", history_size=60, draw_quality="skeleton"):
+        # Inference backend: "solutions" (legacy graph) or "tasks" (HandLandmarker,
+        # running_mode "video" or "live_stream"). In live_stream mode find_hands
+        # submits the frame and returns the newest finished result without waiting.
+        backend_args = (backend, max_hands, detection_conf, tracking_conf, model_path, running_mode)
+        self.hands = create_backend(*backend_args)
+        self.is_async = self.hands.is_async
+        if self.is_async and (roi_tracking or adaptive_cadence):
+            # Results arrive frames late, so crops and predictions would be anchored to stale frames
+            print("⚠️ ROI tracking and adaptive cadence are disabled in live_stream mode")
+            roi_tracking = adaptive_cadence = False
+        # Landmark drawing from the NumPy arrays: "full", "skeleton" or "off"
+        self.renderer = LandmarkRenderer(draw_quality)
+        # Detection runs on a frame downscaled by this factor. Landmarks are
+        # normalized, so they apply to the full-resolution frame unchanged.
+        self.inference_scale = inference_scale
+        # (label, score) per hand from the last find_hands call, same order as the landmarks
+        self.handedness = []
+
+        # Flip/convert into reused buffers. With mirror_pixels=False the frame
+        # is returned unflipped and only the landmark x-coordinates are
+        # mirrored, so results match the flipped path without the pixel copy.
+        self.mirror_pixels = mirror_pixels
+        self.preprocessor = FramePreprocessor(mirror_pixels)
+
+        # ROI tracking: once a hand is found, run inference on an expanded crop
+        # around the previous hand boxes and only go back to the full frame
+        # when a hand is lost or every roi_refresh_interval frames
+        self.roi_tracking = roi_tracking
+        self.roi_padding = roi_padding
+        self.roi_refresh_interval = roi_refresh_interval
+        self.hand_boxes = np.empty((0, 4))  # normalized (x0, y0, x1, y1) per hand from the last frame
+        self._frames_since_full = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        if roi_tracking:
+            # Crops have their own coordinate frame, so they get their own
+            # tracking graph instead of confusing the full-frame one
+            self.roi_hands = create_backend(*backend_args)
+
+        # Adaptive cadence: run inference every k-th frame and predict the
+        # landmarks in between. k grows when the hand is slow (below
+        # slow_speed, normalized units/s) and when inference does not fit the
+        # frame budget, and drops to 1 above fast_speed.
+        self.adaptive_cadence = adaptive_cadence
+        self.max_skip = max_skip
+        self.frame_budget = 1.0 / target_fps
+        self.slow_speed = slow_speed
+        self.fast_speed = fast_speed
+        self.predictor = LandmarkPredictor()
+        self.inference_interval = 1
+        self._frames_until_inference = 0
+        self._avg_inference_time = 0.0
+        self.last_predicted = False  # True when the last find_hands result was predicted
+        self.inferred_frames = 0
+        self.predicted_frames = 0
+
+        # Landmarks of the last history_size frames (hand slots by detection
+        # order), shared by smoothing, prediction and dynamic gesture code
+        self.history = LandmarkHistory(history_size, max_hands)
+
+    def _detect(self, backend, image, timestamp_ms, scale=1.0, buffer_name="rgb"):
+        """Run one backend pass on a BGR image, returns (landmarks, handedness)"""
+        # The palm/landmark models work at low resolution internally, so
+        # feeding them a smaller copy saves conversion and resize work.
+        # The RGB buffer is read-only, so MediaPipe uses it without copying.
+        rgb = self.preprocessor.to_rgb(image, scale, buffer_name)
+        return backend.process(rgb, timestamp_ms)
+
+    def _roi_crop(self, frame_width, frame_height):
+        """Square pixel crop around all tracked hands, expanded by roi_padding"""
+        boxes = self.hand_boxes
+        x0, y0 = boxes[:, 0].min() * frame_width, boxes[:, 1].min() * frame_height
+        x1, y1 = boxes[:, 2].max() * frame_width, boxes[:, 3].max() * frame_height
+
+        size = max(x1 - x0, y1 - y0, 32) * (1 + 2 * self.roi_padding)
+        size = min(size, frame_width, frame_height)
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+
+        left = int(min(max(cx - size / 2, 0), frame_width - size))
+        top = int(min(max(cy - size / 2, 0), frame_height - size))
+        return left, top, left + int(size), top + int(size)
+
+    @staticmethod
+    def _remap_landmarks(landmarks, left, top, crop_width, crop_height, frame_width, frame_height):
+        """Map crop-normalized (N, 21, 3) landmarks back to full-frame normalized coordinates in place"""
+        sx, sy = crop_width / frame_width, crop_height / frame_height
+        landmarks[..., 0] = left / frame_width + landmarks[..., 0] * sx
+        landmarks[..., 1] = top / frame_height + landmarks[..., 1] * sy
+        landmarks[..., 2] *= sx  # z shares the x scale in MediaPipe
+
+    @staticmethod
+    def _mirror_landmarks(landmarks):
+        """Mirror landmark x-coordinates in place (x -> 1 - x)"""
+        landmarks[..., 0] = 1.0 - landmarks[..., 0]
+
+    @staticmethod
+    def _bounding_boxes(landmarks):
+        """(N, 4) normalized (x0, y0, x1, y1) per hand"""
+        xy = landmarks[..., :2]
+        return np.concatenate([xy.min(axis=1), xy.max(axis=1)], axis=1)
+
+    def _infer(self, frame, timestamp_ms):
+        """MediaPipe inference on the mirrored frame, using the ROI crop when possible"""
+        frame_height, frame_width = frame.shape[:2]
+
+        hand_landmarks = None
+        if self.roi_tracking and len(self.hand_boxes) and self._frames_since_full < self.roi_refresh_interval:
+            left, top, right, bottom = self._roi_crop(frame_width, frame_height)
+            crop_landmarks, handedness = self._detect(self.roi_hands, frame[top:bottom, left:right],
+                                                      timestamp_ms, buffer_name="roi_rgb")
+
+            # A hand went missing in the crop - fall back to the full frame now
+            if len(crop_landmarks) >= len(self.hand_boxes):
+                self._remap_landmarks(crop_landmarks, left, top, right - left, bottom - top,
+                                      frame_width, frame_height)
+                hand_landmarks = crop_landmarks
+                self._frames_since_full += 1
+                self.roi_frames += 1
+
+        if hand_landmarks is None:
+            hand_landmarks, handedness = self._detect(self.hands, frame, timestamp_ms, self.inference_scale)
+            self._frames_since_full = 0
+            self.full_frames += 1
+
+        if self.roi_tracking:
+            self.hand_boxes = self._bounding_boxes(hand_landmarks)
+        return hand_landmarks, handedness
+
+    def _next_interval(self):
+        """Frames per inference from hand speed and CPU headroom"""
+        speed = self.predictor.speed()
+        slowness = (self.fast_speed - speed) / (self.fast_speed - self.slow_speed)
+        motion_interval = 1 + round(self.max_skip * min(max(slowness, 0.0), 1.0))
+        cpu_interval = math.ceil(self._avg_inference_time / self.frame_budget)
+        return max(1, min(max(motion_interval, cpu_interval), self.max_skip + 1))
+
+    def find_hands(self, frame, draw=True, timestamp=None):
         """
         Hand detection that preserves original frame resolution
+
+        Returns (frame, HandResult); the result holds an (N, 21, 3) landmark
+        array plus handedness and still indexes like the old protobuf list.
+        timestamp (seconds) drives landmark prediction in adaptive cadence
+        mode and the Tasks backend clock; defaults to the current time.
+        """
+        # Flip frame for mirror-like viewing (into a reused buffer, valid
+        # until the next call; a no-op when mirroring landmarks instead)
+        frame = self.preprocessor.mirror(frame)
+        now = time.perf_counter() if timestamp is None else timestamp
+
+        if (self.adaptive_cadence and self._frames_until_inference > 0
+                and self.predictor.is_tracking):
+            # Skipped frame: extrapolate from the last inferred landmarks
+            self._frames_until_inference -= 1
+            hand_landmarks = self.predictor.predict(now)
+            handedness = self.handedness
+            if self.roi_tracking:
+                # Boxes live in image space, predictions in mirrored space
+                self.hand_boxes = self._bounding_boxes(hand_landmarks)
+                if not self.mirror_pixels:
+                    self.hand_boxes[:, [0, 2]] = 1.0 - self.hand_boxes[:, [2, 0]]
+            self.last_predicted = True
+            self.predicted_frames += 1
+        else:
+            start = time.perf_counter()
+            hand_landmarks, handedness = self._infer(frame, int(now * 1000))
+            if not self.mirror_pixels:
+                # Report the same coordinates and labels as the flipped path
+                self._mirror_landmarks(hand_landmarks)
+                handedness = [({"Left": "Right", "Right": "Left"}.get(label, label), score)
+                              for label, score in handedness]
+            elapsed = time.perf_counter() - start
+            self._avg_inference_time += 0.1 * (elapsed - self._avg_inference_time)
+            self.last_predicted = False
+            self.inferred_frames += 1
+
+            if self.adaptive_cadence:
+                if len(hand_landmarks):
+                    self.predictor.update(hand_landmarks, now)
+                    self.inference_interval = self._next_interval()
+                else:
+                    # Nothing to extrapolate - keep looking every frame
+                    self.predictor.reset()
+                    self.inference_interval = 1
+                self._frames_until_inference = self.inference_interval - 1
+
+        self.handedness = handedness
+        result = HandResult.from_handedness(hand_landmarks, handedness, frame.shape)
+        self.history.append(hand_landmarks, now)
+
+        if draw:
+            self.draw_landmarks(frame, hand_landmarks)
+
+        return frame, result
+
+    def draw_landmarks(self, frame, landmarks):
+        """
+        Draw landmarks as returned by find_hands onto frame. They are
+        normalized, so frame may be any size, e.g. the resized display frame.
         """
-        # Flip frame for mirror-like viewing
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # To improve performance, mark the image as not writeable to pass by reference
-        #rgb.flags.writeable = False
-        results = self.hands.process(rgb)
-        rgb.flags.writeable = True
-        
-        hand_landmarks = []
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks_mp in results.multi_hand_landmarks:
-                if draw:
-                    self.mp_draw.draw_landmarks(
-                        frame,
-                        hand_landmarks_mp,
-                        self.mp_hands.HAND_CONNECTIONS,
-                        self.drawing_styles.get_default_hand_landmarks_style(),
-                        self.drawing_styles.get_default_hand_connections_style()
-                    )
-                hand_landmarks.append(hand_landmarks_mp)
-
-        return frame, hand_landmarks
\ No newline at end of file
+        # Unflipped frame: draw at the unmirrored positions
+        self.renderer.draw(frame, landmarks, mirror=not self.mirror_pixels)
+
+    def warm_up(self, width=1280, height=720):
+        """
+        One inference on a blank frame of the capture size, so graph setup
+        and buffer allocation are not paid on the first camera frame.
+        Returns the seconds it took.
+        """
+        start = time.perf_counter()
+        blank = np.zeros((height, width, 3), np.uint8)
+        self._detect(self.hands, blank, 0, self.inference_scale)
+        if self.roi_tracking:
+            self._detect(self.roi_hands, blank[:height // 2, :height // 2], 0, buffer_name="roi_rgb")
+        return time.perf_counter() - start
+
+    def close(self):
+        """Release the inference graphs"""
+        self.hands.close()
+        if self.roi_tracking:
+            self.roi_hands.close()
@@ -0,0 +1,287 @@
+# Motion gestures (wave, swipe, circle) recognized online from the landmark
+# history with streaming subsequence DTW.
+#
+# Each frame adds one palm velocity sample, expressed in hand sizes per
+# second so it does not depend on position, distance to the camera or frame
+# rate. Every template keeps one DTW cost column and the new sample updates
+# all columns at once, so a frame costs O(templates x template length) and
+# the state has a fixed size no matter how long the session runs. Labels
+# are the keys of GESTURE_TO_TEXT.
+
+import numpy as np
+
+PALM_POINTS = [0, 5, 9, 13, 17]
+
+
+def _swipe(t):
+    """~3 hand sizes to the right with an eased start and stop"""
+    return np.stack([3.0 * (1 - np.cos(np.pi * t)) / 2, np.zeros_like(t)], axis=1)
+
+
+def _wave(t):
+    """Side to side, 2.5 cycles"""
+    return np.stack([0.6 * np.sin(2 * np.pi * 2.5 * t), np.zeros_like(t)], axis=1)
+
+
+def _circle(t):
+    """One loop of radius 1"""
+    angle = 2 * np.pi * t
+    return np.stack([np.cos(angle), np.sin(angle)], axis=1)
+
+
+# label, path over t in [0, 1] (hand sizes, x right / y down), duration at tempo 1 (s), axis flip
+GESTURE_PATHS = (
+    ("SWIPE_RIGHT", _swipe, 0.4, (1, 1)),
+    ("SWIPE_LEFT", _swipe, 0.4, (-1, 1)),
+    ("WAVE", _wave, 1.0, (1, 1)),
+    ("CIRCLE", _circle, 1.0, (1, 1)),
+    ("CIRCLE", _circle, 1.0, (1, -1)),
+)
+
+
+def default_templates(fps=30, tempos=(0.6, 1.0, 1.6)):
+    """
+    Built-in (label, velocity template) pairs. Velocity scales with tempo,
+    which DTW cannot absorb, so each path is sampled at several tempos.
+    Frames are mirrored, so SWIPE_RIGHT is the user's right.
+    """
+    templates = []
+    for label, path, duration, flip in GESTURE_PATHS:
+        for tempo in tempos:
+            t = np.linspace(0, 1, max(3, round(duration / tempo * fps) + 1))
+            positions = (path(t) * flip).astype(np.float32)
+            templates.append((label, np.diff(positions, axis=0) * fps))
+    return templates
+
+
+class DynamicGestureRecognizer:
+    """
+    Streaming (subsequence) DTW over palm velocity.
+
+    Steps are (stay, advance 1, advance 2) along the template, which lets a
+    gesture run anywhere from 2x faster to much slower than its template and
+    keeps the column update free of in-column dependencies, so all templates
+    update in a few vectorized NumPy operations. Each cell also carries the
+    time its path started.
+
+    Short gestures are sub-motions of longer ones (half a wave is a swipe),
+    so nothing fires mid-motion. While the hand moves, every template keeps
+    its best match (cost relative to the template's own motion); when the
+    hand comes to rest or leaves the frame, the match below match_threshold
+    that ended last and covers the longest stretch of the motion wins.
+    """
+
+    def __init__(self, templates=None, match_threshold=0.45, cooldown=0.8, aspect_ratio=16 / 9,
+                 smoothing=0.5, rest_speed=1.0, rest_time=0.1, end_slack=0.25):
+        self.match_threshold = match_threshold
+        self.cooldown = cooldown
+        self.aspect_ratio = aspect_ratio  # frame width / height, makes x and y the same unit
+        self.smoothing = smoothing        # EMA weight of the newest velocity sample
+        self.rest_speed = rest_speed      # hand sizes per second below which the hand is at rest
+        self.rest_time = rest_time        # seconds at rest that end a motion
+        self.end_slack = end_slack        # matches must end this close to the end of the motion
+
+        self.labels = []
+        self._templates = []
+        for label, template in (templates if templates is not None else default_templates()):
+            self.add_template(label, template)
+
+        self.last_event = None
+        self.last_event_time = None
+        self.frames_processed = 0
+
+    def add_template(self, label, velocities):
+        """Add a (m, 2) palm velocity template (hand sizes per second) for label"""
+        self.labels.append(label)
+        self._templates.append(np.asarray(velocities, dtype=np.float32))
+        self._build()
+
+    def _build(self):
+        """Pad templates into one (K, L, 2) array and allocate the DTW state"""
+        count = len(self._templates)
+        length = max(len(t) for t in self._templates)
+        self._end_columns = np.array([len(t) + 1 for t in self._templates])
+        # Padding points are far from any real velocity, so paths never end there
+        self._stack = np.full((count, length, 2), 1e6, dtype=np.float32)
+        for k, template in enumerate(self._templates):
+            self._stack[k, :len(template)] = template
+        # Cost of matching a motionless hand, used to normalize match cost
+        self._motion = np.array([np.linalg.norm(t, axis=1).sum() for t in self._templates], dtype=np.float32)
+
+        # Column j + 2 holds the cost of ending at template point j; the two
+        # leading columns are the "advance 2" guard (inf) and the free start (0)
+        self._cost = np.full((count, length + 2), np.inf, dtype=np.float32)
+        self._cost[:, 1] = 0.0
+        self._start = np.zeros((count, length + 2), dtype=np.float64)
+        self._steps = np.empty((3, count, length), dtype=np.float32)
+        self._step_starts = np.empty((3, count, length), dtype=np.float64)
+        self._diff = np.empty_like(self._stack)
+        self._dist = np.empty((count, length), dtype=np.float32)
+        self._rows = np.arange(count)
+
+        # Best match per template within the current motion
+        self._best_score = np.full(count, np.inf, dtype=np.float32)
+        self._best_start = np.zeros(count)
+        self._best_end = np.zeros(count)
+        self.reset()
+
+    def reset(self):
+        """Forget partial matches and the motion in progress, e.g. when the hand is lost"""
+        self._cost[:, 2:] = np.inf
+        self._clear_matches()
+        self._previous_center = None
+        self._previous_time = None
+        self._velocity = None
+        self._hand_size = None
+
+    def _clear_matches(self):
+        self._best_score.fill(np.inf)
+        self._moving = False
+        self._motion_end = None
+        self._rest_since = None
+
+    def _palm_sample(self, hand, timestamp):
+        """Smoothed palm velocity in hand sizes per second, or None for the first frame"""
+        points = hand[:, :2] * np.array([self.aspect_ratio, 1.0], dtype=np.float32)
+        center = points[PALM_POINTS].mean(axis=0)
+        size = float(np.linalg.norm(points[9] - points[0]))
+        self._hand_size = size if self._hand_size is None else 0.8 * self._hand_size + 0.2 * size
+
+        previous_center, previous_time = self._previous_center, self._previous_time
+        self._previous_center, self._previous_time = center, timestamp
+        if previous_center is None or self._hand_size <= 0:
+            return None
+
+        velocity = (center - previous_center) / (timestamp - previous_time) / self._hand_size
+        if self._velocity is None:
+            self._velocity = velocity
+        else:
+            self._velocity = self.smoothing * velocity + (1 - self.smoothing) * self._velocity
+        return self._velocity
+
+    def update(self, history, hand_index=0):
+        """
+        Feed the newest frame of a LandmarkHistory; returns a gesture label
+        when a motion gesture completes on this frame, else None. History
+        slots follow detection order, so this suits a single hand; with
+        several, use TrackedGestureRecognizer.
+        """
+        if not len(history):
+            return None
+        landmarks, timestamps = history.last(1)
+        hand = landmarks[0, hand_index]
+        return self.update_hand(None if np.isnan(hand[0, 0]) else hand, float(timestamps[0]))
+
+    def update_hand(self, hand, timestamp):
+        """
+        Feed one frame of one hand: (21, 3) normalized landmarks, or None
+        when it is not in the frame. Returns a gesture label when a motion
+        gesture completes on this frame, else None.
+        """
+        if self._previous_time is not None and timestamp <= self._previous_time:
+            return None  # no new frame since the last call
+
+        if hand is None:
+            # Hand left the frame: that ends the motion too
+            label = self._decide(timestamp) if self._moving else None
+            self.reset()
+            return label
+
+        sample = self._palm_sample(hand, timestamp)
+        if sample is None:
+            return None
+        self._step(sample, timestamp)
+
+        if np.hypot(*sample) >= self.rest_speed:
+            self._moving = True
+            self._motion_end = None
+            self._rest_since = None
+            return None
+        if not self._moving:
+            return None
+        if self._rest_since is None:
+            self._rest_since = timestamp
+            self._motion_end = timestamp
+        if timestamp - self._rest_since < self.rest_time:
+            return None
+        return self._decide(self._motion_end)
+
+    def _step(self, sample, timestamp):
+        """One DTW column update for every template, then record improved matches"""
+        self.frames_processed += 1
+        np.subtract(self._stack, sample, out=self._diff)
+        np.einsum("klc,klc->kl", self._diff, self._diff, out=self._dist)
+        np.sqrt(self._dist, out=self._dist)
+
+        # A path entering from the free start column begins now
+        self._start[:, 1] = timestamp
+        # stay on point j, advance from j - 1, or skip from j - 2
+        for i, offset in enumerate((2, 1, 0)):
+            np.copyto(self._steps[i], self._cost[:, offset:offset + self._dist.shape[1]])
+            np.copyto(self._step_starts[i], self._start[:, offset:offset + self._dist.shape[1]])
+        # A skip still pays for the point it skips, so fast paths are not cheaper
+        self._steps[2, :, 1:] += self._dist[:, :-1]
+        choice = self._steps.argmin(axis=0)[None]
+        self._cost[:, 2:] = np.take_along_axis(self._steps, choice, axis=0)[0] + self._dist
+        self._start[:, 2:] = np.take_along_axis(self._step_starts, choice, axis=0)[0]
+
+        scores = self._cost[self._rows, self._end_columns] / self._motion
+        improved = scores < self._best_score
+        self._best_score[improved] = scores[improved]
+        self._best_start[improved] = self._start[self._rows, self._end_columns][improved]
+        self._best_end[improved] = timestamp
+
+    def _decide(self, motion_end):
+        """Pick the winning match for the motion that just ended"""
+        valid = ((self._best_score < self.match_threshold)
+                 & (self._best_end >= motion_end - self.end_slack))
+        self._clear_matches()
+        if not valid.any():
+            return None
+
+        # Longest matched stretch wins, then lowest cost
+        duration = np.where(valid, self._best_end - self._best_start, -np.inf)
+        candidates = np.flatnonzero(duration >= duration.max() - 1e-6)
+        best = candidates[np.argmin(self._best_score[candidates])]
+        self._cost[:, 2:] = np.inf
+        if self.last_event_time is not None and motion_end - self.last_event_time < self.cooldown:
+            return None
+
+        self.last_event = self.labels[best]
+        self.last_event_time = motion_end
+        return self.last_event
+
+
+class TrackedGestureRecognizer:
+    """
+    One DynamicGestureRecognizer per HandTracker slot, so every palm
+    trajectory belongs to one hand even when detection order swaps. A
+    slot's motion state is dropped when its track ends or the slot is
+    handed to another hand.
+    """
+
+    def __init__(self, slots=2, templates=None, **options):
+        self.recognizers = [DynamicGestureRecognizer(templates, **options) for _ in range(slots)]
+        self._track_ids = np.full(slots, -1)
+
+    def update(self, result, slot_ids, timestamp):
+        """
+        Feed a tracked HandResult (after HandTracker.update) and the
+        tracker's slot_ids; returns the labels of motion gestures completed
+        on this frame, in slot order.
+        """
+        hands = [None] * len(self.recognizers)
+        if result:
+            for hand, slot in zip(result.landmarks, result.track_slots):
+                if slot >= 0:
+                    hands[slot] = hand
+        labels = []
+        for slot, recognizer in enumerate(self.recognizers):
+            if slot_ids[slot] != self._track_ids[slot]:
+                # Track ended or the slot now holds another hand
+                recognizer.reset()
+                self._track_ids[slot] = slot_ids[slot]
+            label = recognizer.update_hand(hands[slot], timestamp)
+            if label:
+                labels.append(label)
+        return labels
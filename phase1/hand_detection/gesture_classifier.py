@@ -1,13 +1,82 @@
 import math
 import time
 
+import numpy as np
+
+from config.gesture_map import GESTURE_FINGER_PATTERNS
+
 TIP_IDS = [4, 8, 12, 16, 20]
+FINGER_TIPS = [8, 12, 16, 20]
+FINGER_PIPS = [6, 10, 14, 18]
+
+
+def build_gesture_lut(patterns):
+    """
+    32-entry gesture table indexed by a 5-bit finger code (bit 0 = thumb ... bit 4 = pinky).
+    Codes without a gesture map to UNKNOWN.
+    """
+    lut = np.full(32, "UNKNOWN", dtype=object)
+    for gesture, fingers in patterns.items():
+        code = sum(state << i for i, state in enumerate(fingers))
+        if lut[code] != "UNKNOWN":
+            raise ValueError(f"{gesture} has the same finger pattern as {lut[code]}")
+        lut[code] = gesture
+    return lut
+
+
+GESTURE_LUT = build_gesture_lut(GESTURE_FINGER_PATTERNS)
+
+
+def finger_margins(points, frame_shape=None):
+    """
+    Pixels by which each finger clears its "up" threshold: (..., 21, 2|3) -> (..., 5).
+    Positive means up. Same thresholds as GestureClassifier._get_finger_states.
+
+    points are pixel coordinates, or normalized landmarks when frame_shape
+    is given (converted and truncated the same way as extract_landmarks).
+    """
+    xy = np.asarray(points)[..., :2]
+    if frame_shape is not None:
+        h, w = frame_shape[:2]
+        xy = (xy * np.array([w, h], dtype=np.float64)).astype(np.int32)
+
+    margins = np.empty(xy.shape[:-2] + (5,), dtype=xy.dtype)
+    margins[..., 0] = (xy[..., 3, 0] - 15) - xy[..., 4, 0]
+    margins[..., 1:] = (xy[..., FINGER_PIPS, 1] - 25) - xy[..., FINGER_TIPS, 1]
+    return margins
+
+
+def finger_states(points, frame_shape=None):
+    """Finger states for a batch of hands: (..., 21, 2|3) -> (..., 5) bool, see finger_margins"""
+    return finger_margins(points, frame_shape) > 0
+
+
+def rule_confidence(margins, scale=20.0):
+    """0..1 per hand: how far the least certain finger is from flipping, relative to scale pixels"""
+    return np.clip(np.abs(margins).min(axis=-1) / scale, 0.0, 1.0)
+
+
+def finger_codes(states):
+    """Pack (..., 5) finger states into uint8 codes, bit 0 = thumb"""
+    return np.packbits(states, axis=-1, bitorder="little")[..., 0]
+
+
+def hands_present(points, min_landmark_distance=40):
+    """GestureClassifier.is_hand_present for (N, 21, 2) pixel landmarks at once"""
+    points = np.asarray(points)
+    return np.linalg.norm(points[:, 12, :2] - points[:, 0, :2], axis=-1) > min_landmark_distance
+
 
 class GestureClassifier:
-    def __init__(self):
+    def __init__(self, model_path=None):
         self.last_gesture = None
         self.gesture_start_time = 0
         self.min_hold_time = 1.0  # Minimum time to hold gesture before recognition
+        # Optional learned k-NN model (see train_classifier.py) replacing the finger-state rules
+        self.model = None
+        if model_path:
+            from hand_detection.learned_classifier import KnnGestureModel
+            self.model = KnnGestureModel.load(model_path)
         
     def _calculate_distance(self, point1, point2):
         return math.sqrt((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)
@@ -33,7 +102,7 @@ class GestureClassifier:
             fingers.append(0)
 
         # Other fingers: compare tip with PIP joint
-        for tip_id, pip_id in zip([8, 12, 16, 20], [6, 10, 14, 18]):
+        for tip_id, pip_id in zip(FINGER_TIPS, FINGER_PIPS):
             tip = lm_list[tip_id]
             pip = lm_list[pip_id]
             
@@ -45,40 +114,43 @@ class GestureClassifier:
 
         return fingers
 
-    def classify(self, lm_list, current_time):
+    def recognize(self, lm_list):
         """
-        Gesture classification with hold-time requirement
+        Gesture for a single frame, without the hold-time requirement
         """
-        if not lm_list or len(lm_list) != 21:
+        if lm_list is None or len(lm_list) != 21:
             return None
+        if self.model is not None:
+            return self.model.classify(np.asarray(lm_list))[()]
 
         fingers = self._get_finger_states(lm_list)
 
-        # Determine current gesture
-        if fingers == [0, 0, 0, 0, 0]:
-            new_gesture = "FIST"
-        elif fingers == [1, 1, 1, 1, 1]:
-            new_gesture = "OPEN_HAND"
-        elif fingers == [1, 0, 0, 0, 0]:
-            new_gesture = "THUMBS_UP"
-        elif fingers == [0, 1, 0, 0, 0]:
-            new_gesture = "POINT"
-        elif fingers == [0, 1, 1, 0, 0]:
-            new_gesture = "VICTORY"
-        elif fingers == [0, 1, 1, 1, 0]:
-            new_gesture = "THREE"
-        elif fingers == [0, 0, 1, 1, 1]:
-            new_gesture = "AWESOME"
-        elif fingers == [0, 1, 1, 1, 1]:
-            new_gesture = "FOUR"
-        elif fingers == [1, 1, 0, 0, 1]:
-            new_gesture = "LOVE_YOU"
-        elif fingers == [0, 0, 0, 0, 1]:
-            new_gesture = "PINKY_UP"
-        elif fingers == [1, 0, 0, 0, 1]:
-            new_gesture = "SHAKA"
-        else:
-            new_gesture = "UNKNOWN"
+        code = sum(state << i for i, state in enumerate(fingers))
+        return GESTURE_LUT[code]
+
+    def recognize_batch(self, points, frame_shape=None, return_confidence=False):
+        """
+        Gestures for many hands at once, without the hold-time requirement.
+        points: (..., 21, 2|3) array, see finger_states. Returns an object
+        array of gesture names with the leading shape of points, plus a 0..1
+        confidence array when return_confidence is set (k-NN vote share,
+        or finger threshold margin for the rules).
+        """
+        if self.model is not None:
+            return self.model.classify(points, frame_shape, return_confidence)
+        margins = finger_margins(points, frame_shape)
+        names = GESTURE_LUT[finger_codes(margins > 0)]
+        if return_confidence:
+            return names, rule_confidence(margins)
+        return names
+
+    def classify(self, lm_list, current_time):
+        """
+        Gesture classification with hold-time requirement
+        """
+        new_gesture = self.recognize(lm_list)
+        if new_gesture is None:
+            return None
 
         # Check if gesture has changed
         if new_gesture != self.last_gesture:
@@ -97,7 +169,7 @@ class GestureClassifier:
         """
         Check if a valid hand is present
         """
-        if not lm_list or len(lm_list) != 21:
+        if lm_list is None or len(lm_list) != 21:
             return False
         
         wrist = lm_list[0]
@@ -0,0 +1,158 @@
+# Turns per-frame gesture labels into GestureStarted / GestureCommitted /
+# GestureEnded events.
+#
+# Every slot (one per tracked hand, see HandTracker) keeps the labels of its
+# last `window` frames in a ring plus a running vote count per gesture, so
+# a frame costs O(1) per slot no matter how long the window is, and all
+# slots update together. A gesture starts once it holds start_ratio of the
+# votes and ends when it falls below release_ratio (hysteresis), so a
+# flickering frame or two never resets anything. It commits - the moment
+# to speak - once it has commit_ratio of the votes for commit_time seconds,
+# or right away when the classifier is confident enough.
+
+from collections import namedtuple
+
+import numpy as np
+
+GestureStarted = namedtuple("GestureStarted", "gesture slot timestamp")
+GestureCommitted = namedtuple("GestureCommitted", "gesture slot timestamp")
+GestureEnded = namedtuple("GestureEnded", "gesture slot timestamp")
+
+
+class GestureDebouncer:
+    """
+    Sliding-window vote debouncer, one state per slot.
+
+    update() takes one label per slot each frame (None for no hand or no
+    gesture; UNKNOWN counts the same) and returns the events of that frame.
+    Latency targets: a clean gesture starts after start_ratio * window
+    frames and commits commit_time seconds later; with confidences given,
+    an average confidence of early_commit_confidence or more skips the
+    commit_time wait (None disables early commits).
+    """
+
+    def __init__(self, slots=1, window=8, start_ratio=0.5, release_ratio=0.3, commit_ratio=0.75,
+                 commit_time=0.25, early_commit_confidence=0.9):
+        if not 0 < release_ratio < start_ratio <= commit_ratio <= 1:
+            raise ValueError("Need 0 < release_ratio < start_ratio <= commit_ratio <= 1")
+        self.slots = slots
+        self.window = window
+        self.start_ratio = start_ratio
+        self.release_ratio = release_ratio
+        self.commit_ratio = commit_ratio
+        self.commit_time = commit_time
+        self.early_commit_confidence = early_commit_confidence
+
+        # Vote class 0 is "no gesture"; others are added as labels show up
+        self.classes = [None]
+        self._class_index = {None: 0, "UNKNOWN": 0}
+        self._rows = np.arange(slots)
+        self._ring = np.zeros((slots, window), dtype=np.intp)
+        self._confidence_ring = np.zeros((slots, window))
+        self._counts = np.zeros((slots, 1), dtype=np.int32)
+        self._confidence_sums = np.zeros((slots, 1))
+        self._head = 0
+
+        self._candidate = np.zeros(slots, dtype=np.intp)
+        self._started_at = np.zeros(slots)
+        self._committed = np.zeros(slots, dtype=bool)
+        self.progress = np.zeros(slots)  # commit progress 0..1 of the current gesture per slot
+        self.reset()
+
+    def reset(self, slots=None, timestamp=None):
+        """
+        Forget the votes of some slots (all by default), e.g. when a slot
+        now holds a different hand. Returns GestureEnded for gestures cut short.
+        """
+        slots = self._rows if slots is None else np.asarray(slots, dtype=np.intp)
+        events = [GestureEnded(self.classes[c], int(s), timestamp)
+                  for s, c in zip(slots.tolist(), self._candidate[slots].tolist()) if c]
+        self._ring[slots] = 0
+        self._confidence_ring[slots] = 0.0
+        self._counts[slots] = 0
+        self._counts[slots, 0] = self.window
+        self._confidence_sums[slots] = 0.0
+        self._candidate[slots] = 0
+        self._committed[slots] = False
+        self.progress[slots] = 0.0
+        return events
+
+    def _vote_classes(self, labels):
+        """Vote class per label, registering new gestures"""
+        indices = np.empty(len(labels), dtype=np.intp)
+        for i, label in enumerate(labels):
+            index = self._class_index.get(label)
+            if index is None:
+                index = self._class_index[label] = len(self.classes)
+                self.classes.append(label)
+            indices[i] = index
+        grow = len(self.classes) - self._counts.shape[1]
+        if grow > 0:
+            self._counts = np.pad(self._counts, ((0, 0), (0, grow)))
+            self._confidence_sums = np.pad(self._confidence_sums, ((0, 0), (0, grow)))
+        return indices
+
+    @property
+    def gestures(self):
+        """Current gesture per slot (started, maybe not committed), or None"""
+        return np.array(self.classes, dtype=object)[self._candidate]
+
+    @property
+    def active(self):
+        """True per slot that has a current gesture"""
+        return self._candidate > 0
+
+    @property
+    def committed(self):
+        """True per slot whose current gesture has committed"""
+        return self._committed & (self._candidate > 0)
+
+    def update(self, labels, timestamp, confidences=None):
+        """
+        labels: one gesture label (or None) per slot. confidences: optional
+        0..1 per slot for early commits. Returns this frame's events.
+        """
+        votes = self._vote_classes(labels)
+        confidence = np.zeros(self.slots) if confidences is None else np.asarray(confidences, dtype=np.float64)
+        rows, head = self._rows, self._head
+
+        # Slide the window: the oldest vote leaves, the new one enters
+        oldest = self._ring[:, head]
+        self._counts[rows, oldest] -= 1
+        self._confidence_sums[rows, oldest] -= self._confidence_ring[:, head]
+        self._counts[rows, votes] += 1
+        self._confidence_sums[rows, votes] += confidence
+        self._ring[:, head] = votes
+        self._confidence_ring[:, head] = confidence
+        self._head = (head + 1) % self.window
+
+        share = self._counts / self.window
+        leader = share.argmax(axis=1)
+        candidate = self._candidate
+        switch = (leader != candidate) & (share[rows, leader] >= self.start_ratio)
+        ended = (candidate > 0) & (switch | (share[rows, candidate] < self.release_ratio))
+        started = switch & (leader > 0)
+
+        events = [GestureEnded(self.classes[c], int(s), timestamp)
+                  for s, c in zip(np.flatnonzero(ended).tolist(), candidate[ended].tolist())]
+        candidate[ended] = 0
+        candidate[started] = leader[started]
+        self._started_at[started] = timestamp
+        self._committed[ended | started] = False
+        events += [GestureStarted(self.classes[c], int(s), timestamp)
+                   for s, c in zip(np.flatnonzero(started).tolist(), candidate[started].tolist())]
+
+        held = timestamp - self._started_at
+        counts = self._counts[rows, candidate]
+        mean_confidence = self._confidence_sums[rows, candidate] / np.maximum(counts, 1)
+        early = self.early_commit_confidence
+        ready = (held >= self.commit_time) | (mean_confidence >= (np.inf if early is None else early))
+        commit = (candidate > 0) & ~self._committed & (share[rows, candidate] >= self.commit_ratio) & ready
+        self._committed |= commit
+        events += [GestureCommitted(self.classes[c], int(s), timestamp)
+                   for s, c in zip(np.flatnonzero(commit).tolist(), candidate[commit].tolist())]
+
+        timing = np.minimum(held / self.commit_time, 1.0) if self.commit_time > 0 else 1.0
+        progress = np.minimum(timing, share[rows, candidate] / self.commit_ratio)
+        self.progress = np.where(self._committed, 1.0, np.where(candidate > 0, progress, 0.0))
+        return events
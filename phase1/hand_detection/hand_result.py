@@ -0,0 +1,93 @@
+import numpy as np
+
+EMPTY_LANDMARKS = np.empty((0, 21, 3), dtype=np.float32)
+EMPTY_LANDMARKS.flags.writeable = False
+
+
+def to_landmark_list(lm_array):
+    """NormalizedLandmarkList protobuf from a (21, 3) array, for mp drawing utils and old callers"""
+    from mediapipe.framework.formats import landmark_pb2
+
+    return landmark_pb2.NormalizedLandmarkList(
+        landmark=[landmark_pb2.NormalizedLandmark(x=x, y=y, z=z) for x, y, z in lm_array.tolist()])
+
+
+def to_pixels(landmarks, frame_shape):
+    """(..., 21, 2) int32 pixel coordinates of normalized landmarks, truncated like extract_landmarks"""
+    h, w = frame_shape[:2]
+    return (landmarks[..., :2] * np.array([w, h], dtype=np.float64)).astype(np.int32)
+
+
+class HandResult:
+    """
+    All hands found in one frame.
+
+    landmarks is an (N, 21, 3) float32 array of normalized x, y, z; labels and
+    scores hold the handedness per hand in the same order. Pixel coordinates
+    are computed for every hand at once on first access.
+
+    Indexing or iterating yields NormalizedLandmarkList protobufs, so code
+    written against the old list-of-protobufs return value keeps working;
+    len() and truth testing count hands.
+
+    track_ids, track_slots and new_tracks are filled in by HandTracker.update.
+    """
+
+    __slots__ = ("landmarks", "labels", "scores", "frame_shape", "track_ids", "track_slots", "new_tracks",
+                 "_pixels", "_landmark_lists")
+
+    def __init__(self, landmarks, labels, scores, frame_shape):
+        self.landmarks = landmarks
+        self.labels = labels
+        self.scores = scores
+        self.frame_shape = frame_shape
+        self.track_ids = None
+        self.track_slots = None
+        self.new_tracks = None
+        self._pixels = None
+        self._landmark_lists = None
+
+    @classmethod
+    def empty(cls, frame_shape):
+        return cls(EMPTY_LANDMARKS, [], np.empty(0, dtype=np.float32), frame_shape)
+
+    @classmethod
+    def from_handedness(cls, landmarks, handedness, frame_shape):
+        """Build from an (N, 21, 3) array and a list of (label, score)"""
+        labels = [label for label, _ in handedness]
+        scores = np.array([score for _, score in handedness], dtype=np.float32)
+        return cls(landmarks, labels, scores, frame_shape)
+
+    @property
+    def handedness(self):
+        """(label, score) per hand"""
+        return list(zip(self.labels, self.scores.tolist()))
+
+    @property
+    def pixels(self):
+        """(N, 21, 2) int32 pixel coordinates, truncated like extract_landmarks"""
+        if self._pixels is None:
+            self._pixels = to_pixels(self.landmarks, self.frame_shape)
+        return self._pixels
+
+    def pixel_list(self, index):
+        """Same output as extract_landmarks for one hand: 21 (x, y) int tuples"""
+        return [tuple(point) for point in self.pixels[index].tolist()]
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def __bool__(self):
+        return len(self.landmarks) > 0
+
+    def __getitem__(self, index):
+        if self._landmark_lists is None:
+            self._landmark_lists = [None] * len(self.landmarks)
+        landmark_list = self._landmark_lists[index]
+        if landmark_list is None:
+            landmark_list = to_landmark_list(self.landmarks[index])
+            self._landmark_lists[index] = landmark_list
+        return landmark_list
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self.landmarks)))
@@ -0,0 +1,112 @@
+# Stable hand IDs across frames for multi-hand use.
+#
+# Detections are matched to tracks on wrist position plus handedness with
+# an optimal assignment. max_hands is tiny (2-4), so every assignment is
+# enumerated and scored in one NumPy operation instead of running the
+# Hungarian algorithm. Tracks live in fixed slots so per-hand state
+# elsewhere (hold timers, spoken gestures) can be kept in plain arrays
+# indexed by slot.
+
+from itertools import permutations
+
+import numpy as np
+
+
+class HandTracker:
+    """
+    Assigns a track ID and slot to every hand of a HandResult.
+
+    After update(), the result carries track_ids (stable per hand, never
+    reused), track_slots (index into per-track state arrays, reused once a
+    track is dropped) and new_tracks (True where the slot's state belongs
+    to a different hand now and must be reset).
+    """
+
+    def __init__(self, max_tracks=2, max_distance=0.2, handedness_penalty=0.15, max_missed=5,
+                 aspect_ratio=16 / 9):
+        self.max_tracks = max_tracks
+        self.max_distance = max_distance              # frame heights a wrist may move between frames
+        self.handedness_penalty = handedness_penalty  # added cost when the handedness label flips
+        self.max_missed = max_missed                  # frames a track survives without a detection
+        self.aspect_ratio = aspect_ratio              # frame width / height, makes x and y the same unit
+
+        self.slot_ids = np.full(max_tracks, -1)       # -1 = free slot
+        self.wrists = np.zeros((max_tracks, 2), dtype=np.float32)
+        self.labels = np.full(max_tracks, None, dtype=object)
+        self.missed = np.zeros(max_tracks, dtype=np.int32)
+        self._next_id = 1
+        # (n_hands, n_tracks) -> every ordered way to pair them
+        self._assignments = {}
+
+    def _candidates(self, hands, tracks):
+        """(P, min(hands, tracks)) indices into the larger side, one row per way to pair them"""
+        key = (hands, tracks)
+        if key not in self._assignments:
+            pairs = min(hands, tracks)
+            rows = list(permutations(range(max(hands, tracks)), pairs))
+            self._assignments[key] = np.array(rows, dtype=np.intp).reshape(-1, pairs)
+        return self._assignments[key]
+
+    def _match(self, cost):
+        """Optimal (hand, track) pairs for an (n, m) cost matrix; pairs above max_distance are dropped"""
+        n, m = cost.shape
+        if not n or not m:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        # Leaving a hand unmatched costs max_distance, so far pairs never win over a new track
+        capped = np.minimum(cost, self.max_distance)
+        candidates = self._candidates(n, m)
+        if n <= m:
+            hands = np.broadcast_to(np.arange(n), candidates.shape)
+            tracks = candidates
+        else:
+            hands = candidates
+            tracks = np.broadcast_to(np.arange(m), candidates.shape)
+        best = np.argmin(capped[hands, tracks].sum(axis=1))
+        hands, tracks = hands[best], tracks[best]
+        keep = cost[hands, tracks] < self.max_distance
+        return hands[keep], tracks[keep]
+
+    def update(self, result):
+        """Match the hands of a HandResult to tracks; sets and returns result.track_ids"""
+        count = len(result)
+        wrists = result.landmarks[:, 0, :2] * np.array([self.aspect_ratio, 1.0], dtype=np.float32)
+        labels = np.array(result.labels, dtype=object)
+
+        active = np.flatnonzero(self.slot_ids >= 0)
+        cost = np.linalg.norm(wrists[:, None] - self.wrists[active][None], axis=2)
+        cost += self.handedness_penalty * (labels[:, None] != self.labels[active][None])
+        hand_idx, track_idx = self._match(cost)
+
+        slots = np.full(count, -1, dtype=np.intp)
+        slots[hand_idx] = active[track_idx]
+        unmatched = np.setdiff1d(active, slots[hand_idx], assume_unique=True)
+        self.missed[unmatched] += 1
+        self.slot_ids[unmatched[self.missed[unmatched] > self.max_missed]] = -1
+
+        new_tracks = slots < 0
+        if new_tracks.any():
+            # Free slots first, then the tracks missing longest
+            spare = np.setdiff1d(np.arange(self.max_tracks), slots[hand_idx], assume_unique=True)
+            spare = spare[np.lexsort((-self.missed[spare], self.slot_ids[spare] >= 0))]
+            fresh = spare[:new_tracks.sum()]
+            new_hands = np.flatnonzero(new_tracks)[:len(fresh)]
+            slots[new_hands] = fresh
+            self.slot_ids[fresh] = np.arange(self._next_id, self._next_id + len(fresh))
+            self._next_id += len(fresh)
+
+        # More hands than slots: the extras stay untracked (slot -1)
+        tracked = slots >= 0
+        self.wrists[slots[tracked]] = wrists[tracked]
+        self.labels[slots[tracked]] = labels[tracked]
+        self.missed[slots[tracked]] = 0
+
+        result.track_slots = slots
+        result.track_ids = np.where(tracked, self.slot_ids[slots], -1)
+        result.new_tracks = new_tracks & tracked
+        return result.track_ids
+
+    def reset(self):
+        """Drop every track, e.g. after a long pause"""
+        self.slot_ids.fill(-1)
+        self.missed.fill(0)
+        self.labels.fill(None)
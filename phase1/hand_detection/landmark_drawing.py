@@ -0,0 +1,147 @@
+# Vectorized hand landmark drawing.
+#
+# Draws the picture mp.solutions drawing_utils draws with the default hand
+# styles, straight from the (N, 21, 3) normalized landmark arrays: pixel
+# positions for all hands are computed at once, the skeleton is drawn as one
+# polyline per finger (plus the palm) with one cv2.polylines call per color
+# for every hand, and the landmark dots are written from a pre-rendered
+# stamp through flat pixel indices instead of two cv2.circle calls each.
+# All skeletons are drawn before all dots, so where two hands overlap the
+# dots stay on top (drawing_utils finishes one hand before the next).
+
+import cv2
+import numpy as np
+
+QUALITY_LEVELS = ("full", "skeleton", "off")
+
+# mp.solutions.drawing_styles default hand style (BGR)
+WHITE = (224, 224, 224)
+DOT_RADIUS = 5
+# The palm outline 1-0-5-9-13-17-0 and each finger from its base to the tip;
+# together they are mp.solutions.hands.HAND_CONNECTIONS. (landmarks, line color, line thickness, dot color)
+CHAINS = (
+    ((1, 0, 5, 9, 13, 17, 0), (128, 128, 128), 3, (48, 48, 255)),   # palm: gray lines, red dots
+    ((1, 2, 3, 4), (180, 229, 255), 2, (180, 229, 255)),             # thumb, peach
+    ((5, 6, 7, 8), (128, 64, 128), 2, (128, 64, 128)),               # index, purple
+    ((9, 10, 11, 12), (0, 204, 255), 2, (0, 204, 255)),              # middle, yellow
+    ((13, 14, 15, 16), (48, 255, 48), 2, (48, 255, 48)),             # ring, green
+    ((17, 18, 19, 20), (192, 101, 21), 2, (192, 101, 21)),           # pinky, blue
+)
+
+
+def dot_colors():
+    """(21, 3) dot color per landmark; a finger base keeps the palm color"""
+    colors = np.empty((21, 3), np.uint8)
+    for chain, _, _, color in CHAINS[1:]:
+        colors[list(chain)] = color
+    palm, _, _, color = CHAINS[0]
+    colors[list(palm)] = color
+    return colors
+
+
+class LandmarkRenderer:
+    """
+    quality "full" draws the skeleton and the landmark dots, "skeleton" only
+    the lines, "off" nothing. Landmarks outside the frame are skipped along
+    with their connections, like drawing_utils does.
+
+    "skeleton" is the default: with one hand, the lines cost about as much
+    as drawing_utils' own, so only skipping the dots makes drawing cheap.
+    """
+
+    def __init__(self, quality="skeleton"):
+        if quality not in QUALITY_LEVELS:
+            raise ValueError(f"Unknown drawing quality: {quality} (expected one of {QUALITY_LEVELS})")
+        self.quality = quality
+        self.chains = [(np.array(chain), np.array(list(zip(chain[:-1], chain[1:]))), color, thickness)
+                       for chain, color, thickness, _ in CHAINS]
+
+        # Dot stamp: a white disk of radius 6 under a colored one of radius 5, as
+        # drawing_utils draws each landmark. Kept as pixel offsets from the center
+        # and the stamp's colors for every landmark, channels flattened.
+        self.stamp_radius = border = max(DOT_RADIUS + 1, int(DOT_RADIUS * 1.2))
+        size = 2 * border + 1
+        outer = np.zeros((size, size), np.uint8)
+        inner = np.zeros((size, size), np.uint8)
+        cv2.circle(outer, (border, border), border, 255, -1)
+        cv2.circle(inner, (border, border), DOT_RADIUS, 255, -1)
+        rows, cols = np.nonzero(outer)
+        self.stamp_offsets = np.stack([rows - border, cols - border], axis=1).astype(np.int32)
+        filled = inner[rows, cols] > 0
+        colors = np.where(filled[None, :, None], dot_colors()[:, None, :], np.array(WHITE, np.uint8))
+        self.stamp_colors = colors.astype(np.uint8).reshape(21, -1)
+        self._stamp_width = None
+        self._stamp_index = None  # flat byte offsets of every stamp channel, for frames _stamp_width wide
+
+    @staticmethod
+    def pixel_coordinates(landmarks, frame_shape, mirror=False):
+        """
+        (N, 21, 2) int32 pixel x, y and an (N, 21) mask of landmarks inside
+        the frame; truncated and clamped like drawing_utils
+        """
+        height, width = frame_shape[:2]
+        xy = landmarks[..., :2].astype(np.float64)
+        if mirror:
+            xy[..., 0] = 1.0 - xy[..., 0]
+        visible = ((xy >= 0.0) & (xy <= 1.0)).all(axis=-1)
+        pixels = np.floor(xy * (width, height)).astype(np.int32)
+        np.minimum(pixels, (width - 1, height - 1), out=pixels)
+        return pixels, visible
+
+    def draw(self, frame, landmarks, mirror=False):
+        """
+        Draw (N, 21, 3) normalized landmarks onto frame in place; mirror flips
+        x, for landmarks that were mirrored while the frame was not
+        """
+        if self.quality == "off" or not len(landmarks):
+            return frame
+        pixels, visible = self.pixel_coordinates(landmarks, frame.shape, mirror)
+        whole = visible.all(axis=1)
+        if whole.all():
+            partial = None
+        else:
+            # Hands partly outside the frame are drawn segment by segment, skipping hidden ends
+            pixels, partial, visible = pixels[whole], pixels[~whole], visible[~whole]
+
+        # One polylines call per color, one polyline per hand
+        for chain, pairs, color, thickness in self.chains:
+            lines = np.ascontiguousarray(pixels[:, chain])
+            if partial is not None:
+                shown = visible[:, pairs].all(axis=-1)
+                lines = list(lines) + list(partial[:, pairs][shown])
+            if len(lines):
+                cv2.polylines(frame, lines, False, color, thickness)
+
+        if self.quality == "full":
+            indices = np.tile(np.arange(21), len(pixels))
+            pixels = pixels.reshape(-1, 2)
+            if partial is not None:
+                pixels = np.concatenate([pixels, partial[visible]])
+                indices = np.concatenate([indices, np.nonzero(visible)[1]])
+            if len(pixels):
+                self._draw_dots(frame, pixels, indices)
+        return frame
+
+    def _draw_dots(self, frame, pixels, indices):
+        """Stamp a dot at each (x, y) in pixels; indices are the landmark numbers, for the colors"""
+        frame_height, frame_width = frame.shape[:2]
+        colors = self.stamp_colors[indices]
+        radius = self.stamp_radius
+        low, high = pixels.min(axis=0), pixels.max(axis=0)
+        inside = (low >= radius).all() and high[0] < frame_width - radius and high[1] < frame_height - radius
+        if frame.flags.c_contiguous and inside:
+            # Every stamp lies inside the frame: one flat index per channel
+            if self._stamp_width != frame_width:
+                offsets = (self.stamp_offsets[:, 0] * frame_width + self.stamp_offsets[:, 1]) * 3
+                self._stamp_index = (offsets[:, None] + np.arange(3)).reshape(-1).astype(np.intp)
+                self._stamp_width = frame_width
+            # Platform-size indices: numpy would convert int32 ones on every assignment
+            targets = (pixels[:, 1].astype(np.intp) * frame_width + pixels[:, 0]) * 3
+            # Later dots cover earlier ones: fancy assignment keeps the last write
+            frame.reshape(-1)[targets[:, None] + self._stamp_index] = colors
+            return
+        # Near the border, or a view into a larger image: (row, col) pairs, clipped
+        rows = pixels[:, 1, None] + self.stamp_offsets[:, 0]
+        cols = pixels[:, 0, None] + self.stamp_offsets[:, 1]
+        keep = (rows >= 0) & (rows < frame_height) & (cols >= 0) & (cols < frame_width)
+        frame[rows[keep], cols[keep]] = colors.reshape(len(pixels), -1, 3)[keep]
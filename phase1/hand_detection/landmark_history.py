@@ -0,0 +1,93 @@
+import numpy as np
+
+
+class LandmarkHistory:
+    """
+    Fixed-size history of per-frame landmarks for temporal features.
+
+    Stores up to capacity frames of (max_hands, 21, 3) normalized landmarks
+    with their timestamps in preallocated arrays. Every frame is written
+    twice, at i and i + capacity, so any window of the most recent frames is
+    one contiguous slice: windows are returned as views, oldest first, and
+    appending never allocates. Hand slots with no hand hold NaN.
+
+    Views stay valid until the frames they cover are overwritten, i.e. for
+    capacity - n more appends; copy them to keep them longer.
+    """
+
+    def __init__(self, capacity=60, max_hands=2):
+        self.capacity = capacity
+        self.max_hands = max_hands
+        self._landmarks = np.full((2 * capacity, max_hands, 21, 3), np.nan, dtype=np.float32)
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._hand_counts = np.zeros(2 * capacity, dtype=np.int8)
+        self._next = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def reset(self):
+        self._landmarks.fill(np.nan)
+        self._timestamps.fill(0.0)
+        self._hand_counts.fill(0)
+        self._next = 0
+        self.count = 0
+
+    def append(self, landmarks, timestamp):
+        """Store one frame: an (N, 21, 3) landmark array (N may be 0) taken at timestamp"""
+        num_hands = min(len(landmarks), self.max_hands)
+        for index in (self._next, self._next + self.capacity):
+            frame = self._landmarks[index]
+            frame[:num_hands] = landmarks[:num_hands]
+            frame[num_hands:] = np.nan
+            self._timestamps[index] = timestamp
+            self._hand_counts[index] = num_hands
+
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _window(self, n):
+        end = self._next + self.capacity
+        return slice(end - min(n, self.count), end)
+
+    def last(self, n):
+        """(landmarks, timestamps) views of the newest n frames: (n, hands, 21, 3) and (n,)"""
+        window = self._window(n)
+        return self._landmarks[window], self._timestamps[window]
+
+    def last_seconds(self, seconds):
+        """(landmarks, timestamps) views of the frames within seconds of the newest one"""
+        if not self.count:
+            return self.last(0)
+        _, timestamps = self.last(self.count)
+        first = np.searchsorted(timestamps, timestamps[-1] - seconds, side="left")
+        return self.last(self.count - first)
+
+    def latest(self):
+        """(max_hands, 21, 3) view of the newest frame, or None when empty"""
+        if not self.count:
+            return None
+        return self._landmarks[self._next + self.capacity - 1]
+
+    def hand_counts(self, n):
+        """Number of hands in each of the newest n frames"""
+        return self._hand_counts[self._window(n)]
+
+    def velocity(self, n):
+        """
+        Per-landmark velocity over the newest n frames: (n - 1, hands, 21, 3)
+        in normalized units per second. NaN where a hand was missing.
+        """
+        landmarks, timestamps = self.last(n)
+        dt = np.diff(timestamps)
+        dt[dt <= 0] = np.nan
+        return np.diff(landmarks, axis=0) / dt[:, None, None, None].astype(np.float32)
+
+    def acceleration(self, n):
+        """Per-landmark acceleration over the newest n frames: (n - 2, hands, 21, 3), units per second^2"""
+        _, timestamps = self.last(n)
+        velocity = self.velocity(n)
+        dt = (timestamps[2:] - timestamps[:-2]) / 2
+        dt[dt <= 0] = np.nan
+        return np.diff(velocity, axis=0) / dt[:, None, None, None].astype(np.float32)
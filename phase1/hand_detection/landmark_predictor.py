@@ -0,0 +1,59 @@
+import numpy as np
+
+
+class LandmarkPredictor:
+    """
+    Constant-velocity predictor for hand landmarks.
+
+    An alpha-beta filter (the steady-state form of a constant-velocity Kalman
+    filter) run on the whole (hands, 21, 3) array at once, so an update or a
+    prediction is a handful of NumPy operations regardless of hand count.
+    Coordinates are MediaPipe-normalized, velocities are units per second.
+    """
+
+    def __init__(self, alpha=0.9, beta=0.4):
+        self.alpha = alpha  # how much of the measurement residual goes into position
+        self.beta = beta    # how much goes into velocity
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.velocity = None
+        self.last_time = None
+
+    @property
+    def is_tracking(self):
+        return self.position is not None
+
+    def update(self, measured, timestamp):
+        """Fold in a measured (hands, 21, 3) landmark array taken at timestamp"""
+        measured = np.asarray(measured, dtype=np.float32)
+
+        # Hand count changed - start over rather than mix up hands
+        if self.position is None or self.position.shape != measured.shape:
+            self.position = measured.copy()
+            self.velocity = np.zeros_like(measured)
+            self.last_time = timestamp
+            return
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            self.position[...] = measured
+            return
+
+        predicted = self.position + self.velocity * dt
+        residual = measured - predicted
+        self.position = predicted + self.alpha * residual
+        self.velocity += (self.beta / dt) * residual
+        self.last_time = timestamp
+
+    def predict(self, timestamp):
+        """Extrapolated (hands, 21, 3) landmarks at timestamp"""
+        dt = max(timestamp - self.last_time, 0.0)
+        return self.position + self.velocity * dt
+
+    def speed(self):
+        """Mean image-plane landmark speed in normalized units per second"""
+        if self.velocity is None:
+            return 0.0
+        return float(np.linalg.norm(self.velocity[..., :2], axis=-1).mean())
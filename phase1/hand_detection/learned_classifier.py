@@ -0,0 +1,141 @@
+# NumPy-only k-nearest-neighbour gesture classifier.
+# Hands are turned into translation/scale/rotation-normalized landmark
+# features, so a tilted hand looks like an upright one, and matched against
+# per-gesture prototypes condensed from recorded data with k-means. The
+# prototypes load memory-mapped from a .npy file; class names and settings
+# live in a JSON file next to it.
+
+import json
+import os
+
+import numpy as np
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "models", "gesture_knn.npy")
+
+
+def landmark_features(points, frame_shape=None):
+    """
+    (..., 21, 2|3) landmarks -> (..., 42) float32 features.
+
+    points are pixel coordinates, or normalized landmarks when frame_shape is
+    given. The wrist moves to the origin and the hand is rotated and scaled
+    so wrist -> middle-finger MCP becomes the unit vector pointing up.
+    """
+    xy = np.asarray(points)[..., :2].astype(np.float32)
+    if frame_shape is not None:
+        h, w = frame_shape[:2]
+        xy = xy * np.array([w, h], dtype=np.float32)
+
+    z = xy[..., 0] + 1j * xy[..., 1]
+    z = z - z[..., :1]
+    reference = z[..., 9:10]
+    reference = np.where(reference == 0, 1, reference)
+    # Complex division rotates and scales in one step; -1j points up in image coordinates
+    z = z * (-1j / reference)
+    return np.concatenate([z.real, z.imag], axis=-1).astype(np.float32)
+
+
+def _kmeans(x, k, rng, iterations=20):
+    """Plain Lloyd's k-means, returns (k, D) centers"""
+    centers = x[rng.choice(len(x), k, replace=False)].copy()
+    for _ in range(iterations):
+        d2 = (x ** 2).sum(1)[:, None] - 2 * x @ centers.T + (centers ** 2).sum(1)
+        assignment = d2.argmin(1)
+        for c in range(k):
+            members = x[assignment == c]
+            if len(members):
+                centers[c] = members.mean(0)
+    return centers
+
+
+class KnnGestureModel:
+    """
+    k-NN over landmark features with a precomputed prototype index.
+
+    Prediction is one (hands x prototypes) matrix product plus a vote among
+    the k nearest prototypes. Hands farther than max_distance from every
+    prototype are UNKNOWN.
+    """
+
+    def __init__(self, prototypes, labels, classes, k=5, max_distance=np.inf):
+        self.prototypes = prototypes  # (M, 42) float32, memory-mapped when loaded from disk
+        self.labels = np.asarray(labels, dtype=np.int16)
+        self.classes = list(classes)
+        self.k = min(k, len(prototypes))
+        self.max_distance = float(max_distance)
+
+        self._names = np.array(self.classes + ["UNKNOWN"], dtype=object)
+        self._sq_norms = (np.asarray(prototypes, dtype=np.float32) ** 2).sum(1)
+        self._class_ids = np.arange(len(self.classes), dtype=np.int16)
+
+    @classmethod
+    def train(cls, features, label_names, prototypes_per_class=32, k=5, seed=0):
+        """Condense each gesture's feature vectors into prototypes and calibrate the UNKNOWN distance"""
+        rng = np.random.default_rng(seed)
+        label_names = np.asarray(label_names)
+        classes = sorted(set(label_names.tolist()))
+
+        prototypes, labels = [], []
+        for class_id, name in enumerate(classes):
+            members = features[label_names == name]
+            if len(members) > prototypes_per_class:
+                members = _kmeans(members, prototypes_per_class, rng)
+            prototypes.append(members)
+            labels.extend([class_id] * len(members))
+        prototypes = np.concatenate(prototypes).astype(np.float32)
+
+        model = cls(prototypes, labels, classes, k)
+        # Training hands sit within this distance of a prototype; allow some slack beyond that
+        distances = np.sqrt(np.maximum(model._distances(features).min(1), 0))
+        model.max_distance = float(np.percentile(distances, 99) * 1.5)
+        return model
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        with open(os.path.splitext(path)[0] + ".json") as f:
+            meta = json.load(f)
+        prototypes = np.load(path, mmap_mode="r")
+        labels = np.array(meta["labels"], dtype=np.int16)
+        return cls(prototypes, labels, meta["classes"], meta["k"], meta["max_distance"])
+
+    def save(self, path=DEFAULT_MODEL_PATH):
+        np.save(path, np.asarray(self.prototypes, dtype=np.float32))
+        meta = {
+            "classes": self.classes,
+            "labels": self.labels.tolist(),
+            "k": self.k,
+            "max_distance": self.max_distance,
+            "features": "wrist-centered, wrist->middle MCP rotated/scaled, pixel space x/y",
+        }
+        with open(os.path.splitext(path)[0] + ".json", "w") as f:
+            json.dump(meta, f, indent=2)
+
+    def _distances(self, features):
+        """Squared distances (N, M) from features to every prototype"""
+        return (self._sq_norms - 2 * features @ self.prototypes.T
+                + (features ** 2).sum(1, keepdims=True))
+
+    def predict(self, features):
+        """(N, 42) features -> (class index per hand, vote share); index len(classes) is UNKNOWN"""
+        d2 = self._distances(features)
+        if self.k < d2.shape[1]:
+            nearest = np.argpartition(d2, self.k - 1, axis=1)[:, :self.k]
+        else:
+            nearest = np.broadcast_to(np.arange(d2.shape[1]), d2.shape)
+
+        votes = (self.labels[nearest][..., None] == self._class_ids).sum(1)
+        best = votes.argmax(1)
+        confidence = votes.max(1) / self.k
+        best[np.sqrt(np.maximum(d2.min(1), 0)) > self.max_distance] = len(self.classes)
+        return best, confidence
+
+    def classify(self, points, frame_shape=None, return_confidence=False):
+        """Gesture names for (..., 21, 2|3) landmarks, same conventions as recognize_batch"""
+        features = landmark_features(points, frame_shape)
+        flat = features.reshape(-1, features.shape[-1])
+        best, confidence = self.predict(flat)
+        names = self._names[best].reshape(features.shape[:-1])
+        if return_confidence:
+            return names, confidence.reshape(features.shape[:-1])
+        return names
@@ -0,0 +1,124 @@
+import time
+
+import cv2
+import numpy as np
+
+ACTIVE = "active"
+IDLE = "idle"
+
+
+class MotionGate:
+    """
+    Suspends hand inference on static scenes.
+
+    After idle_after seconds without a hand the gate goes idle: frames are
+    only checked with a cheap downsampled frame-difference motion detector at
+    idle_fps, and full-rate HandDetector inference resumes as soon as the
+    share of changed pixels crosses motion_threshold.
+    """
+
+    def __init__(self, idle_after=5.0, idle_fps=5, motion_threshold=0.02,
+                 pixel_threshold=25, sample_width=80):
+        self.idle_after = idle_after
+        self.idle_fps = idle_fps
+        self.motion_threshold = motion_threshold
+        self.pixel_threshold = pixel_threshold
+        self.sample_width = sample_width
+
+        self.state = ACTIVE
+        self.last_hand_time = None
+        self.motion_level = 0.0
+        self._previous = None
+        self._sample = None
+        self._gray = None
+        self._diff = None
+
+        # Metrics
+        self.wake_count = 0
+        self.last_wake_latency = None  # seconds from wake-up to first detected hand
+        self._wake_time = None
+        self._state_since = time.time()
+        self._cpu_since = time.process_time()
+        self._wall = {ACTIVE: 0.0, IDLE: 0.0}
+        self._cpu = {ACTIVE: 0.0, IDLE: 0.0}
+
+    @property
+    def is_idle(self):
+        return self.state == IDLE
+
+    def _measure_motion(self, frame):
+        """Share of changed pixels between this and the previous downsampled gray frame"""
+        height, width = frame.shape[:2]
+        sample_height = max(1, round(height * self.sample_width / width))
+        if self._sample is None or self._sample.shape[:2] != (sample_height, self.sample_width):
+            self._sample = np.empty((sample_height, self.sample_width, 3), np.uint8)
+            self._gray = np.empty((sample_height, self.sample_width), np.uint8)
+            self._diff = np.empty_like(self._gray)
+            self._previous = None
+
+        cv2.resize(frame, (self.sample_width, sample_height), dst=self._sample, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._sample, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if self._previous is None:
+            self._previous = self._gray.copy()
+            return 0.0
+
+        cv2.absdiff(self._gray, self._previous, dst=self._diff)
+        self._previous, self._gray = self._gray, self._previous
+        return float(np.count_nonzero(self._diff > self.pixel_threshold)) / self._diff.size
+
+    def _switch(self, state):
+        wall_now, cpu_now = time.time(), time.process_time()
+        self._wall[self.state] += wall_now - self._state_since
+        self._cpu[self.state] += cpu_now - self._cpu_since
+        self._state_since, self._cpu_since = wall_now, cpu_now
+        self.state = state
+
+    def should_infer(self, frame, now):
+        """Call once per frame before detection; False means skip HandDetector"""
+        if self.state == ACTIVE:
+            return True
+
+        self.motion_level = self._measure_motion(frame)
+        if self.motion_level >= self.motion_threshold:
+            self._switch(ACTIVE)
+            self.last_hand_time = now  # give the detector idle_after seconds to find a hand
+            self._wake_time = now
+            self.wake_count += 1
+            return True
+        return False
+
+    def update(self, hands_present, now):
+        """Call once per frame after detection (or after a skipped frame)"""
+        if hands_present:
+            self.last_hand_time = now
+            if self._wake_time is not None:
+                self.last_wake_latency = now - self._wake_time
+                self._wake_time = None
+        elif self.last_hand_time is None:
+            self.last_hand_time = now
+
+        if self.state == ACTIVE and now - self.last_hand_time >= self.idle_after:
+            self._switch(IDLE)
+            self._previous = None
+            self._wake_time = None
+
+    def get_stats(self):
+        """Idle/active state, wake latency and estimated CPU time saved"""
+        wall = dict(self._wall)
+        cpu = dict(self._cpu)
+        wall[self.state] += time.time() - self._state_since
+        cpu[self.state] += time.process_time() - self._cpu_since
+
+        # CPU the idle period would have used at the active rate, minus what it used
+        active_rate = cpu[ACTIVE] / wall[ACTIVE] if wall[ACTIVE] > 0 else 0.0
+        cpu_saved = max(wall[IDLE] * active_rate - cpu[IDLE], 0.0)
+        return {
+            "state": self.state,
+            "motion_level": self.motion_level,
+            "idle_time_s": wall[IDLE],
+            "active_time_s": wall[ACTIVE],
+            "wake_count": self.wake_count,
+            "last_wake_latency_ms": None if self.last_wake_latency is None else self.last_wake_latency * 1000,
+            "cpu_saved_s": cpu_saved,
+        }
@@ -0,0 +1,55 @@
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    """
+    Mirror, downscale and BGR->RGB conversion into reusable buffers.
+
+    Destination buffers are sized on the first frame and only reallocated when
+    the input resolution changes, so the steady-state loop allocates no new
+    frame-sized arrays. Returned arrays are owned by the preprocessor and stay
+    valid until the next call that writes the same buffer.
+    """
+
+    def __init__(self, mirror_pixels=True):
+        # With mirror_pixels=False the pixel flip is skipped entirely and the
+        # detector mirrors landmark x-coordinates instead
+        self.mirror_pixels = mirror_pixels
+        self._buffers = {}
+        self.buffer_allocations = 0
+
+    def _buffer(self, name, shape):
+        """Named destination buffer, reallocated only when the shape changes"""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buffer
+            self.buffer_allocations += 1
+        return buffer
+
+    def mirror(self, frame):
+        """Horizontally flipped frame for display (or the frame itself when not mirroring)"""
+        if not self.mirror_pixels:
+            return frame
+        mirrored = self._buffer("mirror", frame.shape)
+        cv2.flip(frame, 1, dst=mirrored)
+        return mirrored
+
+    def to_rgb(self, image, scale=1.0, name="rgb"):
+        """
+        Read-only RGB copy of image for MediaPipe, optionally downscaled.
+        Read-only lets MediaPipe wrap the buffer instead of copying it.
+        """
+        if scale < 1.0:
+            height, width = image.shape[:2]
+            small_shape = (max(1, round(height * scale)), max(1, round(width * scale)), 3)
+            small = self._buffer(name + "_small", small_shape)
+            cv2.resize(image, (small_shape[1], small_shape[0]), dst=small, interpolation=cv2.INTER_AREA)
+            image = small
+
+        rgb = self._buffer(name, image.shape)
+        rgb.flags.writeable = True
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=rgb)
+        rgb.flags.writeable = False
+        return rgb
@@ -1,152 +1,202 @@
 import cv2
 import time
+from collections import namedtuple
+from functools import lru_cache, partial
+
 import numpy as np
 
+from capture.frame_grabber import FrameGrabber
 from hand_detection.detector import HandDetector
-from hand_detection.landmark_utils import extract_landmarks
-from hand_detection.gesture_classifier import GestureClassifier
+from hand_detection.dynamic_gestures import TrackedGestureRecognizer
+from hand_detection.gesture_classifier import GestureClassifier, hands_present
+from hand_detection.gesture_debouncer import GestureCommitted, GestureDebouncer
+from hand_detection.hand_result import HandResult
+from hand_detection.hand_tracker import HandTracker
+from hand_detection.motion_gate import MotionGate
 from config.gesture_map import GESTURE_TO_TEXT, GESTURE_DISPLAY_NAMES
-from tts.tts_engine_bulletproof import BulletproofTTSEngine as TTSEngine
-
-class AdaptiveDisplayWindow:
-    """Manages adaptive display window with dynamic resizing"""
-    
-    def __init__(self, window_name="Hand Sign Translator"):
-        self.window_name = window_name
-        self.current_scale = 1.0
-        self.target_width = 900  # Initial target width
-        self.target_height = 700  # Initial target height
-        self.is_fullscreen = False
-        
-        # Create resizable window
-        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
-        cv2.resizeWindow(self.window_name, self.target_width, self.target_height)
-        
-        # Set mouse callback for window interaction
-        cv2.setMouseCallback(self.window_name, self.mouse_callback)
-        
-    def mouse_callback(self, event, x, y, flags, param):
-        """Handle mouse events for window interaction"""
-        if event == cv2.EVENT_RBUTTONDOWN:
-            # Right click to toggle fullscreen
-            self.toggle_fullscreen()
-    
-    def toggle_fullscreen(self):
-        """Toggle between windowed and fullscreen mode"""
-        self.is_fullscreen = not self.is_fullscreen
-        if self.is_fullscreen:
-            cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
-        else:
-            cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
-            cv2.resizeWindow(self.window_name, self.target_width, self.target_height)
-    
-    
-    def get_display_size(self, frame_shape):
-        """Calculate display size based on current window size"""
-        # Get current window size
-        window_width = cv2.getWindowImageRect(self.window_name)[2]
-        window_height = cv2.getWindowImageRect(self.window_name)[3]
-        
-        # If window size is invalid, use default targets
-        if window_width <= 0 or window_height <= 0:
-            window_width = self.target_width
-            window_height = self.target_height
-        
-        # Apply current scale
-        display_width = int(window_width * self.current_scale)
-        display_height = int(window_height * self.current_scale)
-        
-        # Maintain aspect ratio of original frame
-        frame_height, frame_width = frame_shape[:2]
-        original_aspect = frame_width / frame_height
-        display_aspect = display_width / display_height
-        
-        if display_aspect > original_aspect:
-            # Window is wider than frame - adjust width
-            display_width = int(display_height * original_aspect)
-        else:
-            # Window is taller than frame - adjust height
-            display_height = int(display_width / original_aspect)
-        
-        # Ensure minimum size
-        display_width = max(display_width, 320)
-        display_height = max(display_height, 240)
-        
-        return display_width, display_height
-    
-    def add_window_controls_overlay(self, frame):
-        """Add overlay with window control instructions"""
-        overlay = frame.copy()
-        overlay_height = 100
-        overlay_y = frame.shape[0] - overlay_height
-        
-        # Create semi-transparent overlay
-        cv2.rectangle(overlay, (0, overlay_y), (frame.shape[1], frame.shape[0]), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
-        
-        # Add control instructions
-        controls = [
-            "WINDOW CONTROLS:",
-            "Drag corners to resize window",
-            f"Current zoom: {self.current_scale:.1f}x",
-            "'Q': Quit"
-        ]
-        
-        for i, text in enumerate(controls):
-            y_pos = overlay_y + 20 + i * 15
-            color = (0, 255, 255) if i == 0 else (200, 200, 200)
-            font_size = 0.5 if i > 0 else 0.6
-            cv2.putText(frame, text, (20, y_pos),
-                       cv2.FONT_HERSHEY_SIMPLEX, font_size, color, 1)
-        
-        return frame
+from pipeline.startup import ParallelStartup
+from tts.speech_cache import SpeechCache
+from tts.tts_worker import TTSWorkerEngine as TTSEngine
+from display.display_thread import DisplayThread
+from display.overlay import TextSprite
+
+FrameLayout = namedtuple("FrameLayout", [
+    "margin_x", "status_scale", "status_thickness", "status_y", "bar_y", "bar_width", "bar_height", "row_height",
+    "prompt_scale", "prompt_thickness", "detected_scale", "detected_thickness", "detected_y",
+    "info_scale", "info_x", "info_y"])
+
+@lru_cache(maxsize=8)
+def frame_layout(frame_width, frame_height, status_rows=1):
+    """Text scales and positions for a frame size, computed once per size instead of every frame"""
+    sx, sy = frame_width / 1280, frame_height / 720
+    return FrameLayout(
+        margin_x=int(30 * sx),
+        status_scale=max(0.5, min(1.5, sx)), status_thickness=max(1, int(frame_width / 640)),
+        status_y=int(50 * sy), bar_y=int(90 * sy), bar_width=int(300 * sx), bar_height=int(20 * sy),
+        row_height=int(80 * sy),
+        prompt_scale=max(0.8, min(2.0, frame_width / 800)), prompt_thickness=max(2, int(frame_width / 400)),
+        # Below the last status row
+        detected_scale=max(0.6, min(1.2, sx)), detected_thickness=max(1, int(frame_width / 640)),
+        detected_y=int((130 + 80 * (status_rows - 1)) * sy),
+        info_scale=max(0.4, min(0.8, frame_width / 1600)), info_x=frame_width - 300, info_y=(30, 55))
+
+def draw_gesture_status(frame, track_ids, gestures, progress, committed):
+    """One status line and commit progress bar per hand with a gesture, stacked top left"""
+    layout = frame_layout(frame.shape[1], frame.shape[0])
+    x, bar_width, bar_height = layout.margin_x, layout.bar_width, layout.bar_height
+
+    multiple = len(gestures) > 1
+    for row, (track_id, gesture, percent, done) in enumerate(
+            zip(track_ids.tolist(), gestures.tolist(), progress.tolist(), committed.tolist())):
+        display_name = GESTURE_DISPLAY_NAMES.get(gesture, gesture)
+        status_text = display_name if done else f"{display_name} ({int(percent * 100)}%)"
+        if multiple:
+            status_text = f"#{track_id} {status_text}"
+        status_color = (0, 255, 0) if done else (82, 267, 54)
+
+        text_y = layout.status_y + row * layout.row_height
+        bar_y = layout.bar_y + row * layout.row_height
+        cv2.putText(frame, status_text, (x, text_y), cv2.FONT_HERSHEY_SIMPLEX,
+                    layout.status_scale, status_color, layout.status_thickness)
+        cv2.rectangle(frame, (x, bar_y), (x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
+        cv2.rectangle(frame, (x, bar_y), (x + int(bar_width * percent), bar_y + bar_height), status_color, -1)
+        cv2.rectangle(frame, (x, bar_y), (x + bar_width, bar_y + bar_height), (255, 255, 255), 1)
+
+# What the camera loop hands to the display thread; drawn at display resolution
+FrameAnnotations = namedtuple("FrameAnnotations", ["landmarks", "status", "detected_text", "info", "info_color",
+                                                   "status_rows"])
+
+def draw_annotations(frame, annotations, window, detector):
+    """Landmarks, gesture status or prompt, spoken text and FPS lines on the resized display frame"""
+    frame_height, frame_width = frame.shape[:2]
+    layout = frame_layout(frame_width, frame_height, annotations.status_rows)
+    detector.draw_landmarks(frame, annotations.landmarks)
+
+    if len(annotations.landmarks):
+        if annotations.status is not None:
+            draw_gesture_status(frame, *annotations.status)
+    else:
+        # Static prompt, pre-rendered once per frame size
+        prompt = window.sprites.get(
+            "prompt", layout, lambda: TextSprite.line("Show your hand to the camera", layout.prompt_scale,
+                                                      (0, 0, 255), layout.prompt_thickness))
+        prompt.draw_text(frame, layout.margin_x, layout.status_y)
+
+    if annotations.detected_text:
+        cv2.putText(frame, f": {annotations.detected_text}", (layout.margin_x, layout.detected_y),
+                    cv2.FONT_HERSHEY_SIMPLEX, layout.detected_scale, (255, 255, 0), layout.detected_thickness)
+
+    for text, y in zip(annotations.info, layout.info_y):
+        cv2.putText(frame, text, (layout.info_x, y), cv2.FONT_HERSHEY_SIMPLEX, layout.info_scale,
+                    annotations.info_color, 1)
 
 def main():
+    # Hands tracked and classified at the same time
+    MAX_HANDS = 2
     # Camera configuration - Use native camera resolution
     CAPTURE_WIDTH = 1280
     CAPTURE_HEIGHT = 720
+    # Hand detection input scale (1.0 = full resolution, 0.5 = half width/height)
+    INFERENCE_SCALE = 1.0
+    # Run detection on a crop around the last hand position (full frame every 30 frames)
+    ROI_TRACKING = False
+    # Infer every k-th frame (k adapts to hand speed/CPU) and predict landmarks in between
+    ADAPTIVE_CADENCE = False
+    # Idle mode: after this many seconds without a hand, only check for motion at IDLE_FPS
+    IDLE_AFTER = 5.0
+    IDLE_FPS = 5
+    # "solutions" (legacy graph) or "tasks" (HandLandmarker, needs models/hand_landmarker.task)
+    DETECTOR_BACKEND = "solutions"
+    # Tasks only: "live_stream" never blocks the loop on inference, "video" is synchronous
+    TASKS_RUNNING_MODE = "live_stream"
+    # Learned k-NN classifier from train_classifier.py (e.g. "models/gesture_knn.npy"); None = finger rules
+    GESTURE_MODEL = None
+    # Wave / swipe / circle recognition from the landmark history
+    MOTION_GESTURES = True
+    # Play pre-synthesized WAVs from cache/speech instead of synthesizing on every trigger
+    SPEECH_CACHE = True
+    # The display thread shows the newest result at this rate (set to the monitor's refresh rate)
+    DISPLAY_REFRESH_RATE = 60
+    # Landmark overlay: "full" (skeleton and dots), "skeleton" (lines only, the cheapest) or "off"
+    LANDMARK_DRAWING = "skeleton"
+
+    # 1. Camera, hand detector (with a warm-up inference) and speech start in parallel
+    print("Initializing components...")
+    startup = ParallelStartup()
+
+    def open_camera():
+        # Capture runs on a dedicated thread once the camera is open
+        grabber = FrameGrabber(0, width=CAPTURE_WIDTH, height=CAPTURE_HEIGHT, fps=30)
+        if grabber.isOpened():
+            grabber.start()
+        return grabber
+
+    def create_detector():
+        detector = HandDetector(max_hands=MAX_HANDS, detection_conf=0.8, tracking_conf=0.6,
+                                inference_scale=INFERENCE_SCALE, roi_tracking=ROI_TRACKING,
+                                adaptive_cadence=ADAPTIVE_CADENCE, backend=DETECTOR_BACKEND,
+                                running_mode=TASKS_RUNNING_MODE, draw_quality=LANDMARK_DRAWING)
+        detector.warm_up(CAPTURE_WIDTH, CAPTURE_HEIGHT)
+        return detector
+
+    def start_speech():
+        speech_cache = None
+        if SPEECH_CACHE:
+            # Gesture phrases are fixed: synthesize them once, then play the WAVs
+            speech_cache = SpeechCache()
+            speech_cache.prewarm(list(GESTURE_TO_TEXT.values()))
+        # Requests made before the worker's engine is up wait in its scheduler
+        return TTSEngine(speech_cache=speech_cache)
+
+    startup.start("camera", open_camera)
+    startup.start("detector", create_detector)
+    startup.start("speech", start_speech)
+
+    # 2. Meanwhile the cheap components, and the display thread with its window
+    classifier = GestureClassifier(model_path=GESTURE_MODEL)
+    # One vote window per tracked hand; speech fires on GestureCommitted
+    debouncer = GestureDebouncer(slots=MAX_HANDS)
+    motion_gate = MotionGate(idle_after=IDLE_AFTER, idle_fps=IDLE_FPS)
+    # macOS HighGUI only works on the main thread: there DisplayThread shows each frame inline from
+    # submit(), so display cost is back on the camera loop and DISPLAY_REFRESH_RATE has no effect
+    display = DisplayThread("Hand Sign Translator - Adaptive Display", refresh_rate=DISPLAY_REFRESH_RATE).start()
+    startup.mark("window")
+
+    try:
+        grabber = startup.wait("camera")
+        detector = startup.wait("detector")
+        tts = startup.wait("speech")
+    except Exception:
+        # A component failed to start: stop the ones that did before giving up
+        display.stop()
+        startup.release({"camera": lambda grabber: grabber.release(),
+                         "detector": lambda detector: detector.close(),
+                         "speech": lambda tts: tts.stop()})
+        raise
 
-    # 1. Open laptop camera
-    cap = cv2.VideoCapture(0)
-    
-    # Try to set desired resolution, but use what camera supports
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT)
-    cap.set(cv2.CAP_PROP_FPS, 30)
-    
     # Get actual camera resolution
-    actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    actual_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    actual_fps = cap.get(cv2.CAP_PROP_FPS)
-    
+    actual_width = grabber.width
+    actual_height = grabber.height
+    actual_fps = grabber.fps
+
     print(f"Camera Info:")
     print(f"Resolution: {actual_width} x {actual_height}")
     print(f"FPS: {actual_fps:.1f}")
 
-    if not cap.isOpened():
+    if not grabber.isOpened():
         print("Error: Cannot open camera")
+        grabber.release()
+        display.stop()
+        tts.stop()
+        detector.close()
         return
+    display.render = partial(draw_annotations, detector=detector)
 
-    # 2. Initialize components
-    print("Initializing components...")
-    detector = HandDetector(max_hands=1, detection_conf=0.8, tracking_conf=0.6)
-    classifier = GestureClassifier()
-    tts = TTSEngine()
-    
-    # Initialize adaptive display window
-    display_window = AdaptiveDisplayWindow("Hand Sign Translator - Adaptive Display")
-    
-    # Wait for TTS initialization
-    time.sleep(2)
+    tracker = HandTracker(max_tracks=MAX_HANDS, aspect_ratio=actual_width / actual_height)
+    dynamic_gestures = (TrackedGestureRecognizer(slots=MAX_HANDS, aspect_ratio=actual_width / actual_height)
+                        if MOTION_GESTURES else None)
     print("Components initialized successfully")
-    
-
-    # State variables for gesture tracking
-    current_gesture = None
-    last_spoken_gesture = None
-    gesture_start_time = 0
-    gesture_hold_required = 1.0
-    
+
     # Performance tracking
     fps_history = []
     last_fps_time = time.time()
@@ -155,123 +205,79 @@ def main():
     print("\nAdaptive Display Hand Sign Translator Started!")
     print("Window automatically adjusts to your screen size")
     print("Use mouse controls: Right-click fullscreen, Scroll zoom")
-    print("Hold gesture for 1 second to trigger speech")
+    print("Hold a gesture steady (~0.4 s) to trigger speech")
 
+    running = True
     try:
-        while True:
+        while running:
             # Start timing for FPS calculation
             frame_start_time = time.time()
             
-            ret, frame = cap.read()
+            # Always the newest frame, stale ones are dropped by the grabber
+            ret, frame, capture_time = grabber.read()
             if not ret:
                 print("Failed to grab frame")
                 break
 
             frame_count += 1
-            current_time = time.time()
+            current_time = capture_time
+
+            # 3. Detect hand (skipped while idle and the scene is static)
+            was_idle = motion_gate.is_idle
+            if motion_gate.should_infer(frame, current_time):
+                processed_frame, hands = detector.find_hands(frame, draw=False, timestamp=current_time)
+            else:
+                processed_frame, hands = cv2.flip(frame, 1), HandResult.empty(frame.shape)
 
-            # 3. Detect hand
-            processed_frame, hands = detector.find_hands(frame, draw=True)
+            motion_gate.update(bool(hands), current_time)
+            if motion_gate.is_idle != was_idle:
+                # Idle: decode only a few frames per second; active: every frame
+                grabber.set_max_fps(IDLE_FPS if motion_gate.is_idle else None)
+                print(f"Motion gate: {motion_gate.state}")
 
             detected_text = None
-            gesture_label = None
 
-            # 4. Process hand detection
+            # 4. Process hand detection: all tracked hands are classified in one call
+            votes = np.full(MAX_HANDS, None, dtype=object)
+            confidence = np.zeros(MAX_HANDS)
+            gesture_events = []
+            # Every processed frame ages the tracks, so hands that left free their slots
+            tracker.update(hands)
             if hands:
-                lm_list = extract_landmarks(hands[0], processed_frame.shape)
-                
-                if classifier.is_hand_present(lm_list):
-                    gesture_label = classifier.classify(lm_list, current_time)
-                    hold_progress = classifier.get_hold_progress(current_time)
-
-                    if gesture_label and gesture_label != "UNKNOWN":
-                        display_name = GESTURE_DISPLAY_NAMES.get(gesture_label, gesture_label)
-                        
-                        if gesture_label != last_spoken_gesture:
-                            gesture_start_time = current_time
-                            last_spoken_gesture = gesture_label
-                        
-                        hold_duration = current_time - gesture_start_time
-                        hold_percent = min(hold_duration / gesture_hold_required, 1.0)
-                        
-                        if hold_duration >= gesture_hold_required:
-                            detected_text = GESTURE_TO_TEXT.get(gesture_label, "Unknown gesture")
-                            status_color = (0, 255, 0)
-                            status_text = f"{display_name}"
-                            gesture_start_time = current_time
-                        else:
-                            status_color = (82, 267, 54)
-                            progress_pct = int(hold_percent * 100)
-                            status_text = f"{display_name} ({progress_pct}%)"
-
-                        # Calculate dynamic text size based on frame size
-                        frame_height, frame_width = processed_frame.shape[:2]
-                        base_text_scale = max(0.5, min(1.5, frame_width / 1280))
-                        base_text_thickness = max(1, int(frame_width / 640))
-                        
-                        # Display gesture information with dynamic sizing
-                        cv2.putText(
-                            processed_frame,
-                            status_text,
-                            (int(30 * frame_width / 1280), int(50 * frame_height / 720)),
-                            cv2.FONT_HERSHEY_SIMPLEX,
-                            base_text_scale,
-                            status_color,
-                            base_text_thickness,
-                        )
-                        
-                        # Dynamic progress bar
-                        bar_width = int(300 * frame_width / 1280)
-                        bar_height = int(20 * frame_height / 720)
-                        bar_x = int(30 * frame_width / 1280)
-                        bar_y = int(90 * frame_height / 720)
-                        filled_width = int(bar_width * hold_percent)
-                        
-                        cv2.rectangle(processed_frame, (bar_x, bar_y), 
-                                     (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
-                        cv2.rectangle(processed_frame, (bar_x, bar_y), 
-                                     (bar_x + filled_width, bar_y + bar_height), status_color, -1)
-                        cv2.rectangle(processed_frame, (bar_x, bar_y), 
-                                     (bar_x + bar_width, bar_y + bar_height), (255, 255, 255), 1)
+                slots = hands.track_slots
+                gesture_events += debouncer.reset(slots[hands.new_tracks], current_time)
+                names, scores = classifier.recognize_batch(hands.pixels, return_confidence=True)
+                voting = (slots >= 0) & hands_present(hands.pixels)
+                votes[slots[voting]] = names[voting]
+                confidence[slots[voting]] = scores[voting]
+            gesture_events += debouncer.update(votes, current_time, confidence)
 
-            else:
-                current_gesture = None
-                last_spoken_gesture = None
-                gesture_start_time = 0
-                
-                # Dynamic "no hand" text
-                frame_height, frame_width = processed_frame.shape[:2]
-                text_scale = max(0.8, min(2.0, frame_width / 800))
-                
-                cv2.putText(
-                    processed_frame,
-                    "Show your hand to the camera",
-                    (int(30 * frame_width / 1280), int(50 * frame_height / 720)),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    text_scale,
-                    (0, 0, 255),
-                    max(2, int(frame_width / 400)),
-                )
+            # Simultaneous gestures are spoken as one utterance
+            committed = [event.gesture for event in gesture_events if isinstance(event, GestureCommitted)]
+            if committed:
+                detected_text = " ".join(GESTURE_TO_TEXT.get(g, "Unknown gesture") for g in committed)
+
+            status = None
+            if hands:
+                shown = debouncer.active
+                status = (tracker.slot_ids[shown], debouncer.gestures[shown], debouncer.progress[shown],
+                          debouncer.committed[shown])
+
+            # Motion gestures fire once the hand comes to rest or leaves the frame, per tracked hand
+            motion_labels = dynamic_gestures.update(hands, tracker.slot_ids, current_time) if dynamic_gestures else []
+            if motion_labels:
+                # A static gesture committed on the same frame is kept; the motion phrases follow it
+                motion_text = " ".join(GESTURE_TO_TEXT.get(label, "Unknown gesture") for label in motion_labels)
+                detected_text = f"{detected_text} {motion_text}" if detected_text else motion_text
+                for label in motion_labels:
+                    print(f"Motion gesture: {GESTURE_DISPLAY_NAMES.get(label, label)}")
 
             # 5. Handle speech output
             if detected_text:
-                frame_height, frame_width = processed_frame.shape[:2]
-                text_scale = max(0.6, min(1.2, frame_width / 1280))
-                
-                cv2.putText(
-                    processed_frame,
-                    f": {detected_text}",
-                    (int(30 * frame_width / 1280), int(130 * frame_height / 720)),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    text_scale,
-                    (255, 255, 0),
-                    max(1, int(frame_width / 640)),
-                )
-                
                 print(f"TRIGGERING SPEECH: {detected_text}")
                 tts.speak(detected_text)
 
-            # 6. Calculate and display FPS
+            # 6. Calculate FPS
             frame_end_time = time.time()
             fps = 1.0 / (frame_end_time - frame_start_time)
             fps_history.append(fps)
@@ -279,58 +285,52 @@ def main():
                 fps_history.pop(0)
             
             avg_fps = sum(fps_history) / len(fps_history)
-            
-            # Dynamic FPS display
-            frame_height, frame_width = processed_frame.shape[:2]
-            fps_text_scale = max(0.4, min(0.8, frame_width / 1600))
-            
             fps_color = (0, 255, 0) if avg_fps > 20 else (0, 165, 255) if avg_fps > 10 else (0, 0, 255)
-            cv2.putText(
-                processed_frame,
-                f"FPS: {avg_fps:.1f} | Zoom: {display_window.current_scale:.1f}x",
-                (frame_width - 300, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                fps_text_scale,
-                fps_color,
-                1,
+            capture_stats = grabber.get_stats()
+            info = (
+                f"FPS: {avg_fps:.1f} | Disp: {display.fps:.0f} | Zoom: {display.window.current_scale:.1f}x"
+                + (" | PRED" if detector.last_predicted else "")
+                + (" | IDLE" if motion_gate.is_idle else ""),
+                f"Cap: {capture_stats['capture_fps']:.1f} | Drop: {capture_stats['drop_rate'] * 100:.0f}% | Age: {capture_stats['frame_age_ms']:.0f}ms",
             )
 
-            # 7. Add window controls overlay
-            processed_frame = display_window.add_window_controls_overlay(processed_frame)
+            # 7. Hand the frame to the display thread; it resizes, draws the overlays and shows it
+            display.submit(processed_frame, FrameAnnotations(hands.landmarks, status, detected_text, info, fps_color,
+                                                             MAX_HANDS))
+            if frame_count == 1:
+                startup.mark("first frame")
+                startup.report()
 
-            # 8. Adaptive display resizing
-            display_width, display_height = display_window.get_display_size(processed_frame.shape)
-            
-            # Resize frame for display (maintain aspect ratio)
-            display_frame = cv2.resize(processed_frame, (display_width, display_height), 
-                                      interpolation=cv2.INTER_AREA if display_width < processed_frame.shape[1] 
-                                      else cv2.INTER_LINEAR)
-
-            # 9. Display frame
-            cv2.imshow(display_window.window_name, display_frame)
-
-            # 10. Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q') or key == 27:  # 'q' or ESC
-                break
-            elif key == ord('t'):
-                # Manual TTS test
-                test_text = f"Manual test at frame {frame_count}"
-                print(f"MANUAL TEST: {test_text}")
-                tts.speak(test_text)
-            elif key == ord('f'):
-                # Toggle fullscreen with keyboard
-                display_window.toggle_fullscreen()
-                print(f"Fullscreen: {display_window.is_fullscreen}")
+            # 8. Handle keyboard input (read by the display thread; 'f' fullscreen is handled there)
+            for key in display.keys():
+                if key == ord('q') or key == 27:  # 'q' or ESC
+                    running = False
+                elif key == ord('t'):
+                    # Manual TTS test
+                    test_text = f"Manual test at frame {frame_count}"
+                    print(f"MANUAL TEST: {test_text}")
+                    tts.speak(test_text, priority=1)
     except Exception as e:
         print(f"Main loop error: {e}")
         import traceback
         traceback.print_exc()
     finally:
         # Cleanup
+        display.stop()
         tts.stop()
-        cap.release()
-        cv2.destroyAllWindows()
+        capture_stats = grabber.get_stats()
+        print(f"Capture: {capture_stats['capture_fps']:.1f} FPS, "
+              f"{capture_stats['frames_dropped']}/{capture_stats['frames_captured']} frames dropped, "
+              f"avg frame age {capture_stats['avg_frame_age_ms']:.1f}ms")
+        grabber.release()
+        detector.close()
+        gate_stats = motion_gate.get_stats()
+        wake_latency = gate_stats['last_wake_latency_ms']
+        print(f"Idle mode: {gate_stats['idle_time_s']:.1f}s idle, {gate_stats['wake_count']} wake-ups, "
+              f"last wake-to-hand {'-' if wake_latency is None else f'{wake_latency:.0f}ms'}, "
+              f"~{gate_stats['cpu_saved_s']:.1f}s CPU saved")
+        print(f"Display: {display.frames_shown}/{display.frames_submitted} frames shown, "
+              f"{display.render_time * 1000:.1f}ms per frame to resize, draw and show")
         print("\nAdaptive Display Application closed successfully")
 
 if __name__ == "__main__":
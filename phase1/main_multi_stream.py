@@ -0,0 +1,47 @@
+# Multi-stream runner: watch several cameras / video files / network feeds
+# on one box with a bounded pool of HandDetector worker processes.
+#
+#   python main_multi_stream.py 0 clip1.mp4 http://camera.local/stream.mjpg
+#   python main_multi_stream.py clip1.mp4 clip2.mp4 --serve --workers 2
+
+import argparse
+
+from capture.frame_grabber import parse_source
+from config.gesture_map import GESTURE_DISPLAY_NAMES
+from pipeline.multi_stream import MultiStreamRunner
+from pipeline.stream_standin import LocalStreamServer
+
+def main():
+    parser = argparse.ArgumentParser(description="Hand sign detection on several feeds at once")
+    parser.add_argument("sources", nargs="+", help="Camera indices, video files or stream URLs")
+    parser.add_argument("--workers", type=int, default=None, help="Detector processes (default: cores - 1)")
+    parser.add_argument("--max-hands", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--serve", action="store_true",
+                        help="Serve video files through a local MJPEG stand-in and read them as network streams")
+    args = parser.parse_args()
+
+    servers = []
+    sources = []
+    for source in args.sources:
+        source = parse_source(source)
+        if args.serve and isinstance(source, str) and "://" not in source:
+            server = LocalStreamServer(source).start()
+            servers.append(server)
+            print(f"Serving {source} at {server.url}")
+            source = server.url
+        sources.append(source)
+
+    def on_gesture(stream_id, gesture):
+        print(f"[stream {stream_id}] {GESTURE_DISPLAY_NAMES.get(gesture, gesture)}")
+
+    runner = MultiStreamRunner(sources, num_workers=args.workers, max_hands=args.max_hands,
+                               on_gesture=on_gesture)
+    try:
+        runner.start().run(duration=args.duration)
+    finally:
+        for server in servers:
+            server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Pipelined variant of main_laptop_cam.py: capture, hand detection,
+# classification + TTS and rendering each run in their own process and
+# pass frames through shared memory, so they no longer share one core.
+
+import argparse
+
+from pipeline.multiprocess_pipeline import run_pipeline
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process hand sign translator")
+    parser.add_argument("--source", default="0", help="Camera index or video file path")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--slots", type=int, default=4, help="Shared frame slots (max frames in flight)")
+    args = parser.parse_args()
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    run_pipeline(source, width=args.width, height=args.height, num_slots=args.slots)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Readers and writers for per-frame detection results.
+# JSONL is easy to grep and diff, NPZ is compact and loads straight into
+# NumPy arrays for regression runs, training and replay benchmarks.
+
+import json
+import os
+
+import numpy as np
+
+HANDEDNESS_CODES = {"Left": 0, "Right": 1}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+
+def frame_record(frame_index, timestamp, landmarks, handedness, raw_gestures, gesture):
+    """
+    One frame of results as a JSON-friendly dict.
+
+    landmarks: list of (21, 3) normalized arrays, one per hand
+    handedness: list of (label, score), same order
+    raw_gestures: per-hand gesture without hold time
+    gesture: gesture GestureDebouncer has committed for the first hand (or None)
+    """
+    hands = []
+    for i, lm_array in enumerate(landmarks):
+        label, score = handedness[i] if i < len(handedness) else (None, 0.0)
+        hands.append({
+            "handedness": label,
+            "score": round(float(score), 4),
+            "raw_gesture": raw_gestures[i] if i < len(raw_gestures) else None,
+            "landmarks": np.round(np.asarray(lm_array, dtype=np.float64), 5).tolist(),
+        })
+    return {
+        "frame": int(frame_index),
+        "timestamp": round(float(timestamp), 4),
+        "gesture": gesture,
+        "hands": hands,
+    }
+
+
+class JsonlResultWriter:
+    """Streams one JSON object per frame"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "w")
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class NpzResultWriter:
+    """Collects records and writes fixed-shape arrays to a compressed NPZ on close"""
+
+    def __init__(self, path, max_hands=2):
+        self.path = path
+        self.max_hands = max_hands
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+    def close(self):
+        np.savez_compressed(self.path, **records_to_arrays(self.records, self.max_hands))
+
+
+def records_to_arrays(records, max_hands=2):
+    """Pack frame records into padded arrays (missing hands are NaN / -1 / "")"""
+    num_frames = len(records)
+    landmarks = np.full((num_frames, max_hands, 21, 3), np.nan, dtype=np.float32)
+    handedness = np.full((num_frames, max_hands), -1, dtype=np.int8)
+    scores = np.zeros((num_frames, max_hands), dtype=np.float32)
+    raw_gestures = np.full((num_frames, max_hands), "", dtype="<U16")
+    num_hands = np.zeros(num_frames, dtype=np.int8)
+
+    for f, record in enumerate(records):
+        hands = record["hands"][:max_hands]
+        num_hands[f] = len(hands)
+        for h, hand in enumerate(hands):
+            landmarks[f, h] = hand["landmarks"]
+            handedness[f, h] = HANDEDNESS_CODES.get(hand["handedness"], -1)
+            scores[f, h] = hand["score"]
+            raw_gestures[f, h] = hand["raw_gesture"] or ""
+
+    return {
+        "frame": np.array([r["frame"] for r in records], dtype=np.int32),
+        "timestamp": np.array([r["timestamp"] for r in records], dtype=np.float64),
+        "gesture": np.array([r["gesture"] or "" for r in records], dtype="<U16"),
+        "num_hands": num_hands,
+        "landmarks": landmarks,
+        "handedness": handedness,
+        "scores": scores,
+        "raw_gesture": raw_gestures,
+    }
+
+
+def open_result_writer(path, max_hands=2):
+    """Pick the writer from the file extension"""
+    if path.endswith(".npz"):
+        return NpzResultWriter(path, max_hands)
+    return JsonlResultWriter(path)
+
+
+def load_results(path, max_hands=2):
+    """Load a JSONL or NPZ results file as the dict of arrays written by NpzResultWriter"""
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+
+    records = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    return records_to_arrays(records, max_hands)
+
+
+def default_output_path(video_path, fmt="jsonl"):
+    base, _ = os.path.splitext(video_path)
+    return f"{base}_results.{fmt}"
@@ -0,0 +1,52 @@
+# Labeled landmark datasets for the learned classifier, built from the
+# JSONL/NPZ results written by process_video.py.
+
+import numpy as np
+
+from offline.results_io import load_results
+
+
+def parse_dataset_arg(arg):
+    """FIST=fist_results.npz -> ("FIST", path); a bare path keeps the recorded labels"""
+    label, sep, path = arg.partition("=")
+    if sep and label.isupper():
+        return label, path
+    return None, arg
+
+
+def load_labeled_hands(dataset_args, max_hands=2):
+    """
+    (landmarks (N, 21, 3), labels (N,)) for every detected hand in the given
+    results files. LABEL=path labels every hand in that file with LABEL
+    (record one gesture per clip); a bare path uses each hand's recorded
+    raw_gesture and skips UNKNOWN/empty ones.
+    """
+    landmarks, labels = [], []
+    for arg in dataset_args:
+        label, path = parse_dataset_arg(arg)
+        results = load_results(path, max_hands)
+        present = np.arange(results["landmarks"].shape[1]) < results["num_hands"][:, None]
+        present &= ~np.isnan(results["landmarks"]).any(axis=(2, 3))
+
+        hands = results["landmarks"][present]
+        if label is None:
+            hand_labels = results["raw_gesture"][present]
+            keep = (hand_labels != "") & (hand_labels != "UNKNOWN")
+            hands, hand_labels = hands[keep], hand_labels[keep]
+        else:
+            hand_labels = np.full(len(hands), label)
+
+        print(f"{path}: {len(hands)} hands" + (f" labeled {label}" if label else ""))
+        landmarks.append(hands)
+        labels.append(hand_labels.astype(str))
+
+    if not landmarks:
+        return np.empty((0, 21, 3), dtype=np.float32), np.empty(0, dtype=str)
+    return np.concatenate(landmarks), np.concatenate(labels)
+
+
+def split_holdout(count, fraction, seed=0):
+    """Shuffled (train_indices, test_indices)"""
+    order = np.random.default_rng(seed).permutation(count)
+    test_count = int(count * fraction)
+    return order[test_count:], order[:test_count]
@@ -0,0 +1,93 @@
+import time
+
+import cv2
+
+from hand_detection.detector import HandDetector
+from hand_detection.gesture_classifier import GestureClassifier, hands_present
+from hand_detection.gesture_debouncer import GestureDebouncer
+from offline.results_io import frame_record
+
+
+def video_timestamp(cap, frame_index, fps):
+    """Presentation time of the frame just read, in seconds"""
+    msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if msec > 0 or frame_index == 0:
+        return msec / 1000.0
+    # Some containers do not report positions; fall back to the nominal rate
+    return frame_index / fps if fps > 0 else 0.0
+
+
+def process_video(video_path, writer=None, max_hands=2, max_frames=None, detector=None, model_path=None):
+    """
+    Run detection and classification over every frame of a video file
+    as fast as the CPU allows - no window, no waitKey, no TTS.
+
+    Debouncing runs on video timestamps, so results do not depend
+    on how fast the machine is. Returns a summary dict with timings.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise IOError(f"Cannot open video: {video_path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if detector is None:
+        # No display, so skip the pixel flip and mirror the landmarks instead
+        detector = HandDetector(max_hands=max_hands, detection_conf=0.8, tracking_conf=0.5,
+                                mirror_pixels=False)
+    classifier = GestureClassifier(model_path=model_path)
+    debouncer = GestureDebouncer()
+
+    frame_index = 0
+    frames_with_hands = 0
+    decode_time = detect_time = classify_time = 0.0
+    start_time = time.perf_counter()
+
+    try:
+        while max_frames is None or frame_index < max_frames:
+            t0 = time.perf_counter()
+            ret, frame = cap.read()
+            if not ret:
+                break
+            timestamp = video_timestamp(cap, frame_index, fps)
+
+            t1 = time.perf_counter()
+            _, hands = detector.find_hands(frame, draw=False, timestamp=timestamp)
+
+            t2 = time.perf_counter()
+            # All hands in one vectorized pass; the committed gesture follows the first hand
+            names, confidence = classifier.recognize_batch(hands.pixels, return_confidence=True)
+            raw_gestures = names.tolist()
+            label, score = None, 0.0
+            if hands:
+                frames_with_hands += 1
+                if hands_present(hands.pixels[:1])[0]:
+                    label, score = names[0], confidence[0]
+            debouncer.update([label], timestamp, [score])
+            gesture = debouncer.gestures[0] if debouncer.committed[0] else None
+
+            if writer:
+                writer.write(frame_record(frame_index, timestamp, hands.landmarks,
+                                          hands.handedness, raw_gestures, gesture))
+            t3 = time.perf_counter()
+
+            decode_time += t1 - t0
+            detect_time += t2 - t1
+            classify_time += t3 - t2
+            frame_index += 1
+    finally:
+        cap.release()
+        if writer:
+            writer.close()
+
+    elapsed = time.perf_counter() - start_time
+    frames = max(frame_index, 1)
+    return {
+        "frames": frame_index,
+        "frames_with_hands": frames_with_hands,
+        "elapsed_s": elapsed,
+        "fps": frame_index / elapsed if elapsed > 0 else 0.0,
+        "video_fps": fps,
+        "decode_ms": decode_time / frames * 1000,
+        "detect_ms": detect_time / frames * 1000,
+        "classify_ms": classify_time / frames * 1000,
+    }
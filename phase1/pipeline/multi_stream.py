@@ -0,0 +1,277 @@
+import collections
+import multiprocessing as mp
+import os
+import queue
+import time
+
+import numpy as np
+
+from capture.frame_grabber import FrameGrabber
+from hand_detection.gesture_classifier import GestureClassifier, hands_present
+from hand_detection.gesture_debouncer import GestureCommitted, GestureDebouncer, GestureEnded
+from hand_detection.hand_result import to_pixels
+from pipeline.multiprocess_pipeline import get_until_stopped
+from pipeline.shared_frames import SharedFrameRing
+
+
+def detector_worker(worker_id, task_q, result_q, stop_event, max_hands):
+    """
+    Pool worker: runs HandDetector on frames from any stream.
+
+    Each stream gets its own HandDetector inside the worker, so MediaPipe's
+    frame-to-frame tracking never mixes hands from different feeds.
+    """
+    from hand_detection.detector import HandDetector
+
+    detectors = {}
+    rings = {}  # stream_id -> that stream's current SharedFrameRing
+
+    try:
+        while True:
+            task = get_until_stopped(task_q, stop_event)
+            if task is None:
+                break
+            stream_id, ring_spec, slot_index, seq, capture_time = task
+
+            ring = rings.get(stream_id)
+            if ring is None or ring.name != ring_spec["name"]:
+                # The stream's resolution changed: its old ring is gone, release our mapping of it
+                if ring is not None:
+                    ring.close()
+                ring = rings[stream_id] = SharedFrameRing.attach(ring_spec)
+            if stream_id not in detectors:
+                detectors[stream_id] = HandDetector(max_hands=max_hands, detection_conf=0.8,
+                                                    tracking_conf=0.5, mirror_pixels=False)
+
+            start = time.perf_counter()
+            frame, hands = detectors[stream_id].find_hands(ring.slot(slot_index), draw=False)
+            inference_time = time.perf_counter() - start
+
+            result_q.put((worker_id, stream_id, slot_index, seq, capture_time,
+                          hands.landmarks, frame.shape, inference_time))
+    finally:
+        for ring in rings.values():
+            ring.close()
+
+
+class StreamState:
+    """Per-stream capture, classifier/debouncer state and metrics"""
+
+    def __init__(self, stream_id, source, max_inflight):
+        self.stream_id = stream_id
+        self.source = source
+        self.grabber = FrameGrabber(source)
+        self.ring = None
+        self.free_slots = collections.deque(range(max_inflight))
+        self.max_inflight = max_inflight
+        self.last_worker = None
+        self.seq = 0
+
+        self.classifier = GestureClassifier()
+        self.debouncer = GestureDebouncer()
+        self.current_gesture = None
+
+        self.frames_processed = 0
+        self.frames_skipped = 0
+        self.latencies = collections.deque(maxlen=100)
+        self.inference_times = collections.deque(maxlen=100)
+        self.window_start = time.time()
+        self.window_frames = 0
+        self.fps = 0.0
+
+    @property
+    def in_flight(self):
+        return self.max_inflight - len(self.free_slots)
+
+    def start(self):
+        if self.grabber.isOpened():
+            self.grabber.start()
+        return self
+
+    def record_result(self, capture_time, inference_time):
+        now = time.time()
+        self.frames_processed += 1
+        self.window_frames += 1
+        self.latencies.append(now - capture_time)
+        self.inference_times.append(inference_time)
+        if now - self.window_start >= 1.0:
+            self.fps = self.window_frames / (now - self.window_start)
+            self.window_start = now
+            self.window_frames = 0
+
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        grabber_stats = self.grabber.get_stats()
+        return {
+            "source": str(self.source),
+            "fps": self.fps,
+            "latency_ms": float(latencies.mean()),
+            "latency_p95_ms": float(np.percentile(latencies, 95)),
+            "inference_ms": float(np.mean(self.inference_times) * 1000) if self.inference_times else 0.0,
+            "processed": self.frames_processed,
+            "dropped": grabber_stats["frames_dropped"] + self.frames_skipped,
+            "gesture": self.current_gesture,
+        }
+
+
+class MultiStreamRunner:
+    """
+    Watches several camera / video / network feeds with a bounded pool of
+    detector worker processes.
+
+    Scheduling is round-robin over streams and each stream may only have
+    max_inflight frames at the workers at once. A stream that cannot be served
+    keeps overwriting its newest frame in its FrameGrabber, so an overloaded
+    box drops frames per stream instead of stalling or starving other feeds.
+    """
+
+    def __init__(self, sources, num_workers=None, max_hands=1, max_inflight=1,
+                 on_gesture=None):
+        self.num_workers = num_workers or max(1, min(len(sources), (os.cpu_count() or 2) - 1))
+        self.max_hands = max_hands
+        self.on_gesture = on_gesture
+        self.streams = [StreamState(i, source, max_inflight) for i, source in enumerate(sources)]
+
+        self._ctx = mp.get_context("spawn")
+        self._stop_event = self._ctx.Event()
+        self._result_q = self._ctx.Queue()
+        self._task_qs = [self._ctx.Queue(maxsize=1) for _ in range(self.num_workers)]
+        self._idle_workers = collections.deque(range(self.num_workers))
+        self._workers = []
+        self._next_stream = 0
+
+    def start(self):
+        for stream in self.streams:
+            stream.start()
+            if not stream.grabber.isOpened():
+                print(f"Stream {stream.stream_id}: cannot open {stream.source}")
+
+        for worker_id, task_q in enumerate(self._task_qs):
+            worker = self._ctx.Process(target=detector_worker, name=f"detector-{worker_id}",
+                                       args=(worker_id, task_q, self._result_q,
+                                             self._stop_event, self.max_hands))
+            worker.start()
+            self._workers.append(worker)
+
+        print(f"Multi-stream runner: {len(self.streams)} streams, {self.num_workers} detector workers")
+        return self
+
+    def _pick_worker(self, stream):
+        """Prefer the worker that served this stream last (warm tracking state)"""
+        if stream.last_worker in self._idle_workers:
+            self._idle_workers.remove(stream.last_worker)
+            return stream.last_worker
+        return self._idle_workers.popleft()
+
+    def _dispatch(self):
+        """Hand fresh frames to idle workers, one stream at a time in round-robin order"""
+        dispatched = 0
+        checked = 0
+        while self._idle_workers and checked < len(self.streams):
+            stream = self.streams[self._next_stream]
+            self._next_stream = (self._next_stream + 1) % len(self.streams)
+            checked += 1
+
+            if not stream.free_slots or stream.grabber.is_finished:
+                continue
+
+            ret, frame, capture_time = stream.grabber.read(timeout=0)
+            if not ret:
+                continue
+
+            if stream.ring is None or stream.ring.shape != frame.shape:
+                if stream.ring is not None:
+                    # Resolution changed mid-stream; skip until in-flight frames return
+                    if stream.in_flight:
+                        stream.frames_skipped += 1
+                        continue
+                    stream.ring.close()
+                stream.ring = SharedFrameRing(frame.shape, stream.max_inflight)
+
+            slot_index = stream.free_slots.popleft()
+            np.copyto(stream.ring.slot(slot_index), frame)
+            stream.seq += 1
+
+            worker_id = self._pick_worker(stream)
+            stream.last_worker = worker_id
+            self._task_qs[worker_id].put((stream.stream_id, stream.ring.spec(), slot_index,
+                                          stream.seq, capture_time))
+            dispatched += 1
+            checked = 0
+        return dispatched
+
+    def _handle_result(self, result):
+        worker_id, stream_id, slot_index, seq, capture_time, landmarks, frame_shape, inference_time = result
+        stream = self.streams[stream_id]
+        stream.free_slots.append(slot_index)
+        self._idle_workers.append(worker_id)
+        stream.record_result(capture_time, inference_time)
+
+        # Each stream debounces its own first hand
+        label, confidence = None, 0.0
+        if len(landmarks):
+            pixels = to_pixels(landmarks[:1], frame_shape)
+            if hands_present(pixels)[0]:
+                names, scores = stream.classifier.recognize_batch(pixels, return_confidence=True)
+                label, confidence = names[0], scores[0]
+
+        for event in stream.debouncer.update([label], capture_time, [confidence]):
+            if isinstance(event, GestureCommitted):
+                stream.current_gesture = event.gesture
+                if self.on_gesture:
+                    self.on_gesture(stream_id, event.gesture)
+            elif isinstance(event, GestureEnded):
+                stream.current_gesture = None
+
+    def poll(self, timeout=0.005):
+        """One scheduler step: dispatch, then collect whatever results are ready"""
+        self._dispatch()
+        try:
+            self._handle_result(self._result_q.get(timeout=timeout))
+            while True:
+                self._handle_result(self._result_q.get_nowait())
+        except queue.Empty:
+            pass
+
+    @property
+    def finished(self):
+        return all(stream.grabber.is_finished and not stream.in_flight for stream in self.streams)
+
+    def run(self, duration=None, report_interval=2.0):
+        """Run the scheduler until every source ends, duration passes or Ctrl+C"""
+        start = time.time()
+        last_report = start
+        try:
+            while not self.finished:
+                self.poll()
+                now = time.time()
+                if now - last_report >= report_interval:
+                    self.print_report()
+                    last_report = now
+                if duration and now - start >= duration:
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.print_report()
+            self.stop()
+
+    def print_report(self):
+        print(f"{'stream':<6} {'fps':>6} {'lat ms':>8} {'p95 ms':>8} {'infer ms':>9} "
+              f"{'done':>6} {'drop':>6}  gesture / source")
+        for stream in self.streams:
+            s = stream.stats()
+            print(f"{stream.stream_id:<6} {s['fps']:>6.1f} {s['latency_ms']:>8.1f} {s['latency_p95_ms']:>8.1f} "
+                  f"{s['inference_ms']:>9.1f} {s['processed']:>6} {s['dropped']:>6}  "
+                  f"{s['gesture'] or '-'} / {s['source']}")
+
+    def stop(self):
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(timeout=3.0)
+            if worker.is_alive():
+                worker.terminate()
+        for stream in self.streams:
+            stream.grabber.release()
+            if stream.ring is not None:
+                stream.ring.close()
@@ -0,0 +1,284 @@
+import multiprocessing as mp
+import queue
+import time
+
+import cv2
+import numpy as np
+
+from pipeline.shared_frames import SharedFrameRing
+from hand_detection.landmark_drawing import LandmarkRenderer
+from hand_detection.hand_result import to_pixels
+
+# Queue names in pipeline order, used for the queue-depth readout
+STAGE_QUEUES = ("capture>detect", "detect>classify", "classify>render")
+
+
+def queue_depth(q):
+    """qsize() is not implemented on every platform (macOS)"""
+    try:
+        return q.qsize()
+    except NotImplementedError:
+        return -1
+
+
+def get_until_stopped(q, stop_event, timeout=0.1):
+    """Blocking get that still notices the stop event"""
+    while not stop_event.is_set():
+        try:
+            return q.get(timeout=timeout)
+        except queue.Empty:
+            continue
+    return None
+
+
+def capture_stage(source, ring_spec, free_slots, out_q, stop_event, dropped):
+    """Process 1: read frames and copy the newest one into a free shared slot"""
+    from capture.frame_grabber import FrameGrabber
+
+    ring = SharedFrameRing.attach(ring_spec)
+    height, width = ring.shape[:2]
+    grabber = FrameGrabber(source, width=width, height=height, fps=30).start()
+    seq = 0
+
+    try:
+        while not stop_event.is_set():
+            ret, frame, capture_time = grabber.read()
+            if not ret:
+                break
+
+            # All slots in flight means downstream is behind - drop, don't queue
+            try:
+                index = free_slots.get_nowait()
+            except queue.Empty:
+                with dropped.get_lock():
+                    dropped.value += 1
+                continue
+
+            slot = ring.slot(index)
+            if frame.shape == slot.shape:
+                np.copyto(slot, frame)
+            else:
+                cv2.resize(frame, (width, height), dst=slot)
+
+            seq += 1
+            out_q.put((index, seq, capture_time))
+    finally:
+        out_q.put(None)
+        grabber.release()
+        ring.close()
+
+
+def detect_stage(ring_spec, in_q, out_q, stop_event, max_hands=1):
+    """Process 2: MediaPipe inference, mirrored frame written back in place"""
+    from hand_detection.detector import HandDetector
+
+    ring = SharedFrameRing.attach(ring_spec)
+    detector = HandDetector(max_hands=max_hands, detection_conf=0.8, tracking_conf=0.6)
+
+    try:
+        while True:
+            item = get_until_stopped(in_q, stop_event)
+            if item is None:
+                break
+            index, seq, capture_time = item
+
+            slot = ring.slot(index)
+            mirrored, hands = detector.find_hands(slot, draw=False)
+            np.copyto(slot, mirrored)
+
+            # Landmarks travel as one small (N, 21, 3) array, never as protobufs
+            out_q.put((index, seq, capture_time, hands.landmarks))
+    finally:
+        out_q.put(None)
+        ring.close()
+
+
+def classify_stage(frame_shape, in_q, out_q, stop_event):
+    """Process 3: gesture classification, debouncing and TTS dispatch"""
+    from hand_detection.gesture_classifier import GestureClassifier, hands_present
+    from hand_detection.gesture_debouncer import GestureCommitted, GestureDebouncer
+    from config.gesture_map import GESTURE_TO_TEXT, GESTURE_DISPLAY_NAMES
+    from tts.speech_cache import SpeechCache
+    from tts.tts_worker import TTSWorkerEngine as TTSEngine
+
+    classifier = GestureClassifier()
+    debouncer = GestureDebouncer()
+    speech_cache = SpeechCache()
+    speech_cache.prewarm(list(GESTURE_TO_TEXT.values()))
+    tts = TTSEngine(speech_cache=speech_cache)
+
+    try:
+        while True:
+            item = get_until_stopped(in_q, stop_event)
+            if item is None:
+                break
+            index, seq, current_time, landmarks = item
+
+            label, confidence = None, 0.0
+            if len(landmarks):
+                pixels = to_pixels(landmarks[:1], frame_shape)
+                if hands_present(pixels)[0]:
+                    names, scores = classifier.recognize_batch(pixels, return_confidence=True)
+                    label, confidence = names[0], scores[0]
+
+            events = debouncer.update([label], current_time, [confidence])
+            detected_text = next((GESTURE_TO_TEXT.get(event.gesture, "Unknown gesture")
+                                  for event in events if isinstance(event, GestureCommitted)), None)
+
+            status = None
+            gesture_label = debouncer.gestures[0]
+            if gesture_label is not None:
+                display_name = GESTURE_DISPLAY_NAMES.get(gesture_label, gesture_label)
+                hold_percent = float(debouncer.progress[0])
+                if debouncer.committed[0]:
+                    status = (display_name, (0, 255, 0), hold_percent)
+                else:
+                    progress_pct = int(hold_percent * 100)
+                    status = (f"{display_name} ({progress_pct}%)", (82, 255, 54), hold_percent)
+
+            if detected_text:
+                print(f"TRIGGERING SPEECH: {detected_text}")
+                tts.speak(detected_text)
+
+            out_q.put((index, seq, current_time, landmarks, status, detected_text))
+    finally:
+        out_q.put(None)
+        tts.stop()
+
+
+def render_stage(ring_spec, in_q, free_slots, stage_queues, stop_event, dropped):
+    """Process 4: overlay drawing, resize and imshow, then hand the slot back"""
+    from display.adaptive_window import AdaptiveDisplayWindow
+
+    ring = SharedFrameRing.attach(ring_spec)
+    display_window = AdaptiveDisplayWindow("Hand Sign Translator - Pipelined")
+    renderer = LandmarkRenderer()
+
+    fps_history = []
+    last_frame_time = time.time()
+
+    try:
+        while True:
+            item = get_until_stopped(in_q, stop_event)
+            if item is None:
+                break
+            index, seq, capture_time, landmarks, status, detected_text = item
+
+            frame = ring.slot(index)
+            frame_height, frame_width = frame.shape[:2]
+
+            renderer.draw(frame, landmarks)
+
+            if status:
+                status_text, status_color, hold_percent = status
+                cv2.putText(frame, status_text, (30, 50),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, status_color, 2)
+                bar_width = 300
+                cv2.rectangle(frame, (30, 90), (30 + bar_width, 110), (50, 50, 50), -1)
+                cv2.rectangle(frame, (30, 90), (30 + int(bar_width * hold_percent), 110), status_color, -1)
+                cv2.rectangle(frame, (30, 90), (30 + bar_width, 110), (255, 255, 255), 1)
+            elif not len(landmarks):
+                cv2.putText(frame, "Show your hand to the camera", (30, 50),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+
+            if detected_text:
+                cv2.putText(frame, f": {detected_text}", (30, 130),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 0), 2)
+
+            # Throughput and end-to-end latency
+            now = time.time()
+            fps_history.append(1.0 / max(now - last_frame_time, 1e-6))
+            last_frame_time = now
+            if len(fps_history) > 30:
+                fps_history.pop(0)
+            avg_fps = sum(fps_history) / len(fps_history)
+            latency_ms = (now - capture_time) * 1000
+
+            cv2.putText(frame, f"FPS: {avg_fps:.1f} | Latency: {latency_ms:.0f}ms",
+                        (frame_width - 330, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1)
+
+            # Per-stage queue depth readout
+            depths = " | ".join(f"{name}: {queue_depth(q)}" for name, q in zip(STAGE_QUEUES, stage_queues))
+            cv2.putText(frame, f"Queues {depths} | Dropped: {dropped.value}",
+                        (frame_width - 630, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+
+            frame = display_window.add_window_controls_overlay(frame)
+            display_width, display_height = display_window.get_display_size(frame.shape)
+            display_frame = cv2.resize(frame, (display_width, display_height),
+                                       interpolation=cv2.INTER_AREA if display_width < frame_width
+                                       else cv2.INTER_LINEAR)
+            cv2.imshow(display_window.window_name, display_frame)
+
+            # Slot is free again once it has been shown
+            free_slots.put(index)
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q') or key == 27:
+                break
+            elif key == ord('f'):
+                display_window.toggle_fullscreen()
+    finally:
+        stop_event.set()
+        cv2.destroyAllWindows()
+        ring.close()
+
+
+def probe_frame_shape(source, width, height):
+    """Frame size for the shared slots: real size for files, requested size for cameras"""
+    if isinstance(source, str) and not source.isdigit():
+        cap = cv2.VideoCapture(source)
+        ret, frame = cap.read()
+        cap.release()
+        if ret:
+            return frame.shape
+    return (height, width, 3)
+
+
+def run_pipeline(source=0, width=1280, height=720, num_slots=4, max_hands=1):
+    """
+    Run capture, detection, classification and rendering as four processes.
+
+    At most num_slots frames are in flight at once, which bounds per-frame
+    latency; when every slot is busy the capture stage drops the new frame.
+    """
+    ctx = mp.get_context("spawn")
+    frame_shape = probe_frame_shape(source, width, height)
+    ring = SharedFrameRing(frame_shape, num_slots)
+
+    free_slots = ctx.Queue()
+    for index in range(num_slots):
+        free_slots.put(index)
+    capture_q, detect_q, classify_q = (ctx.Queue(maxsize=num_slots + 1) for _ in STAGE_QUEUES)
+    stop_event = ctx.Event()
+    dropped = ctx.Value("i", 0)
+    spec = ring.spec()
+
+    processes = [
+        ctx.Process(target=capture_stage, name="capture",
+                    args=(source, spec, free_slots, capture_q, stop_event, dropped)),
+        ctx.Process(target=detect_stage, name="detect",
+                    args=(spec, capture_q, detect_q, stop_event, max_hands)),
+        ctx.Process(target=classify_stage, name="classify",
+                    args=(frame_shape, detect_q, classify_q, stop_event)),
+        ctx.Process(target=render_stage, name="render",
+                    args=(spec, classify_q, free_slots, (capture_q, detect_q, classify_q),
+                          stop_event, dropped)),
+    ]
+
+    print(f"Starting pipelined mode: {len(processes)} processes, {num_slots} shared frame slots "
+          f"of {frame_shape[1]}x{frame_shape[0]}")
+    for process in processes:
+        process.start()
+
+    try:
+        processes[-1].join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        for process in processes:
+            process.join(timeout=3.0)
+            if process.is_alive():
+                process.terminate()
+        ring.close()
+        print(f"Pipeline stopped, {dropped.value} frames dropped at capture")
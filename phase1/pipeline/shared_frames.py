@@ -0,0 +1,52 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedFrameRing:
+    """
+    Fixed set of frame slots in one shared memory block.
+
+    Every process attaches to the same block by name and gets zero-copy NumPy
+    views of the slots, so only the slot index has to travel through queues.
+    Slot ownership is handed around explicitly: the producer takes an index
+    from the free queue and the last consumer gives it back.
+    """
+
+    def __init__(self, shape, num_slots=4, name=None, dtype=np.uint8):
+        self.shape = tuple(shape)
+        self.num_slots = num_slots
+        self.dtype = np.dtype(dtype)
+        slot_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=slot_bytes * num_slots)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._buffer = np.ndarray((num_slots,) + self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def spec(self):
+        """Picklable description used to attach from another process"""
+        return {"shape": self.shape, "num_slots": self.num_slots,
+                "name": self.name, "dtype": self.dtype.str}
+
+    @classmethod
+    def attach(cls, spec):
+        return cls(spec["shape"], spec["num_slots"], name=spec["name"], dtype=spec["dtype"])
+
+    def slot(self, index):
+        """Zero-copy view of one frame slot"""
+        return self._buffer[index]
+
+    def close(self):
+        # Views must be dropped before the mapping can be closed
+        self._buffer = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
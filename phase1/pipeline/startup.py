@@ -0,0 +1,77 @@
+# Parallel component startup with readiness signals and phase timings.
+#
+# Opening the camera, building the MediaPipe graph (plus a warm-up
+# inference) and starting speech each take hundreds of milliseconds and do
+# not depend on each other, so each runs on its own thread. The main thread
+# meanwhile does work that must stay on it (creating the OpenCV window) and
+# then waits only for what the first frame needs.
+
+import threading
+import time
+
+
+class ParallelStartup:
+    """
+    start(name, factory) runs factory() on a thread of its own; wait(name)
+    blocks until it is ready and returns its result, re-raising its error.
+    mark(name) records a main-thread phase that ends now. All times are
+    seconds since the ParallelStartup was created.
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.timings = {}  # name -> (start, end)
+        self._ready = {}
+        self._results = {}
+        self._errors = {}
+        self._last_mark = 0.0
+
+    def now(self):
+        return time.perf_counter() - self.t0
+
+    def start(self, name, factory):
+        ready = self._ready[name] = threading.Event()
+
+        def run():
+            started = self.now()
+            try:
+                self._results[name] = factory()
+            except Exception as e:
+                self._errors[name] = e
+            self.timings[name] = (started, self.now())
+            ready.set()
+
+        threading.Thread(target=run, name=f"startup-{name}", daemon=True).start()
+
+    def is_ready(self, name):
+        return self._ready[name].is_set()
+
+    def wait(self, name, timeout=None):
+        """The component's result once ready; raises its startup error, or TimeoutError"""
+        if not self._ready[name].wait(timeout):
+            raise TimeoutError(f"{name} not ready after {timeout}s")
+        if name in self._errors:
+            raise self._errors[name]
+        return self._results[name]
+
+    def release(self, cleanups, timeout=None):
+        """
+        After a failed startup: wait for each named component and pass the
+        ones that came up to cleanups[name], so nothing is left running
+        """
+        for name, cleanup in cleanups.items():
+            if self._ready[name].wait(timeout) and name in self._results:
+                try:
+                    cleanup(self._results[name])
+                except Exception as e:
+                    print(f"Error releasing {name}: {e}")
+
+    def mark(self, name, since=None):
+        """Record a main-thread phase from since (default: the previous mark) to now"""
+        end = self.now()
+        self.timings[name] = (self._last_mark if since is None else since, end)
+        self._last_mark = end
+
+    def report(self):
+        phases = sorted(self.timings.items(), key=lambda item: item[1][1])
+        print("Startup: " + ", ".join(f"{name} {start:.2f}-{end:.2f}s" for name, (start, end) in phases))
@@ -0,0 +1,109 @@
+import multiprocessing as mp
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+
+BOUNDARY = "frame"
+
+
+def _stream_to(wfile, video_path, fps, jpeg_quality):
+    """Encode and send frames to one client at the native rate, looping the file"""
+    cap = cv2.VideoCapture(video_path)
+    interval = 1.0 / fps
+    next_due = time.time()
+    params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+
+    try:
+        read_since_rewind = False
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                if not read_since_rewind:
+                    # Missing, unreadable or empty file: rewinding would spin forever
+                    print(f"Stream stand-in: no frames in {video_path}, closing the stream")
+                    return
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                read_since_rewind = False
+                continue
+            read_since_rewind = True
+
+            ok, jpeg = cv2.imencode(".jpg", frame, params)
+            if not ok:
+                continue
+            data = jpeg.tobytes()
+            wfile.write(f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(data)}\r\n\r\n".encode())
+            wfile.write(data)
+            wfile.write(b"\r\n")
+
+            next_due += interval
+            delay = next_due - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_due = time.time()
+    finally:
+        cap.release()
+
+
+def _serve(video_path, host, port, jpeg_quality, address_q):
+    fps = cv2.VideoCapture(video_path).get(cv2.CAP_PROP_FPS) or 30.0
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", f"multipart/x-mixed-replace;boundary={BOUNDARY}")
+            self.end_headers()
+            try:
+                _stream_to(self.wfile, video_path, fps, jpeg_quality)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    address_q.put(httpd.server_address[:2])
+    httpd.serve_forever()
+
+
+class LocalStreamServer:
+    """
+    Serves a video file as a looping MJPEG-over-HTTP stream at its native rate.
+
+    Stands in for an IP camera / RTSP feed so the multi-stream runner can be
+    exercised with network sources on one machine:
+        server = LocalStreamServer("clip.mp4").start()
+        cv2.VideoCapture(server.url)
+
+    The server runs in its own process: cv2.VideoCapture holds the GIL while
+    FFmpeg opens a URL, so an in-process server could never answer it.
+    """
+
+    def __init__(self, video_path, port=0, host="127.0.0.1", jpeg_quality=80):
+        self.video_path = video_path
+        self.host = host
+        self.port = port
+        self.jpeg_quality = jpeg_quality
+        self._process = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/stream.mjpg"
+
+    def start(self):
+        ctx = mp.get_context("spawn")
+        address_q = ctx.Queue()
+        self._process = ctx.Process(
+            target=_serve, name="stream-standin", daemon=True,
+            args=(self.video_path, self.host, self.port, self.jpeg_quality, address_q))
+        self._process.start()
+        self.host, self.port = address_q.get(timeout=10)
+        return self
+
+    def stop(self):
+        if self._process and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=2.0)
@@ -0,0 +1,35 @@
+# Headless offline mode: run hand detection + gesture classification over a
+# video file as fast as possible and write per-frame results to JSONL or NPZ.
+# Used for regression runs and capacity planning.
+#
+#   python process_video.py clip.mp4 -o clip_results.npz
+
+import argparse
+
+from offline.results_io import default_output_path, open_result_writer
+from offline.video_processor import process_video
+
+def main():
+    parser = argparse.ArgumentParser(description="Process a video file without a window or TTS")
+    parser.add_argument("video", help="Input video file")
+    parser.add_argument("-o", "--output", help="Output .jsonl or .npz (default: <video>_results.jsonl)")
+    parser.add_argument("--max-hands", type=int, default=2)
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--model", help="Learned classifier from train_classifier.py (default: finger rules)")
+    args = parser.parse_args()
+
+    output = args.output or default_output_path(args.video)
+    writer = open_result_writer(output, max_hands=args.max_hands)
+
+    print(f"Processing {args.video} -> {output}")
+    summary = process_video(args.video, writer, max_hands=args.max_hands, max_frames=args.max_frames,
+                            model_path=args.model)
+
+    print(f"Frames: {summary['frames']} ({summary['frames_with_hands']} with hands)")
+    print(f"Elapsed: {summary['elapsed_s']:.2f}s -> {summary['fps']:.1f} frames/sec "
+          f"(video is {summary['video_fps']:.1f} FPS)")
+    print(f"Per frame: decode {summary['decode_ms']:.2f}ms | detect {summary['detect_ms']:.2f}ms | "
+          f"classify+write {summary['classify_ms']:.2f}ms")
+
+if __name__ == "__main__":
+    main()
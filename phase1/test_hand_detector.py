@@ -6,7 +6,6 @@ import cv2
 import mediapipe as mp
 import numpy as np
 from hand_detection.detector import HandDetector
-from hand_detection.landmark_utils import extract_landmarks
 
 def main():
     cap = cv2.VideoCapture(0)
@@ -46,9 +45,9 @@ def main():
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
 
         # Process each hand
-        for hand_idx, hand in enumerate(hands):
-            # Extract landmarks
-            lm_list = extract_landmarks(hand, frame.shape)
+        for hand_idx in range(len(hands)):
+            # Pixel coordinates for every hand are computed once per frame
+            lm_list = hands.pixel_list(hand_idx)
             
             # Draw hand label (Left/Right)
             if hand_idx == 0:
@@ -142,8 +141,8 @@ def main():
             # Print landmark data to console
             if hands:
                 print(f"\n📊 Frame {frame_count} - Landmark Data:")
-                for hand_idx, hand in enumerate(hands):
-                    lm_list = extract_landmarks(hand, frame.shape)
+                for hand_idx in range(len(hands)):
+                    lm_list = hands.pixel_list(hand_idx)
                     print(f"  Hand {hand_idx + 1} - 21 Landmarks:")
                     for i, (x, y) in enumerate(lm_list):
                         print(f"    {i:2d}: ({x:4d}, {y:4d})")
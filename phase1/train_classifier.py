@@ -0,0 +1,55 @@
+# Train the learned k-NN gesture classifier from recorded landmark results.
+# Record one clip per gesture, run process_video.py on each, then:
+#
+#   python train_classifier.py FIST=fist_results.npz OPEN_HAND=open_results.npz ...
+#
+# A results file without LABEL= uses the labels recorded in it (raw_gesture).
+# Writes models/gesture_knn.npy (memory-mapped at load) + gesture_knn.json;
+# enable it with GestureClassifier(model_path=...).
+
+import argparse
+import os
+
+import numpy as np
+
+from hand_detection.gesture_classifier import GestureClassifier
+from hand_detection.learned_classifier import DEFAULT_MODEL_PATH, KnnGestureModel, landmark_features
+from offline.training import load_labeled_hands, split_holdout
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the k-NN gesture classifier")
+    parser.add_argument("datasets", nargs="+", help="LABEL=results.npz|jsonl, or results file with recorded labels")
+    parser.add_argument("-o", "--output", default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--prototypes", type=int, default=32, help="Prototypes per gesture (k-means)")
+    parser.add_argument("-k", type=int, default=5, help="Neighbours that vote")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of hands kept for the accuracy check")
+    parser.add_argument("--width", type=int, default=1280, help="Frame size the results were recorded at")
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    landmarks, labels = load_labeled_hands(args.datasets)
+    if not len(landmarks):
+        print("No labeled hands found")
+        return
+    frame_shape = (args.height, args.width)
+    features = landmark_features(landmarks, frame_shape)
+
+    train, test = split_holdout(len(features), args.holdout)
+    model = KnnGestureModel.train(features[train], labels[train], args.prototypes, args.k)
+    print(f"{len(train)} training hands -> {len(model.prototypes)} prototypes for {len(model.classes)} gestures, "
+          f"UNKNOWN beyond distance {model.max_distance:.3f}")
+
+    if len(test):
+        learned = model.classify(landmarks[test], frame_shape)
+        rules = GestureClassifier().recognize_batch(landmarks[test], frame_shape)
+        print(f"Holdout accuracy on {len(test)} hands: learned {np.mean(learned == labels[test]) * 100:.1f}%, "
+              f"rule-based {np.mean(rules == labels[test]) * 100:.1f}%")
+
+    # Final model uses every hand
+    model = KnnGestureModel.train(features, labels, args.prototypes, args.k)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    model.save(args.output)
+    print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
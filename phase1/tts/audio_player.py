@@ -0,0 +1,143 @@
+# Non-blocking WAV playback on one long-lived thread.
+#
+# Backends, best first: simpleaudio (optional, pip install simpleaudio; keeps
+# decoded clips in memory), winsound on Windows, a command line player
+# (afplay / paplay / aplay), or "null", which only waits out the clip's
+# length so the rest of the app behaves the same on a box without audio.
+
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from collections import OrderedDict
+
+PLAYER_COMMANDS = (("afplay",), ("paplay",), ("aplay", "-q"))
+
+
+def wav_duration(path):
+    """Length of a WAV file in seconds"""
+    with wave.open(path, "rb") as f:
+        return f.getnframes() / float(f.getframerate())
+
+
+def pick_backend():
+    try:
+        import simpleaudio  # noqa: F401
+        return "simpleaudio"
+    except ImportError:
+        pass
+    if platform.system() == "Windows":
+        return "winsound"
+    if any(shutil.which(command[0]) for command in PLAYER_COMMANDS):
+        return "command"
+    return "null"
+
+
+class AudioPlayer:
+    """
+    play() queues a WAV file and returns at once; clips play one after
+    another on the player thread. on_start(time) is called with
+    time.monotonic() when a clip actually starts, on_done(completed) when it
+    ends, was cut off (False) or failed to start (False).
+    """
+
+    def __init__(self, backend=None, max_loaded=64):
+        self.backend = backend or pick_backend()
+        self.max_loaded = max_loaded  # simpleaudio clips kept decoded in memory
+        self._loaded = OrderedDict()
+        self._command = next((c for c in PLAYER_COMMANDS if shutil.which(c[0])), None)
+        self._queue = queue.Queue()
+        self._interrupt = threading.Event()
+        self.is_playing = False
+        self.played = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"Audio player backend: {self.backend}")
+
+    def play(self, path, on_start=None, on_done=None, interrupt=False):
+        """Queue a clip; interrupt=True drops queued clips and cuts the current one"""
+        if interrupt:
+            self.stop()
+        self._queue.put((path, on_start, on_done))
+
+    def stop(self):
+        """Drop queued clips and stop the one playing"""
+        try:
+            while True:
+                item = self._queue.get_nowait()
+                if item is None:
+                    self._queue.put(None)
+                    break
+                if item[2]:
+                    item[2](False)
+        except queue.Empty:
+            pass
+        # Cleared when the next clip is taken, so this only cuts what is playing now
+        self._interrupt.set()
+
+    def _wave_object(self, path):
+        import simpleaudio
+
+        key = (path, os.path.getmtime(path))
+        if key in self._loaded:
+            self._loaded.move_to_end(key)
+        else:
+            self._loaded[key] = simpleaudio.WaveObject.from_wave_file(path)
+            if len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return self._loaded[key]
+
+    def _start(self, path):
+        """Start playback; returns (is_done, stop) callables"""
+        if self.backend == "simpleaudio":
+            playback = self._wave_object(path).play()
+            return (lambda: not playback.is_playing()), playback.stop
+        if self.backend == "command":
+            process = subprocess.Popen(self._command + (path,), stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+            return (lambda: process.poll() is not None), process.terminate
+
+        end = time.monotonic() + wav_duration(path)
+        if self.backend == "winsound":
+            import winsound
+
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            return (lambda: time.monotonic() >= end), (lambda: winsound.PlaySound(None, 0))
+        return (lambda: time.monotonic() >= end), (lambda: None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            path, on_start, on_done = item
+            self._interrupt.clear()
+            try:
+                is_done, stop = self._start(path)
+            except Exception as e:
+                print(f"Audio playback failed for {path}: {e}")
+                if on_done:
+                    on_done(False)
+                continue
+            self.is_playing = True
+            self.played += 1
+            if on_start:
+                on_start(time.monotonic())
+            completed = True
+            while not is_done():
+                if self._interrupt.wait(0.005):
+                    stop()
+                    completed = False
+                    break
+            self.is_playing = False
+            if on_done:
+                on_done(completed)
+
+    def close(self):
+        self.stop()
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
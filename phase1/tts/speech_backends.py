@@ -0,0 +1,137 @@
+# Speech backends behind one small interface, so the speech path can run
+# and be measured without sound hardware.
+#
+#   say(text, on_start, should_stop) -> completed  blocks for the utterance;
+#       on_start() when audio starts, should_stop() polled between words
+#   save_to_file(text, path)                       synthesize into a WAV file
+#   close()
+#
+# "pyttsx3" speaks for real, "null" only sleeps for a simulated synthesis
+# time and the utterance's length, and "file" writes every utterance to a
+# WAV file in a directory instead of playing it (from "null" by default, or
+# from "pyttsx3" on a box with a speech engine but no sound card).
+
+import os
+import tempfile
+import time
+import wave
+
+
+def create_engine(rate=180, volume=0.9, voice=None):
+    """pyttsx3 engine with the app's rate and volume; voice id, or the first voice"""
+    import pyttsx3
+
+    engine = pyttsx3.init()
+    engine.setProperty('rate', rate)
+    engine.setProperty('volume', volume)
+    if voice is None:
+        voices = engine.getProperty('voices')
+        voice = voices[0].id if voices else None
+    if voice is not None:
+        engine.setProperty('voice', voice)
+    return engine
+
+
+def speech_duration(text, rate=180):
+    """Rough length in seconds of text spoken at rate words per minute"""
+    return max(len(text.split()), 1) * 60.0 / rate
+
+
+class Pyttsx3Backend:
+    name = "pyttsx3"
+
+    def __init__(self, rate=180, volume=0.9, voice=None):
+        self.engine = create_engine(rate, volume, voice)
+        self._on_start = None
+        self._should_stop = None
+        self._stopped = False
+        self.engine.connect('started-utterance', lambda name: self._on_start and self._on_start())
+        self.engine.connect('started-word', self._on_word)
+
+    def _on_word(self, name, location, length):
+        if self._should_stop is not None and self._should_stop():
+            self._stopped = True
+            self.engine.stop()
+
+    def say(self, text, on_start=None, should_stop=None):
+        self._on_start, self._should_stop, self._stopped = on_start, should_stop, False
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            self._on_start = self._should_stop = None
+        return not self._stopped
+
+    def save_to_file(self, text, path):
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+
+    def close(self):
+        self.engine.stop()
+
+
+class NullBackend:
+    """No audio: sleeps synth_time before 'audio' starts, then for the utterance's length"""
+    name = "null"
+
+    def __init__(self, rate=180, volume=0.9, voice=None, synth_time=0.05, sample_rate=22050):
+        self.rate = rate
+        self.synth_time = synth_time
+        self.sample_rate = sample_rate
+
+    def say(self, text, on_start=None, should_stop=None):
+        time.sleep(self.synth_time)
+        if on_start:
+            on_start()
+        end = time.monotonic() + speech_duration(text, self.rate)
+        while time.monotonic() < end:
+            if should_stop is not None and should_stop():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def save_to_file(self, text, path):
+        """Silent WAV as long as the utterance would be"""
+        time.sleep(self.synth_time)
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(b"\0\0" * int(self.sample_rate * speech_duration(text, self.rate)))
+
+    def close(self):
+        pass
+
+
+class FileSinkBackend:
+    """Writes each utterance to directory/NNNNN.wav; 'audio' starts when the file is on disk"""
+    name = "file"
+
+    def __init__(self, rate=180, volume=0.9, voice=None, directory=None, source="null", **source_options):
+        self.directory = directory or tempfile.mkdtemp(prefix="speech_sink_")
+        os.makedirs(self.directory, exist_ok=True)
+        self.source = create_backend(source, rate, volume, voice, **source_options)
+        self.written = 0
+
+    def say(self, text, on_start=None, should_stop=None):
+        self.written += 1
+        self.source.save_to_file(text, os.path.join(self.directory, f"{os.getpid()}_{self.written:05d}.wav"))
+        if on_start:
+            on_start()
+        return True
+
+    def save_to_file(self, text, path):
+        self.source.save_to_file(text, path)
+
+    def close(self):
+        self.source.close()
+
+
+BACKENDS = {backend.name: backend for backend in (Pyttsx3Backend, NullBackend, FileSinkBackend)}
+
+
+def create_backend(name="pyttsx3", rate=180, volume=0.9, voice=None, **options):
+    """Backend by name; options go to its constructor (e.g. synth_time=0.2 for "null")"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown speech backend '{name}', choose from {', '.join(BACKENDS)}")
+    return BACKENDS[name](rate, volume, voice, **options)
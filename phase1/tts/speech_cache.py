@@ -0,0 +1,142 @@
+# Synthesized phrases cached as WAV files on disk.
+#
+# Files are named by a hash of (text, voice, rate, volume), so a settings
+# change never plays stale audio and the cache survives restarts: a warm
+# start finds every gesture phrase on disk and synthesizes nothing. File
+# modification times double as the LRU order (a hit touches the file), and
+# the oldest files are removed once the cache grows past max_bytes.
+# Rendering runs in a small process pool, one pyttsx3 engine per process.
+
+import hashlib
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "speech")
+
+_render_engine = None
+
+
+def _init_renderer(rate, volume, voice, backend, backend_options):
+    global _render_engine
+    from tts.speech_backends import create_backend
+
+    _render_engine = create_backend(backend, rate, volume, voice, **backend_options)
+
+
+def _render_task(text, path):
+    render_to_file(_render_engine, text, path)
+    return path
+
+
+def render_to_file(engine, text, path):
+    """Synthesize text into a WAV file with a speech backend; the file appears atomically or not at all"""
+    temp_path = f"{os.path.splitext(path)[0]}.{os.getpid()}.tmp.wav"
+    engine.save_to_file(text, temp_path)
+    if not os.path.exists(temp_path) or not os.path.getsize(temp_path):
+        raise RuntimeError(f"engine wrote no audio for '{text}'")
+    os.replace(temp_path, path)
+
+
+class SpeechCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=50 * 2**20, rate=180, volume=0.9, voice=None,
+                 render_workers=2, backend="pyttsx3", backend_options=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.rate = rate
+        self.volume = volume
+        self.voice = voice  # voice id, None = the engine's first voice
+        self.render_workers = render_workers
+        self.backend = backend  # tts.speech_backends name
+        self.backend_options = dict(backend_options or {})
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.rendered = 0
+        self.evicted = 0
+        self._pool = None
+        self._pending = {}
+
+    def path_for(self, text):
+        settings = f"{self.voice or 'default'}|{self.rate}|{self.volume:.3f}|{text}"
+        if self.backend != "pyttsx3":
+            settings = f"{self.backend}|{settings}"
+        return os.path.join(self.cache_dir, hashlib.sha1(settings.encode("utf-8")).hexdigest() + ".wav")
+
+    def get(self, text):
+        """Path of the cached WAV for text, or None"""
+        path = self.path_for(text)
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def render_async(self, texts):
+        """Synthesize texts missing from the cache in the background; returns the number queued"""
+        queued = 0
+        for text in dict.fromkeys(t for t in texts if t and t.strip()):
+            path = self.path_for(text)
+            if path in self._pending or os.path.exists(path):
+                continue
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.render_workers, mp_context=mp.get_context("spawn"),
+                    initializer=_init_renderer, initargs=(self.rate, self.volume, self.voice, self.backend, self.backend_options))
+            future = self._pool.submit(_render_task, text, path)
+            future.add_done_callback(lambda f, path=path: self._on_rendered(f, path))
+            self._pending[path] = future
+            queued += 1
+        return queued
+
+    def prewarm(self, texts):
+        """Render every phrase that is not cached yet (e.g. all of GESTURE_TO_TEXT) at startup"""
+        queued = self.render_async(texts)
+        if queued:
+            print(f"Speech cache: rendering {queued} phrases in the background")
+        else:
+            print("Speech cache: all phrases cached")
+        return queued
+
+    def wait(self, timeout=None):
+        """Block until queued renders finish (benchmarks, tests)"""
+        for future in list(self._pending.values()):
+            try:
+                future.result(timeout)
+            except Exception:
+                pass
+
+    def _on_rendered(self, future, path):
+        self._pending.pop(path, None)
+        error = future.exception()
+        if error is not None:
+            print(f"Speech cache: render failed: {error}")
+            return
+        self.rendered += 1
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used files until the cache fits in max_bytes"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".wav") and ".tmp." not in entry.name:
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,115 @@
+# Decides what gets spoken next. Requests wait in one slot per priority
+# where the newest replaces older ones (latest wins), so a backlog can never
+# build up and what is spoken is always the most recent gesture. The same
+# phrase is not repeated within its dedup window, and a different phrase of
+# equal or higher priority may cut off the one being spoken. Counters show
+# how much speech latency is queueing as opposed to synthesis.
+
+import threading
+import time
+from collections import deque
+
+
+class SpeechRequest:
+    __slots__ = ("request_id", "text", "priority", "enqueued_at", "dispatched_at")
+
+    def __init__(self, request_id, text, priority, enqueued_at):
+        self.request_id = request_id
+        self.text = text
+        self.priority = priority
+        self.enqueued_at = enqueued_at
+        self.dispatched_at = None
+
+
+class SpeechScheduler:
+    """
+    Thread-safe. submit() returns True when the caller should interrupt the
+    utterance in progress; next() hands out the request to speak now and
+    finished() closes it. Times are time.monotonic() unless given.
+    """
+
+    def __init__(self, dedup_window=1.5, phrase_windows=None, preempt=True):
+        self.dedup_window = dedup_window          # seconds before the same phrase may be spoken again
+        self.phrase_windows = dict(phrase_windows or {})  # per-phrase overrides of dedup_window
+        self.preempt = preempt
+        self.counts = {"enqueued": 0, "coalesced": 0, "dropped": 0, "preempted": 0, "spoken": 0,
+                       "interrupted": 0, "failed": 0}
+        self.wait_times = deque(maxlen=200)       # seconds from submit to dispatch
+        self.current = None
+        self._pending = {}                        # priority -> newest request
+        self._last_started = {}                   # phrase -> time it last started
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _recently_spoken(self, text, now):
+        started = self._last_started.get(text)
+        window = self.phrase_windows.get(text, self.dedup_window)
+        return started is not None and now - started < window
+
+    def submit(self, text, priority=0, now=None):
+        """Queue text; returns True if the current utterance should be interrupted for it"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if (self.current is not None and self.current.text == text) or self._recently_spoken(text, now):
+                self.counts["dropped"] += 1
+                return False
+
+            self._next_id += 1
+            self.counts["enqueued"] += 1
+            request = SpeechRequest(self._next_id, text, priority, now)
+            # Latest wins: the new request replaces everything pending at its priority or below
+            for level in [p for p in self._pending if p <= priority]:
+                replaced = self._pending.pop(level)
+                self.counts["coalesced"] += 1
+                if replaced.text == text:
+                    request.enqueued_at = replaced.enqueued_at  # the wait started with the first copy
+            self._pending[priority] = request
+
+            interrupt = (self.preempt and self.current is not None
+                         and priority >= self.current.priority)
+            if interrupt:
+                self.counts["preempted"] += 1
+            return interrupt
+
+    def peek(self):
+        """The request next() would hand out, left in place"""
+        with self._lock:
+            if self.current is not None or not self._pending:
+                return None
+            return self._pending[max(self._pending)]
+
+    def next(self, now=None):
+        """The request to speak now, or None while one is in progress or nothing waits"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.current is not None or not self._pending:
+                return None
+            request = self._pending.pop(max(self._pending))
+            request.dispatched_at = now
+            self.wait_times.append(now - request.enqueued_at)
+            self._last_started[request.text] = now
+            self.current = request
+            return request
+
+    def finished(self, request_id, outcome="spoken"):
+        """Close the current request; outcome is spoken (played to the end), interrupted or failed"""
+        with self._lock:
+            if self.current is None or self.current.request_id != request_id:
+                return
+            self.counts[outcome] += 1
+            self.current = None
+
+    def clear(self):
+        with self._lock:
+            self.counts["dropped"] += len(self._pending)
+            self._pending.clear()
+
+    def get_stats(self):
+        """Counters plus queue wait (ms) over the last 200 dispatched requests"""
+        with self._lock:
+            waits = sorted(self.wait_times)
+            stats = dict(self.counts, pending=len(self._pending))
+        if waits:
+            stats["queue_wait_ms"] = sum(waits) / len(waits) * 1000
+            stats["queue_wait_p95_ms"] = waits[round(0.95 * (len(waits) - 1))] * 1000
+        return stats
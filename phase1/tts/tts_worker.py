@@ -0,0 +1,273 @@
+# Text-to-speech in its own process with one warm speech engine.
+#
+# pyttsx3.init(), voice lookup and property setup cost hundreds of
+# milliseconds; the worker pays them once at startup instead of before every
+# utterance. The main process only puts commands on a queue, so speak()
+# never blocks the camera loop, and a watchdog thread restarts the worker
+# when an utterance hangs or the process dies. Running the engine in a process
+# of its own also gives it a main thread, which some pyttsx3 drivers want.
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import deque
+
+from tts.audio_player import AudioPlayer
+from tts.speech_backends import create_backend
+from tts.speech_scheduler import SpeechScheduler
+
+
+def tts_worker(command_q, event_q, interrupt, rate, volume, voice, backend="pyttsx3", backend_options=None):
+    """
+    Worker process: one speech backend for its whole life, one utterance at a
+    time. Commands are (request_id, text) or None to exit; events are
+    (kind, request_id, info, time). Setting interrupt cuts the current
+    utterance off at the next word. Only the parent clears it, before it
+    sends the next command: a preempt set before this utterance was even
+    received still applies to it.
+    """
+    start = time.monotonic()
+    try:
+        engine = create_backend(backend, rate, volume, voice, **(backend_options or {}))
+    except Exception as e:
+        event_q.put(("failed", None, repr(e), time.monotonic()))
+        return
+    event_q.put(("ready", None, time.monotonic() - start, time.monotonic()))
+
+    while True:
+        command = command_q.get()
+        if command is None:
+            break
+        request_id, text = command
+        event_q.put(("speaking", request_id, text, time.monotonic()))
+        try:
+            completed = engine.say(text, lambda: event_q.put(("started", request_id, None, time.monotonic())),
+                                   interrupt.is_set)
+        except Exception as e:
+            event_q.put(("error", request_id, repr(e), time.monotonic()))
+            continue
+        event_q.put(("finished", request_id, not completed, time.monotonic()))  # info: interrupted
+    engine.close()
+
+
+class TTSWorkerEngine:
+    """
+    Drop-in replacement for BulletproofTTSEngine (speak/stop) backed by a
+    persistent worker process. A SpeechScheduler decides what is spoken and
+    when; one utterance is out at a time, from the speech cache when it has
+    the phrase, else from the worker. get_stats() splits latency into
+    queue wait (speak() to dispatch) and synthesis (dispatch to audio start),
+    plus time to first audio overall and restart counts.
+    """
+
+    def __init__(self, rate=180, volume=0.9, hang_timeout=10.0, startup_timeout=15.0,
+                 speech_cache=None, player=None, scheduler=None, backend="pyttsx3", backend_options=None,
+                 history=200):
+        print("Starting TTS worker process...")
+        # With a SpeechCache, cached phrases play straight from disk and misses are rendered for next time
+        self.speech_cache = speech_cache
+        if speech_cache is not None:
+            rate, volume, self.voice = speech_cache.rate, speech_cache.volume, speech_cache.voice
+            backend, backend_options = speech_cache.backend, speech_cache.backend_options
+            if player is None:
+                player = AudioPlayer()
+        else:
+            self.voice = None
+        self.player = player
+        self.scheduler = scheduler or SpeechScheduler()
+        self.rate = rate
+        self.volume = volume
+        self.backend = backend                  # tts.speech_backends name: "pyttsx3", "null" or "file"
+        self.backend_options = dict(backend_options or {})
+        self.hang_timeout = hang_timeout        # an utterance longer than this counts as hung
+        self.startup_timeout = startup_timeout  # engine init longer than this counts as hung
+
+        self.is_running = True
+        self.available = True
+        self.restarts = 0
+        self.cached = 0
+        self.init_time = None
+        self.first_audio = deque(maxlen=history)  # seconds from speak() to audio start
+        self.synthesis = deque(maxlen=history)    # seconds from dispatch to audio start
+        self._current = None                  # request being spoken and where ("worker" / "player")
+        self._speaking_since = None
+        self._lock = threading.RLock()
+
+        self._ctx = mp.get_context("spawn")
+        self._start_worker()
+        self._watchdog = threading.Thread(target=self._watch, daemon=True)
+        self._watchdog.start()
+
+    def _start_worker(self):
+        # Fresh queues: a killed worker may have left the old ones half written
+        self._command_q = self._ctx.Queue()
+        self._event_q = self._ctx.Queue()
+        self._interrupt = self._ctx.Event()
+        self._process = self._ctx.Process(
+            target=tts_worker, name="tts-worker", daemon=True,
+            args=(self._command_q, self._event_q, self._interrupt, self.rate, self.volume, self.voice,
+                  self.backend, self.backend_options))
+        self._process.start()
+        self._launched_at = time.monotonic()
+        self._ready = False
+        self._speaking_since = None
+
+    def _restart(self, reason):
+        print(f"TTS worker {reason}, restarting")
+        self.restarts += 1
+        self._process.kill()
+        self._process.join(timeout=2.0)
+        with self._lock:
+            self._ready = False
+            # The utterance in the dead worker is lost
+            if self._current is not None and self._current[1] == "worker":
+                self._finish(self._current[0].request_id, "failed")
+            self._start_worker()
+
+    def _dispatch(self):
+        """Send the next scheduled request to the player or the worker if nothing is speaking"""
+        with self._lock:
+            if self._current is not None:
+                return
+            while True:
+                request = self.scheduler.peek()
+                if request is None:
+                    return
+                path = self.speech_cache.get(request.text) if self.speech_cache else None
+                if path is None and self.available and not self._ready:
+                    return  # wait for the worker; its "ready" event dispatches again
+                request = self.scheduler.next()
+                if path is not None or self.available:
+                    break
+                # Not cached and no engine: nothing can speak it
+                self.scheduler.finished(request.request_id, "failed")
+
+            if path is not None:
+                self._current = (request, "player")
+                self.cached += 1
+                started = []
+                print(f"PLAYING cached speech: '{request.text}'")
+                self.player.play(
+                    path, lambda started_at: started.append(self._on_audio_start(request, started_at)),
+                    # A clip cut off by a newer phrase was interrupted, one that never started failed
+                    lambda completed: self._finish(request.request_id, "spoken" if completed
+                                                   else "interrupted" if started else "failed"))
+            else:
+                self._current = (request, "worker")
+                if self.speech_cache:
+                    # Spoken live this time, from the cache next time
+                    self.speech_cache.render_async([request.text])
+                print(f"SPEAKING: '{request.text}'")
+                # A preempt of the previous utterance must not carry over; one of this
+                # request from here on is kept even if the worker has not received it yet
+                self._interrupt.clear()
+                self._command_q.put((str(request.request_id), request.text))
+
+    def _on_audio_start(self, request, started_at):
+        with self._lock:
+            self.first_audio.append(started_at - request.enqueued_at)
+            self.synthesis.append(started_at - request.dispatched_at)
+
+    def _finish(self, request_id, outcome="spoken"):
+        with self._lock:
+            if self._current is not None and self._current[0].request_id == request_id:
+                self._current = None
+                self._speaking_since = None
+            self.scheduler.finished(request_id, outcome)
+        self._dispatch()
+
+    def _handle_event(self, kind, request_id, info, event_time):
+        with self._lock:
+            request = self._current[0] if self._current and self._current[1] == "worker" else None
+            if request is not None and request_id != str(request.request_id):
+                request = None
+            if kind == "ready":
+                self._ready = True
+                self.init_time = info
+                print(f"TTS worker ready (engine init {info * 1000:.0f} ms)")
+            elif kind == "failed":
+                self.available = False
+                print(f"TTS worker could not create an engine: {info}")
+            elif kind == "speaking":
+                self._speaking_since = event_time
+            elif kind == "started" and request is not None:
+                self._on_audio_start(request, event_time)
+            elif kind == "finished" and request is not None:
+                # info: the worker cut the utterance short
+                self._finish(request.request_id, "interrupted" if info else "spoken")
+            elif kind == "error" and request is not None:
+                print(f"Speech failed: {info}")
+                self._finish(request.request_id, "failed")
+        if kind == "ready":
+            self._dispatch()
+
+    def _watch(self):
+        """Watchdog thread: collects worker events, restarts a hung or dead worker"""
+        while self.is_running and self.available:
+            try:
+                self._handle_event(*self._event_q.get(timeout=0.2))
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                pass
+            if not self.is_running or not self.available:
+                break
+
+            now = time.monotonic()
+            if self._speaking_since is not None and now - self._speaking_since > self.hang_timeout:
+                self._restart("hung while speaking")
+            elif not self._ready and now - self._launched_at > self.startup_timeout:
+                self._restart("hung during startup")
+            elif not self._process.is_alive():
+                self._restart(f"exited (code {self._process.exitcode})")
+
+    def speak(self, text, priority=0):
+        """Hand text to the scheduler; never blocks"""
+        if not text or not text.strip():
+            return
+        print(f"QUEUING Speech: '{text}'")
+        if self.scheduler.submit(text, priority):
+            self._interrupt_current()
+        self._dispatch()
+
+    def _interrupt_current(self):
+        with self._lock:
+            if self._current is None:
+                return
+            if self._current[1] == "player":
+                self.player.stop()
+            else:
+                self._interrupt.set()
+
+    def get_stats(self):
+        """Scheduler counters plus latency split (ms) over the last history utterances"""
+        stats = self.scheduler.get_stats()
+        with self._lock:
+            stats.update(cached=self.cached, restarts=self.restarts,
+                         init_ms=self.init_time * 1000 if self.init_time is not None else None)
+            for name, samples in (("first_audio", self.first_audio), ("synthesis", self.synthesis)):
+                samples = sorted(samples)
+                if samples:
+                    stats[f"{name}_ms"] = sum(samples) / len(samples) * 1000
+                    stats[f"{name}_p95_ms"] = samples[round(0.95 * (len(samples) - 1))] * 1000
+        return stats
+
+    def stop(self):
+        """Clean shutdown"""
+        print("Stopping TTS worker...")
+        self.is_running = False
+        self.scheduler.clear()
+        try:
+            self._command_q.put(None)
+        except (ValueError, OSError):
+            pass
+        self._process.join(timeout=2.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._watchdog.join(timeout=1.0)
+        if self.player is not None:
+            self.player.close()
+        if self.speech_cache is not None:
+            self.speech_cache.close()
+        print(f"TTS worker stopped: {self.get_stats()}")